@@ -1,34 +1,56 @@
-from flask import Flask, jsonify, request, send_file
+from flask import Flask, Response, jsonify, request, send_file
 from flask_cors import CORS
 from config import Config
-import os
 import uuid
+import json
+import zipfile
 from datetime import datetime
+from io import BytesIO
 from werkzeug.utils import secure_filename
 
 # Import services
 from services.resume_parser import ResumeParser
-from services.job_analyzer import JobAnalyzer
-from services.gap_analyzer import GapAnalyzer
-from services.ats_scanner import ATSScanner
-from services.resume_optimizer import ResumeOptimizer
+from services.analysis_pipeline import AnalysisPipeline
 from services.docx_generator import DocxGenerator
+from services.job_analysis_cache import get_job_analysis_cache
+from services.resume_cache import get_resume_cache
+from services.response_cache import get_response_cache
+from services.single_flight import SingleFlight
+from services.analysis_jobs import get_analysis_job_manager
+from services.resume_optimizer import ResumeOptimizer
+from services.batch_analyzer import BatchAnalyzer, get_compare_executor
+from services.claude_service import ClaudeService
+from services.relevance_ranker import RelevanceRanker
+from services.retry_policy import Deadline, DeadlineExceededError
+from services.circuit_breaker import CircuitOpenError, get_circuit_breaker
 
 # Import utilities
 from utils.validators import Validators
-
-# Import models
-from models.analysis_models import CompleteAnalysisResult
+from utils.uploads import InMemoryUploadRequest
 
 # Initialize Flask app
 app = Flask(__name__)
 app.config.from_object(Config)
 
+# Keep uploads in memory and cap the whole request body while it streams in
+app.request_class = InMemoryUploadRequest
+app.config['MAX_CONTENT_LENGTH'] = Config.MAX_REQUEST_SIZE
+
 # Configure CORS
 CORS(app, resources={r"/api/*": {"origins": Config.CORS_ORIGINS}})
 
-# Ensure upload folder exists
-os.makedirs(Config.UPLOAD_FOLDER, exist_ok=True)
+# Coalesces duplicate submissions of the same resume/job description
+analysis_flight = SingleFlight(lock_dir=Config.SINGLE_FLIGHT_LOCK_DIR or None)
+
+
+@app.before_request
+def parse_uploads():
+    """
+    Read multipart bodies before the view runs, so a request over
+    MAX_REQUEST_SIZE is rejected with 413 rather than a view's error handler
+    """
+    if request.mimetype == 'multipart/form-data':
+        request.form
 
 
 @app.route('/api/health', methods=['GET'])
@@ -37,10 +59,12 @@ def health_check():
     try:
         # Check if Claude API key is configured
         claude_configured = bool(Config.CLAUDE_API_KEY)
+        breaker = get_circuit_breaker()
 
         return jsonify({
             'status': 'healthy',
             'claude_api': 'configured' if claude_configured else 'not_configured',
+            'circuit_breaker': breaker.stats() if breaker else {'state': 'disabled'},
             'environment': Config.FLASK_ENV
         }), 200
     except Exception as e:
@@ -50,6 +74,106 @@ def health_check():
         }), 500
 
 
+@app.route('/api/cache/stats', methods=['GET'])
+def cache_stats():
+    """Report hit/miss counters for the result caches"""
+    job_cache = get_job_analysis_cache()
+    resume_cache = get_resume_cache()
+    response_cache = get_response_cache()
+
+    return jsonify({
+        'success': True,
+        'job_analysis': job_cache.stats() if job_cache else {'enabled': False},
+        'resumes': resume_cache.stats() if resume_cache else {'enabled': False},
+        'responses': response_cache.stats() if response_cache else {'enabled': False}
+    }), 200
+
+
+def _parse_resume_upload(file):
+    """
+    Validate and parse an uploaded resume file
+
+    Args:
+        file: FileStorage object from Flask request
+
+    Returns:
+        tuple: (resume_text, error_message)
+    """
+    # Validate file
+    is_valid, error = Validators.validate_file(file)
+    if not is_valid:
+        return None, error
+
+    # Validate file size (measured while the request body was streamed in)
+    is_valid, error = Validators.validate_upload_size(file)
+    if not is_valid:
+        return None, error
+
+    # Parse resume straight from memory
+    file.stream.seek(0)
+    parsed = ResumeParser.parse_file(file.stream, filename=secure_filename(file.filename))
+    return parsed['text'], None
+
+
+def _read_resume_input():
+    """
+    Read the resume from the current request (file upload or text)
+
+    Returns:
+        tuple: (resume_text, error_message)
+    """
+    if 'resume_file' in request.files:
+        return _parse_resume_upload(request.files['resume_file'])
+
+    if 'resume_text' in request.form:
+        resume_text = request.form.get('resume_text')
+
+        # Validate resume text
+        is_valid, error = Validators.validate_resume_text(resume_text)
+        if not is_valid:
+            return None, error
+        return resume_text, None
+
+    return None, 'Either resume_file or resume_text is required'
+
+
+def _read_analysis_inputs():
+    """
+    Read and validate the resume and job description from the current request
+
+    Returns:
+        tuple: (resume_text, job_description, error_message)
+    """
+    # Get job description
+    job_description = request.form.get('job_description')
+
+    # Validate job description
+    is_valid, error = Validators.validate_job_description(job_description)
+    if not is_valid:
+        return None, None, error
+
+    # Get resume (either file or text)
+    resume_text, error = _read_resume_input()
+    if error:
+        return None, None, error
+
+    return resume_text, job_description, None
+
+
+def _read_analysis_mode():
+    """
+    Read the optional mode field of an analysis request
+
+    Returns:
+        tuple: (mode, error_message); mode defaults to Config.ANALYSIS_MODE
+    """
+    mode = (request.form.get('mode') or Config.ANALYSIS_MODE).lower()
+    if mode not in AnalysisPipeline.MODES:
+        return None, f"mode must be one of: {', '.join(AnalysisPipeline.MODES)}"
+
+    return mode, None
+
+
 @app.route('/api/analyze', methods=['POST'])
 def analyze_resume():
     """
@@ -59,114 +183,594 @@ def analyze_resume():
     - resume_file: File upload (PDF/DOCX/TXT) OR
     - resume_text: Plain text resume
     - job_description: Job description text (required)
+    - mode: 'standard' (one Claude call per step) or 'fused' (Steps 1-3
+      in one call) [optional, default: Config.ANALYSIS_MODE]
 
     Returns:
-    - JSON with complete analysis results from all 4 steps
+    - JSON with complete analysis results from all 4 steps and run
+      metadata (mode, step timings, token usage), flagged
+      "degraded" if some steps used local fallbacks while Claude was
+      unavailable
+    - 504 if the analysis can't finish within Config.ANALYZE_REQUEST_DEADLINE
+    - 503 if Claude is unavailable and the job analysis isn't cached
     """
+    # Starts before parsing, so upload handling counts against the budget
+    deadline = (
+        Deadline(Config.ANALYZE_REQUEST_DEADLINE) if Config.ANALYZE_REQUEST_DEADLINE > 0 else None
+    )
+
     try:
-        # Get job description
-        job_description = request.form.get('job_description')
+        resume_text, job_description, error = _read_analysis_inputs()
+        if error:
+            return jsonify({'success': False, 'error': error}), 400
 
-        # Validate job description
-        is_valid, error = Validators.validate_job_description(job_description)
-        if not is_valid:
+        mode, error = _read_analysis_mode()
+        if error:
             return jsonify({'success': False, 'error': error}), 400
 
-        # Get resume (either file or text)
-        resume_text = None
+        def run_analysis():
+            # Generate unique analysis ID
+            analysis_id = str(uuid.uuid4())
 
-        if 'resume_file' in request.files:
-            # Handle file upload
-            file = request.files['resume_file']
+            # Run the 4-step pipeline; independent steps run concurrently
+            result = AnalysisPipeline(deadline=deadline, mode=mode).run(
+                analysis_id, resume_text, job_description
+            )
 
-            # Validate file
-            is_valid, error = Validators.validate_file(file)
-            if not is_valid:
-                return jsonify({'success': False, 'error': error}), 400
+            print(f"[{analysis_id}] Analysis complete!")
+            return result.to_dict()
 
-            # Save file temporarily
-            filename = secure_filename(file.filename)
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            unique_filename = f"{timestamp}_{filename}"
-            file_path = os.path.join(Config.UPLOAD_FOLDER, unique_filename)
-            file.save(file_path)
+        # Duplicate requests wait for the in-flight analysis instead of
+        # starting their own LLM calls
+        flight_key = SingleFlight.make_key(resume_text, job_description, mode)
+        result, shared = analysis_flight.do(flight_key, run_analysis)
 
-            # Validate file size
-            is_valid, error = Validators.validate_file_size(file_path)
-            if not is_valid:
-                os.remove(file_path)
-                return jsonify({'success': False, 'error': error}), 400
-
-            # Parse resume
-            try:
-                parsed = ResumeParser.parse_file(file_path)
-                resume_text = parsed['text']
-            finally:
-                # Clean up temporary file
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-
-        elif 'resume_text' in request.form:
-            # Handle text input
-            resume_text = request.form.get('resume_text')
-
-            # Validate resume text
-            is_valid, error = Validators.validate_resume_text(resume_text)
-            if not is_valid:
-                return jsonify({'success': False, 'error': error}), 400
+        if shared:
+            print(f"[{result['analysis_id']}] Served duplicate request from in-flight analysis")
+
+        return jsonify(result), 200
+
+    except DeadlineExceededError as e:
+        print(f"Analysis deadline exceeded: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': f'Analysis timed out: {str(e)}'
+        }), 504
+
+    except CircuitOpenError as e:
+        print(f"Analysis rejected: {str(e)}")
+        response = jsonify({
+            'success': False,
+            'error': f'Analysis unavailable: {str(e)}'
+        })
+        response.headers['Retry-After'] = str(max(1, round(e.retry_after)))
+        return response, 503
+
+    except Exception as e:
+        print(f"Error during analysis: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': f'Analysis failed: {str(e)}'
+        }), 500
+
+
+@app.route('/api/analyze/async', methods=['POST'])
+def submit_analysis():
+    """
+    Queue a 4-step analysis and return immediately
+
+    Accepts the same form fields as /api/analyze.
+
+    Returns:
+    - 202 with the analysis_id, the URL to poll for status and the
+      URL of its Server-Sent Events progress stream
+    """
+    try:
+        resume_text, job_description, error = _read_analysis_inputs()
+        if error:
+            return jsonify({'success': False, 'error': error}), 400
+
+        mode, error = _read_analysis_mode()
+        if error:
+            return jsonify({'success': False, 'error': error}), 400
+
+        job = get_analysis_job_manager().submit(resume_text, job_description, mode=mode)
+        print(f"[{job.analysis_id}] Analysis queued")
+
+        return jsonify({
+            'success': True,
+            'analysis_id': job.analysis_id,
+            'status': job.status,
+            'status_url': f"/api/analysis/{job.analysis_id}",
+            'events_url': f"/api/analysis/{job.analysis_id}/events"
+        }), 202
+
+    except Exception as e:
+        print(f"Error queueing analysis: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': f'Analysis failed: {str(e)}'
+        }), 500
+
+
+@app.route('/api/analysis/<analysis_id>', methods=['GET'])
+def get_analysis(analysis_id):
+    """
+    Get the status of a queued analysis
+
+    Returns:
+    - JSON with status (queued/running/completed/failed), the results of
+      every step finished so far and, once completed, all 4 steps
+    """
+    status = get_analysis_job_manager().get_status(analysis_id)
+    if status is None:
+        return jsonify({'success': False, 'error': 'Analysis not found'}), 404
+
+    return jsonify(status), 200
+
+
+@app.route('/api/analysis/<analysis_id>/events', methods=['GET'])
+def stream_analysis_events(analysis_id):
+    """
+    Server-Sent Events stream of a queued analysis
+
+    Emits a `step` event with each step's result as soon as it completes,
+    `chunk` events with the optimized resume text while Step 4 generates,
+    then `complete` with the full analysis or `failed` with the error.
+    Reconnecting clients resume after the Last-Event-ID they received.
+    The stream stays open until the analysis finishes, so serve it from
+    threaded or gevent workers rather than sync ones.
+    """
+    manager = get_analysis_job_manager()
+    if manager.get(analysis_id) is None:
+        return jsonify({'success': False, 'error': 'Analysis not found'}), 404
+
+    last_event_id = request.headers.get('Last-Event-ID', '')
+    after = int(last_event_id) + 1 if last_event_id.isdigit() else 0
+
+    def generate():
+        position = after
+        while True:
+            update = manager.wait_for_events(
+                analysis_id, position, timeout=Config.SSE_KEEPALIVE_INTERVAL
+            )
+            if update is None:
+                return
+
+            events, finished = update
+            if not events:
+                if finished:
+                    return
+                # Comment line keeps proxies from closing an idle stream
+                yield ": keep-alive\n\n"
+                continue
+
+            for event_id, name, payload in events:
+                yield f"id: {event_id}\nevent: {name}\ndata: {json.dumps(payload)}\n\n"
+                position = event_id + 1
+                if name in ('complete', 'failed'):
+                    return
+
+    return Response(
+        generate(),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+@app.route('/api/optimize/stream', methods=['POST'])
+def stream_optimized_resume():
+    """
+    Generate the optimized resume (Step 4), streaming text as it is generated
+
+    Accepts (JSON):
+    - resume_text: Original resume text
+    - job_analysis, gap_analysis, ats_scan: Results of Steps 1-3
+
+    Returns:
+    - Server-Sent Events: `chunk` events with {"text": ...}, then
+      `complete` with {"optimized_resume": {...}} or `failed` with the error
+    """
+    data = request.get_json(silent=True)
+
+    if not data:
+        return jsonify({'success': False, 'error': 'No data provided'}), 400
+
+    resume_text = data.get('resume_text')
+    is_valid, error = Validators.validate_resume_text(resume_text)
+    if not is_valid:
+        return jsonify({'success': False, 'error': error}), 400
+
+    missing = [
+        key for key in ('job_analysis', 'gap_analysis', 'ats_scan')
+        if not isinstance(data.get(key), dict)
+    ]
+    if missing:
+        return jsonify({
+            'success': False,
+            'error': f"{', '.join(missing)} required"
+        }), 400
+
+    optimizer = ResumeOptimizer()
+
+    def generate():
+        chunks = []
+        try:
+            for chunk in optimizer.stream_optimized_resume(
+                resume_text, data['job_analysis'], data['gap_analysis'], data['ats_scan']
+            ):
+                chunks.append(chunk)
+                yield f"event: chunk\ndata: {json.dumps({'text': chunk})}\n\n"
+
+            result = ResumeOptimizer.build_result(resume_text, ''.join(chunks))
+            payload = {'optimized_resume': result.to_dict()}
+            yield f"event: complete\ndata: {json.dumps(payload)}\n\n"
+
+        except Exception as e:
+            print(f"Error streaming optimized resume: {str(e)}")
+            payload = {'error': f'Resume optimization failed: {str(e)}'}
+            yield f"event: failed\ndata: {json.dumps(payload)}\n\n"
+
+    return Response(
+        generate(),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
 
+
+def _read_batch_resumes():
+    """
+    Read every resume in a batch request
+
+    Returns:
+        tuple: (resumes, rejected) where resumes are dicts with 'name' and
+            'text' and rejected are error entries for unusable resumes
+    """
+    resumes = []
+    rejected = []
+
+    for file in request.files.getlist('resume_files'):
+        name = secure_filename(file.filename or '') or 'resume'
+        try:
+            text, error = _parse_resume_upload(file)
+        except Exception as e:
+            text, error = None, str(e)
+
+        if error:
+            rejected.append({'name': name, 'error': error})
+        else:
+            resumes.append({'name': name, 'text': text})
+
+    for i, text in enumerate(request.form.getlist('resume_texts')):
+        name = f"resume_text_{i + 1}"
+        is_valid, error = Validators.validate_resume_text(text)
+        if is_valid:
+            resumes.append({'name': name, 'text': text})
         else:
+            rejected.append({'name': name, 'error': error})
+
+    return resumes, rejected
+
+
+def _read_top_k():
+    """
+    Read the optional top_k field of a ranking or batch request
+
+    Returns:
+        tuple: (top_k or None, error_message)
+    """
+    value = request.form.get('top_k')
+    if value in (None, ''):
+        return None, None
+
+    try:
+        top_k = int(value)
+    except ValueError:
+        return None, 'top_k must be a positive integer'
+    if top_k < 1:
+        return None, 'top_k must be a positive integer'
+
+    return top_k, None
+
+
+@app.route('/api/rank', methods=['POST'])
+def rank_resumes():
+    """
+    Rank many resumes against one job description without calling Claude
+
+    Resumes are scored locally with BM25 over words and word pairs.
+
+    Accepts (multipart/form-data):
+    - job_description: Job description text (required)
+    - resume_files: One or more files (PDF/DOCX/TXT)
+    - resume_texts: One or more plain text resumes
+    - top_k: Only return the best top_k resumes (optional)
+
+    Returns:
+    - JSON with the resumes ranked by relevance score
+    """
+    try:
+        job_description = request.form.get('job_description')
+        is_valid, error = Validators.validate_job_description(job_description)
+        if not is_valid:
+            return jsonify({'success': False, 'error': error}), 400
+
+        top_k, error = _read_top_k()
+        if error:
+            return jsonify({'success': False, 'error': error}), 400
+
+        total = len(request.files.getlist('resume_files')) + len(request.form.getlist('resume_texts'))
+        if total == 0:
+            return jsonify({
+                'success': False,
+                'error': 'At least one resume_files or resume_texts entry is required'
+            }), 400
+        if total > Config.RANK_MAX_RESUMES:
             return jsonify({
                 'success': False,
-                'error': 'Either resume_file or resume_text is required'
+                'error': f'A ranking may contain at most {Config.RANK_MAX_RESUMES} resumes'
             }), 400
 
-        # Generate unique analysis ID
-        analysis_id = str(uuid.uuid4())
+        resumes, rejected = _read_batch_resumes()
+        ranking = RelevanceRanker.rank_resumes(job_description, resumes, top_k=top_k)
+
+        return jsonify({
+            'success': True,
+            'total': total,
+            'ranking': ranking,
+            'rejected': rejected
+        }), 200
+
+    except Exception as e:
+        print(f"Error during ranking: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': f'Ranking failed: {str(e)}'
+        }), 500
 
-        # Initialize services
-        job_analyzer = JobAnalyzer()
-        gap_analyzer = GapAnalyzer()
-        ats_scanner = ATSScanner()
-        resume_optimizer = ResumeOptimizer()
 
-        # Step 1: Analyze job description
-        print(f"[{analysis_id}] Step 1: Analyzing job description...")
-        job_analysis = job_analyzer.analyze_job_description(job_description)
+@app.route('/api/batch/analyze', methods=['POST'])
+def batch_analyze():
+    """
+    Analyze many resumes against one job description
 
-        # Step 2: Analyze resume gaps
-        print(f"[{analysis_id}] Step 2: Analyzing resume gaps...")
-        gap_analysis = gap_analyzer.analyze_resume_gaps(resume_text, job_analysis)
+    Step 1 runs once; Steps 2-4 run per resume on a bounded worker pool.
 
-        # Step 3: Scan ATS compatibility
-        print(f"[{analysis_id}] Step 3: Scanning ATS compatibility...")
-        ats_scan = ats_scanner.scan_ats_compatibility(resume_text)
+    Accepts (multipart/form-data):
+    - job_description: Job description text (required)
+    - resume_files: One or more files (PDF/DOCX/TXT)
+    - resume_texts: One or more plain text resumes
+    - format: "ndjson" (default) or "zip"
+    - top_k: Rank resumes locally first and only analyze the best top_k
+      (optional; allows up to Config.RANK_MAX_RESUMES resumes)
 
-        # Step 4: Optimize resume
-        print(f"[{analysis_id}] Step 4: Optimizing resume...")
-        optimized_resume = resume_optimizer.optimize_resume(
-            resume_text, job_analysis, gap_analysis, ats_scan
-        )
+    Returns:
+    - ndjson: one JSON line for the job analysis, one per resume as it
+      finishes, and a final summary line
+    - zip: an archive with the job analysis and one JSON file per resume
+    """
+    try:
+        job_description = request.form.get('job_description')
+        is_valid, error = Validators.validate_job_description(job_description)
+        if not is_valid:
+            return jsonify({'success': False, 'error': error}), 400
 
-        # Create complete analysis result
-        result = CompleteAnalysisResult(
-            success=True,
-            analysis_id=analysis_id,
-            job_analysis=job_analysis.to_dict(),
-            gap_analysis=gap_analysis.to_dict(),
-            ats_scan=ats_scan.to_dict(),
-            optimized_resume=optimized_resume.to_dict()
+        output_format = request.form.get('format', 'ndjson')
+        if output_format not in ('ndjson', 'zip'):
+            return jsonify({
+                'success': False,
+                'error': 'format must be "ndjson" or "zip"'
+            }), 400
+
+        top_k, error = _read_top_k()
+        if error:
+            return jsonify({'success': False, 'error': error}), 400
+        if top_k is not None and top_k > Config.BATCH_MAX_RESUMES:
+            return jsonify({
+                'success': False,
+                'error': f'top_k may be at most {Config.BATCH_MAX_RESUMES}'
+            }), 400
+
+        # Pre-filtered batches only send top_k resumes through the pipeline
+        max_resumes = Config.RANK_MAX_RESUMES if top_k is not None else Config.BATCH_MAX_RESUMES
+
+        total = len(request.files.getlist('resume_files')) + len(request.form.getlist('resume_texts'))
+        if total == 0:
+            return jsonify({
+                'success': False,
+                'error': 'At least one resume_files or resume_texts entry is required'
+            }), 400
+        if total > max_resumes:
+            return jsonify({
+                'success': False,
+                'error': f'A batch may contain at most {max_resumes} resumes'
+            }), 400
+
+        resumes, rejected = _read_batch_resumes()
+
+        # Positions in resumes of the ones analyzed, and the ones filtered out
+        selected = list(range(len(resumes)))
+        relevance = {}
+        skipped = []
+        if top_k is not None:
+            ranking = RelevanceRanker.rank_resumes(job_description, resumes)
+            relevance = {entry['index']: entry for entry in ranking}
+            selected = [entry['index'] for entry in ranking[:top_k]]
+            skipped = ranking[top_k:]
+
+        batch_id = str(uuid.uuid4())
+        batch = BatchAnalyzer()
+
+        # Step 1 once for the whole batch
+        print(f"[{batch_id}] Batch of {total}: analyzing job description...")
+        job_analysis = batch.analyze_job(job_description)
+
+        def iter_entries():
+            yield {
+                'type': 'job_analysis',
+                'batch_id': batch_id,
+                'total': total,
+                'result': job_analysis.to_dict()
+            }
+
+            failed = 0
+            for entry in rejected:
+                failed += 1
+                yield {'type': 'resume', 'success': False, **entry}
+
+            for entry in skipped:
+                yield {
+                    'type': 'resume',
+                    'index': entry['index'],
+                    'name': entry['name'],
+                    'success': False,
+                    'skipped': True,
+                    'relevance_rank': entry['rank'],
+                    'relevance_score': entry['score'],
+                    'error': f'Not among the top {top_k} resumes by relevance'
+                }
+
+            for entry in batch.iter_resume_analyses(
+                job_description, job_analysis, [resumes[i] for i in selected]
+            ):
+                entry['index'] = selected[entry['index']]
+                if entry['index'] in relevance:
+                    entry['relevance_rank'] = relevance[entry['index']]['rank']
+                    entry['relevance_score'] = relevance[entry['index']]['score']
+                if not entry.get('success'):
+                    failed += 1
+                yield {'type': 'resume', **entry}
+
+            print(f"[{batch_id}] Batch complete!")
+            yield {
+                'type': 'summary',
+                'batch_id': batch_id,
+                'total': total,
+                'succeeded': total - failed - len(skipped),
+                'failed': failed,
+                'skipped': len(skipped)
+            }
+
+        if output_format == 'zip':
+            archive = BytesIO()
+            with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as zf:
+                for position, entry in enumerate(iter_entries()):
+                    if entry['type'] == 'resume':
+                        name = f"resumes/{position:04d}_{entry['name']}.json"
+                    else:
+                        name = f"{entry['type']}.json"
+                    zf.writestr(name, json.dumps(entry, indent=2))
+            archive.seek(0)
+
+            return send_file(
+                archive,
+                mimetype='application/zip',
+                as_attachment=True,
+                download_name=f"batch_analysis_{batch_id}.zip"
+            )
+
+        def generate():
+            for entry in iter_entries():
+                yield json.dumps(entry) + "\n"
+
+        return Response(
+            generate(),
+            mimetype='application/x-ndjson',
+            headers={'X-Accel-Buffering': 'no'}
         )
 
-        print(f"[{analysis_id}] Analysis complete!")
+    except CircuitOpenError as e:
+        print(f"Batch analysis rejected: {str(e)}")
+        response = jsonify({
+            'success': False,
+            'error': f'Batch analysis unavailable: {str(e)}'
+        })
+        response.headers['Retry-After'] = str(max(1, round(e.retry_after)))
+        return response, 503
+
+    except Exception as e:
+        print(f"Error during batch analysis: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': f'Batch analysis failed: {str(e)}'
+        }), 500
+
+
+@app.route('/api/batch/compare', methods=['POST'])
+def batch_compare():
+    """
+    Analyze one resume against many job descriptions and rank the matches
+
+    The resume is parsed and ATS-scanned once; Steps 1, 2 and 4 run per
+    job description in parallel.
+
+    Accepts (multipart/form-data):
+    - resume_file: File upload (PDF/DOCX/TXT) OR
+    - resume_text: Plain text resume
+    - job_descriptions: One or more job description texts (required)
+    - optimize: "false" to skip generating an optimized resume per posting
+
+    Returns:
+    - JSON with the shared ATS scan and the postings ranked by match score
+    """
+    try:
+        job_descriptions = request.form.getlist('job_descriptions')
+        if not job_descriptions:
+            return jsonify({
+                'success': False,
+                'error': 'At least one job_descriptions entry is required'
+            }), 400
+        if len(job_descriptions) > Config.BATCH_MAX_JOB_DESCRIPTIONS:
+            return jsonify({
+                'success': False,
+                'error': f'A comparison may contain at most {Config.BATCH_MAX_JOB_DESCRIPTIONS} job descriptions'
+            }), 400
+
+        for i, job_description in enumerate(job_descriptions):
+            is_valid, error = Validators.validate_job_description(job_description)
+            if not is_valid:
+                return jsonify({
+                    'success': False,
+                    'error': f'Job description {i + 1}: {error}'
+                }), 400
+
+        resume_text, error = _read_resume_input()
+        if error:
+            return jsonify({'success': False, 'error': error}), 400
+
+        optimize = request.form.get('optimize', 'true').lower() != 'false'
+
+        comparison_id = str(uuid.uuid4())
+        print(f"[{comparison_id}] Comparing resume against {len(job_descriptions)} job descriptions...")
+
+        # A user is waiting on the comparison, so it runs at interactive
+        # priority and on its own pool instead of behind bulk batches
+        comparison = BatchAnalyzer(
+            claude_service=ClaudeService(), executor=get_compare_executor()
+        ).compare_job_descriptions(resume_text, job_descriptions, optimize=optimize)
+
+        print(f"[{comparison_id}] Comparison complete!")
+
+        return jsonify({
+            'success': True,
+            'comparison_id': comparison_id,
+            **comparison
+        }), 200
 
-        return jsonify(result.to_dict()), 200
+    except CircuitOpenError as e:
+        print(f"Comparison rejected: {str(e)}")
+        response = jsonify({
+            'success': False,
+            'error': f'Comparison unavailable: {str(e)}'
+        })
+        response.headers['Retry-After'] = str(max(1, round(e.retry_after)))
+        return response, 503
 
     except Exception as e:
-        print(f"Error during analysis: {str(e)}")
+        print(f"Error during comparison: {str(e)}")
         return jsonify({
             'success': False,
-            'error': f'Analysis failed: {str(e)}'
+            'error': f'Comparison failed: {str(e)}'
         }), 500
 
 
@@ -229,6 +833,16 @@ def not_found(error):
     }), 404
 
 
+@app.errorhandler(413)
+def request_too_large(error):
+    """Handle request bodies over MAX_REQUEST_SIZE"""
+    max_mb = Config.MAX_REQUEST_SIZE / (1024 * 1024)
+    return jsonify({
+        'success': False,
+        'error': f'Request too large. Maximum size: {max_mb:.1f}MB'
+    }), 413
+
+
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors"""
@@ -4,6 +4,17 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+
+def _model_route(step, model, max_tokens, temperature):
+    """Settings for one pipeline step, overridable with MODEL_ROUTE_<STEP>_* variables"""
+    prefix = f'MODEL_ROUTE_{step.upper()}_'
+    return {
+        'model': os.getenv(prefix + 'MODEL', model),
+        'max_tokens': int(os.getenv(prefix + 'MAX_TOKENS', max_tokens)),
+        'temperature': float(os.getenv(prefix + 'TEMPERATURE', temperature)),
+    }
+
+
 class Config:
     """Application configuration"""
 
@@ -14,12 +25,115 @@ class Config:
 
     # Claude API settings
     CLAUDE_API_KEY = os.getenv('CLAUDE_API_KEY')
+    CLAUDE_MODEL = os.getenv('CLAUDE_MODEL', 'claude-sonnet-4-5-20250929')
+    CLAUDE_FAST_MODEL = os.getenv('CLAUDE_FAST_MODEL', 'claude-haiku-4-5-20251001')
+    # Model, max_tokens and temperature per step; the extraction steps (job
+    # analysis, ATS scan) use the faster model, the optimizer the main one
+    MODEL_ROUTING = {
+        'job': _model_route('job', CLAUDE_FAST_MODEL, 2048, 0.3),
+        'gap': _model_route('gap', CLAUDE_MODEL, 4096, 0.3),
+        'ats': _model_route('ats', CLAUDE_FAST_MODEL, 2048, 0.3),
+        'optimize': _model_route('optimize', CLAUDE_MODEL, 8192, 0.5),
+        'fused': _model_route('fused', CLAUDE_MODEL, 4096, 0.3),
+    }
+    CLAUDE_POOL_MAX_CONNECTIONS = int(os.getenv('CLAUDE_POOL_MAX_CONNECTIONS', 20))
+    CLAUDE_POOL_MAX_KEEPALIVE = int(os.getenv('CLAUDE_POOL_MAX_KEEPALIVE', 10))
+    CLAUDE_KEEPALIVE_EXPIRY = float(os.getenv('CLAUDE_KEEPALIVE_EXPIRY', 60))  # seconds
+    CLAUDE_RETRY_MAX_ATTEMPTS = int(os.getenv('CLAUDE_RETRY_MAX_ATTEMPTS', 3))
+    CLAUDE_RETRY_BASE_DELAY = float(os.getenv('CLAUDE_RETRY_BASE_DELAY', 1))  # seconds
+    CLAUDE_RETRY_MAX_DELAY = float(os.getenv('CLAUDE_RETRY_MAX_DELAY', 30))  # seconds, before Retry-After
+    # Time budget for a synchronous /api/analyze request; keep below the client's timeout
+    ANALYZE_REQUEST_DEADLINE = float(os.getenv('ANALYZE_REQUEST_DEADLINE', 110))  # seconds, 0 = none
+
+    # Claude circuit breaker: opens when too many recent calls fail or are slow
+    CIRCUIT_BREAKER_ENABLED = os.getenv('CIRCUIT_BREAKER_ENABLED', 'True').lower() == 'true'
+    CIRCUIT_BREAKER_FAILURE_RATE = float(os.getenv('CIRCUIT_BREAKER_FAILURE_RATE', 0.5))
+    CIRCUIT_BREAKER_MIN_CALLS = int(os.getenv('CIRCUIT_BREAKER_MIN_CALLS', 10))
+    CIRCUIT_BREAKER_WINDOW = float(os.getenv('CIRCUIT_BREAKER_WINDOW', 60))  # seconds
+    CIRCUIT_BREAKER_SLOW_CALL = float(os.getenv('CIRCUIT_BREAKER_SLOW_CALL', 60))  # seconds
+    CIRCUIT_BREAKER_OPEN_SECONDS = float(os.getenv('CIRCUIT_BREAKER_OPEN_SECONDS', 30))
+    CIRCUIT_BREAKER_DEGRADED_MODE = os.getenv('CIRCUIT_BREAKER_DEGRADED_MODE', 'True').lower() == 'true'
+
+    # Client-side Claude rate limiting (0 = unlimited); set to the account's quota
+    RATE_LIMIT_RPM = int(os.getenv('RATE_LIMIT_RPM', 0))
+    RATE_LIMIT_TPM = int(os.getenv('RATE_LIMIT_TPM', 0))  # input + output tokens
+    RATE_LIMIT_STATE_FILE = os.getenv('RATE_LIMIT_STATE_FILE', '')  # empty = per-process only
+    RATE_LIMIT_INTERACTIVE_RESERVE = float(os.getenv('RATE_LIMIT_INTERACTIVE_RESERVE', 0.2))
+    RATE_LIMIT_MAX_WAIT = float(os.getenv('RATE_LIMIT_MAX_WAIT', 120))  # seconds
 
     # File upload settings
     MAX_FILE_SIZE = int(os.getenv('MAX_FILE_SIZE', 5242880))  # 5MB default
+    MAX_REQUEST_SIZE = int(os.getenv('MAX_REQUEST_SIZE', 100 * 1024 * 1024))  # whole request body, incl. batches
     ALLOWED_EXTENSIONS = set(os.getenv('ALLOWED_EXTENSIONS', 'pdf,docx,txt').split(','))
     UPLOAD_FOLDER = os.path.join(os.path.dirname(__file__), 'uploads')
 
+    # PDF parsing settings
+    PDF_PROCESS_WORKERS = int(os.getenv('PDF_PROCESS_WORKERS', 2))  # concurrent extractions; 0 = request thread
+    PDF_MAX_PAGES = int(os.getenv('PDF_MAX_PAGES', 20))
+    PDF_PARSE_TIMEOUT = float(os.getenv('PDF_PARSE_TIMEOUT', 10))  # seconds
+
+    # Pipeline settings
+    PIPELINE_MAX_WORKERS = int(os.getenv('PIPELINE_MAX_WORKERS', 8))
+    # standard: one Claude call per step; fused: Steps 1-3 in a single call
+    ANALYSIS_MODE = os.getenv('ANALYSIS_MODE', 'standard')
+
+    # Background analysis job settings
+    ANALYSIS_JOB_WORKERS = int(os.getenv('ANALYSIS_JOB_WORKERS', 4))
+    ANALYSIS_JOB_TTL = int(os.getenv('ANALYSIS_JOB_TTL', 3600))  # seconds finished jobs are kept
+    ANALYSIS_JOB_STORE = os.getenv('ANALYSIS_JOB_STORE', 'sqlite')  # sqlite (shared by workers), memory
+    ANALYSIS_JOB_DIR = os.getenv(
+        'ANALYSIS_JOB_DIR', os.path.join(os.path.dirname(__file__), 'cache', 'jobs')
+    )
+    # seconds without progress before a running job is assumed lost with its worker
+    ANALYSIS_JOB_STALE_AFTER = int(os.getenv('ANALYSIS_JOB_STALE_AFTER', 900))
+    # seconds a job may wait in the queue before it is assumed lost with its worker
+    ANALYSIS_JOB_QUEUE_TIMEOUT = int(os.getenv('ANALYSIS_JOB_QUEUE_TIMEOUT', 1800))
+    SSE_KEEPALIVE_INTERVAL = int(os.getenv('SSE_KEEPALIVE_INTERVAL', 15))  # seconds
+
+    # Batch analysis settings
+    BATCH_MAX_RESUMES = int(os.getenv('BATCH_MAX_RESUMES', 500))
+    BATCH_MAX_CONCURRENCY = int(os.getenv('BATCH_MAX_CONCURRENCY', 8))
+    BATCH_MAX_JOB_DESCRIPTIONS = int(os.getenv('BATCH_MAX_JOB_DESCRIPTIONS', 30))
+    COMPARE_MAX_CONCURRENCY = int(os.getenv('COMPARE_MAX_CONCURRENCY', 8))
+    RANK_MAX_RESUMES = int(os.getenv('RANK_MAX_RESUMES', 5000))  # local ranking / top_k pre-filter
+
+    # Job analysis cache settings
+    JOB_CACHE_ENABLED = os.getenv('JOB_CACHE_ENABLED', 'True').lower() == 'true'
+    JOB_CACHE_MAX_ENTRIES = int(os.getenv('JOB_CACHE_MAX_ENTRIES', 512))
+    JOB_CACHE_DIR = os.getenv('JOB_CACHE_DIR', '')  # empty = memory only
+    JOB_CACHE_TTL = int(os.getenv('JOB_CACHE_TTL', 7 * 24 * 3600))  # seconds
+
+    # Parsed resume cache settings
+    RESUME_CACHE_ENABLED = os.getenv('RESUME_CACHE_ENABLED', 'True').lower() == 'true'
+    RESUME_CACHE_MAX_ENTRIES = int(os.getenv('RESUME_CACHE_MAX_ENTRIES', 256))
+    RESUME_CACHE_DIR = os.getenv('RESUME_CACHE_DIR', '')  # empty = memory only
+    RESUME_CACHE_TTL = int(os.getenv('RESUME_CACHE_TTL', 7 * 24 * 3600))  # seconds
+
+    # Claude response cache settings
+    RESPONSE_CACHE_BACKEND = os.getenv('RESPONSE_CACHE_BACKEND', 'memory')  # memory, sqlite, filesystem, none
+    RESPONSE_CACHE_MAX_BYTES = int(os.getenv('RESPONSE_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+    RESPONSE_CACHE_DIR = os.getenv(
+        'RESPONSE_CACHE_DIR', os.path.join(os.path.dirname(__file__), 'cache', 'responses')
+    )
+
+    # ATS scan mode: llm (Claude only), fast (local rules only) or hybrid
+    ATS_SCAN_MODE = os.getenv('ATS_SCAN_MODE', 'llm')
+
+    # Skill taxonomy used to normalize skills and keywords (empty = disabled)
+    SKILL_TAXONOMY_PATH = os.getenv(
+        'SKILL_TAXONOMY_PATH', os.path.join(os.path.dirname(__file__), 'data', 'skill_taxonomy.json')
+    )
+
+    # Prompt token budgets (input tokens per step; 0 = unlimited)
+    PROMPT_CHARS_PER_TOKEN = int(os.getenv('PROMPT_CHARS_PER_TOKEN', 4))  # estimate
+    PROMPT_BUDGET_GAP_ANALYSIS = int(os.getenv('PROMPT_BUDGET_GAP_ANALYSIS', 6000))
+    PROMPT_BUDGET_ATS_SCAN = int(os.getenv('PROMPT_BUDGET_ATS_SCAN', 6000))
+    PROMPT_BUDGET_OPTIMIZE = int(os.getenv('PROMPT_BUDGET_OPTIMIZE', 12000))
+    PROMPT_BUDGET_FUSED = int(os.getenv('PROMPT_BUDGET_FUSED', 8000))
+
+    # Duplicate request coalescing settings
+    SINGLE_FLIGHT_LOCK_DIR = os.getenv('SINGLE_FLIGHT_LOCK_DIR', '')  # empty = per-process only
+
     # CORS settings
     CORS_ORIGINS = os.getenv('CORS_ORIGINS', '*')
 
@@ -87,6 +87,8 @@ class CompleteAnalysisResult:
     gap_analysis: Dict[str, Any] = field(default_factory=dict)
     ats_scan: Dict[str, Any] = field(default_factory=dict)
     optimized_resume: Dict[str, Any] = field(default_factory=dict)
+    degraded_steps: List[str] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
     error: str = None
 
     def to_dict(self):
@@ -100,6 +102,12 @@ class CompleteAnalysisResult:
                 "step4_optimized_resume": self.optimized_resume
             }
         }
+        if self.metadata:
+            result["metadata"] = self.metadata
+        if self.degraded_steps:
+            # Some steps fell back to local results while Claude was unavailable
+            result["degraded"] = True
+            result["degraded_steps"] = self.degraded_steps
         if self.error:
             result["error"] = self.error
         return result
@@ -3,6 +3,9 @@ Claude prompt templates for resume analysis
 Based on Resume Analyzer & ATS Optimizer specification
 """
 
+# Bump whenever a prompt changes so cached responses are invalidated
+PROMPT_VERSION = "2"
+
 JOB_ANALYSIS_PROMPT = """You are an expert Senior Technical Recruiter and ATS Specialist with 15+ years of experience.
 
 Analyze the following job description and extract key information that will be used for resume optimization.
@@ -52,8 +55,6 @@ Provide a detailed analysis in JSON format:
    - priority: "critical", "high", or "medium"
    - suggestion: Where/how to add this to the resume
 
-4. **keyword_matches**: Object mapping each ATS keyword to boolean (true if present in resume, false if missing)
-
 Return ONLY valid JSON in this exact format:
 {{
   "match_score": 85,
@@ -61,12 +62,7 @@ Return ONLY valid JSON in this exact format:
   "gaps": [
     {{"keyword": "Python", "priority": "critical", "suggestion": "Add to Skills section"}},
     ...
-  ],
-  "keyword_matches": {{
-    "keyword1": true,
-    "keyword2": false,
-    ...
-  }}
+  ]
 }}"""
 
 
@@ -116,6 +112,106 @@ Return ONLY valid JSON in this exact format:
 }}"""
 
 
+ATS_RESIDUAL_PROMPT = """You are an expert ATS (Applicant Tracking System) Specialist with deep knowledge of resume parsing systems.
+
+A rule-based scanner has already checked this resume's formatting, layout, contact details, standard section headings and length. Its findings:
+{local_findings}
+
+Review the resume only for the issues that need judgment. Do not repeat the findings above.
+
+Resume:
+{resume_text}
+
+Provide your analysis in JSON format:
+
+1. **content_score**: Score from 0-100 for how well the content will rank in an ATS (specific, quantified descriptions, clear dates, acronyms spelled out, industry terminology)
+
+2. **content**: Array of content issues (unclear dates, vague descriptions, acronyms not spelled out)
+
+3. **keywords**: Array of keyword issues (lack of industry keywords, missing technical terms)
+
+4. **section_readability**: Object grading each of these sections: {present_sections} as "excellent", "good" or "needs_improvement"
+
+5. **recommendations**: Array of the top 3 specific recommendations to improve ATS ranking
+
+Return ONLY valid JSON in this exact format:
+{{
+  "content_score": 75,
+  "content": ["issue1", "issue2", ...],
+  "keywords": ["issue1", "issue2", ...],
+  "section_readability": {{
+    "experience": "good",
+    ...
+  }},
+  "recommendations": ["recommendation1", "recommendation2", ...]
+}}"""
+
+
+FUSED_ANALYSIS_PROMPT = """You are an expert Senior Technical Recruiter and ATS Specialist with 15+ years of experience.
+
+Analyze the job description, then compare the candidate's resume against it and check the resume's ATS compatibility. Complete all three parts in one response.
+
+Job Description:
+{job_description}
+
+Resume:
+{resume_text}
+
+Return a JSON object with three parts:
+
+1. **job_analysis**:
+   - required_skills: Array of explicitly required technical skills, tools, and technologies (must-have qualifications)
+   - preferred_skills: Array of preferred but not required skills and qualifications (nice-to-have)
+   - key_responsibilities: Array of 5-7 core job duties and responsibilities
+   - ats_keywords: Array of 15-20 critical keywords that an ATS system would scan for (include both spelled-out terms AND acronyms, e.g., "Red Hat Enterprise Linux (RHEL)")
+
+2. **gap_analysis** (based on your job_analysis):
+   - match_score: Overall match score from 0-100 based on technical skills alignment (40 points), experience level match (20 points), education/certifications (15 points), industry/domain relevance (15 points) and keyword density (10 points)
+   - strengths: Array of 5-7 specific areas where the candidate is a strong match (include examples from resume)
+   - gaps: Array of top 5 missing keywords or skills, each with keyword, priority ("critical", "high", or "medium") and suggestion (where/how to add it to the resume)
+
+3. **ats_scan**:
+   - ats_score: Overall ATS-friendliness score from 0-100
+   - issues: Object with formatting, content and keywords arrays of problems found
+   - section_readability: Object grading contact, summary, experience, education, skills and certifications as "excellent", "good", "needs_improvement", or "missing"
+   - recommendations: Array of top 3-5 specific recommendations to improve ATS compatibility
+
+Return ONLY valid JSON in this exact format:
+{{
+  "job_analysis": {{
+    "required_skills": ["skill1", "skill2", ...],
+    "preferred_skills": ["skill1", "skill2", ...],
+    "key_responsibilities": ["responsibility1", "responsibility2", ...],
+    "ats_keywords": ["keyword1", "keyword2", ...]
+  }},
+  "gap_analysis": {{
+    "match_score": 85,
+    "strengths": ["strength1", "strength2", ...],
+    "gaps": [
+      {{"keyword": "Python", "priority": "critical", "suggestion": "Add to Skills section"}},
+      ...
+    ]
+  }},
+  "ats_scan": {{
+    "ats_score": 75,
+    "issues": {{
+      "formatting": ["issue1", ...],
+      "content": ["issue1", ...],
+      "keywords": ["issue1", ...]
+    }},
+    "section_readability": {{
+      "contact": "good",
+      "summary": "needs_improvement",
+      "experience": "excellent",
+      "education": "good",
+      "skills": "needs_improvement",
+      "certifications": "missing"
+    }},
+    "recommendations": ["recommendation1", "recommendation2", ...]
+  }}
+}}"""
+
+
 RESUME_OPTIMIZATION_PROMPT = """You are an expert Senior Technical Recruiter and ATS Specialist with 15+ years of experience.
 
 Rewrite the following resume to be optimized for the job and ATS-friendly.
@@ -0,0 +1,656 @@
+import copy
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from config import Config
+from services.analysis_pipeline import AnalysisPipeline, STEP_RESULT_KEYS
+from services.single_flight import SingleFlight
+
+
+class AnalysisJob:
+    """State of a background analysis"""
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+
+    def __init__(self, analysis_id, flight_key):
+        self.analysis_id = analysis_id
+        self.flight_key = flight_key
+        self.status = AnalysisJob.QUEUED
+        self.results = {}
+        self.error = None
+        self.degraded_steps = []  # Steps that used local fallbacks
+        self.metadata = {}  # Mode, timings and token usage once completed
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+
+    @property
+    def finished(self):
+        return self.status in (AnalysisJob.COMPLETED, AnalysisJob.FAILED)
+
+    def to_dict(self):
+        """
+        Serialize the job for the status endpoint
+
+        Returns:
+            dict: Status plus every step result available so far
+        """
+        steps_completed = [
+            key for key in STEP_RESULT_KEYS.values() if key in self.results
+        ]
+        result = {
+            "success": self.status != AnalysisJob.FAILED,
+            "analysis_id": self.analysis_id,
+            "status": self.status,
+            "steps_completed": steps_completed,
+            "results": {key: self.results[key] for key in steps_completed},
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
+        }
+        if self.metadata:
+            result["metadata"] = self.metadata
+        if self.degraded_steps:
+            result["degraded"] = True
+            result["degraded_steps"] = self.degraded_steps
+        if self.error:
+            result["error"] = self.error
+        return result
+
+    def state(self):
+        """
+        Returns:
+            dict: Fields a job store persists besides the id, key, status and times
+        """
+        return {
+            'results': self.results,
+            'error': self.error,
+            'degraded_steps': self.degraded_steps,
+            'metadata': self.metadata
+        }
+
+    @classmethod
+    def from_state(cls, analysis_id, flight_key, status, state, created_at, updated_at):
+        """Rebuild a job read back from a store"""
+        job = cls(analysis_id, flight_key)
+        job.status = status
+        job.results = state.get('results', {})
+        job.error = state.get('error')
+        job.degraded_steps = state.get('degraded_steps', [])
+        job.metadata = state.get('metadata', {})
+        job.created_at = created_at
+        job.updated_at = updated_at
+        return job
+
+
+class AnalysisJobStore:
+    """
+    Base class for analysis job stores
+
+    A store keeps each job's state and its ordered event log. Event ids
+    only need to increase within a job; readers resume after the last id
+    they received.
+    """
+
+    backend_name = 'base'
+
+    def create(self, job):
+        """
+        Add a job, unless an unfinished job with the same flight key exists
+
+        Args:
+            job (AnalysisJob): New queued job
+
+        Returns:
+            tuple: (job, created) with the existing job and False when joined
+        """
+        raise NotImplementedError
+
+    def get(self, analysis_id):
+        """
+        Returns:
+            AnalysisJob: The job, or None if unknown or expired
+        """
+        raise NotImplementedError
+
+    def save(self, job, events):
+        """
+        Persist a job's state and append its new events
+
+        Args:
+            job (AnalysisJob): Job with its state updated
+            events (list): (event name, payload) in the order they happened
+        """
+        raise NotImplementedError
+
+    def read_events(self, analysis_id, after):
+        """
+        Get a job's events from a given id on
+
+        Args:
+            analysis_id (str): Job identifier
+            after (int): First event id the caller has not seen
+
+        Returns:
+            tuple: (events, finished) where events is a list of
+                (event_id, event_name, payload); None if the job is unknown
+        """
+        raise NotImplementedError
+
+    def wait_for_events(self, analysis_id, after=0, timeout=15):
+        """
+        Block until a job has events from a given id on, or has finished
+
+        Returns:
+            tuple: Same as read_events
+        """
+        raise NotImplementedError
+
+    def prune(self, ttl):
+        """Drop finished jobs not updated for ttl seconds"""
+        raise NotImplementedError
+
+
+class MemoryAnalysisJobStore(AnalysisJobStore):
+    """Jobs held in this worker's memory; status requests must reach this worker"""
+
+    backend_name = 'memory'
+
+    def __init__(self):
+        self._jobs = {}
+        self._events = {}
+        self._active = {}  # flight key -> analysis_id of an unfinished job
+        self._finished = set()  # Jobs whose final event has been saved
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+
+    def create(self, job):
+        with self._lock:
+            active_id = self._active.get(job.flight_key)
+            if active_id is not None:
+                return self._snapshot(self._jobs[active_id]), False
+
+            self._jobs[job.analysis_id] = self._snapshot(job)
+            self._events[job.analysis_id] = []
+            self._active[job.flight_key] = job.analysis_id
+            return job, True
+
+    def get(self, analysis_id):
+        with self._lock:
+            job = self._jobs.get(analysis_id)
+            return self._snapshot(job) if job is not None else None
+
+    def save(self, job, events):
+        with self._changed:
+            if job.analysis_id not in self._jobs:
+                return
+            self._jobs[job.analysis_id] = self._snapshot(job)
+            self._events[job.analysis_id].extend(events)
+            if job.finished:
+                self._finished.add(job.analysis_id)
+                if self._active.get(job.flight_key) == job.analysis_id:
+                    del self._active[job.flight_key]
+            self._changed.notify_all()
+
+    def read_events(self, analysis_id, after):
+        with self._lock:
+            return self._read(analysis_id, after)
+
+    def wait_for_events(self, analysis_id, after=0, timeout=15):
+        with self._changed:
+            if analysis_id not in self._jobs:
+                return None
+
+            events = self._events[analysis_id]
+            self._changed.wait_for(
+                lambda: len(events) > after or analysis_id in self._finished, timeout
+            )
+            return self._read(analysis_id, after)
+
+    def prune(self, ttl):
+        with self._lock:
+            cutoff = time.time() - ttl
+            expired = [
+                analysis_id for analysis_id, job in self._jobs.items()
+                if job.finished and job.updated_at < cutoff
+            ]
+            for analysis_id in expired:
+                del self._jobs[analysis_id]
+                del self._events[analysis_id]
+                self._finished.discard(analysis_id)
+
+    @staticmethod
+    def _snapshot(job):
+        """
+        Copy a job's state, like a persistent store does on save and read
+
+        The pipeline thread keeps changing the job it runs, so the store
+        only ever holds and hands out copies taken under its lock.
+        """
+        return AnalysisJob.from_state(
+            job.analysis_id, job.flight_key, job.status, copy.deepcopy(job.state()),
+            job.created_at, job.updated_at
+        )
+
+    def _read(self, analysis_id, after):
+        """Read events (caller holds the lock)"""
+        if analysis_id not in self._jobs:
+            return None
+        events = [
+            (index, name, payload)
+            for index, (name, payload) in enumerate(self._events[analysis_id][after:], start=after)
+        ]
+        return events, analysis_id in self._finished
+
+
+class SQLiteAnalysisJobStore(AnalysisJobStore):
+    """
+    SQLite job store, shared by every worker on the host
+
+    Status and event requests can reach any worker. Readers in other
+    workers poll for new events. A running job not updated for
+    stale_after seconds is assumed lost with its worker and marked failed.
+    Queued jobs get the longer queue_timeout, since they may just be
+    waiting for a busy executor; one that never starts is failed too, so
+    later duplicates don't join it and wait forever.
+    """
+
+    backend_name = 'sqlite'
+
+    FINISHED = (AnalysisJob.COMPLETED, AnalysisJob.FAILED)
+
+    def __init__(self, path, stale_after=900, queue_timeout=1800, poll_interval=0.25):
+        """
+        Args:
+            path (str): Database file
+            stale_after (float): Seconds without an update before a
+                running job is marked failed
+            queue_timeout (float): Seconds a job may stay queued before it
+                is marked failed
+            poll_interval (float): Seconds between event checks while waiting
+        """
+        self.path = path
+        self.stale_after = stale_after
+        self.queue_timeout = queue_timeout
+        self.poll_interval = poll_interval
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            conn.execute('PRAGMA journal_mode=WAL')
+        finally:
+            conn.close()
+
+        with self._connect() as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS analysis_jobs ('
+                'analysis_id TEXT PRIMARY KEY, flight_key TEXT NOT NULL, '
+                'status TEXT NOT NULL, state TEXT NOT NULL, '
+                'created_at REAL NOT NULL, updated_at REAL NOT NULL)'
+            )
+            conn.execute(
+                'CREATE INDEX IF NOT EXISTS analysis_jobs_flight_key '
+                'ON analysis_jobs (flight_key, status)'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS analysis_events ('
+                'event_id INTEGER PRIMARY KEY AUTOINCREMENT, analysis_id TEXT NOT NULL, '
+                'name TEXT NOT NULL, payload TEXT NOT NULL)'
+            )
+            conn.execute(
+                'CREATE INDEX IF NOT EXISTS analysis_events_job '
+                'ON analysis_events (analysis_id, event_id)'
+            )
+
+    @contextmanager
+    def _connect(self, write=True):
+        # A connection per operation keeps this safe across threads
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        try:
+            # Writers take the write lock up front so check-then-insert is
+            # atomic across workers
+            conn.execute('BEGIN IMMEDIATE' if write else 'BEGIN')
+            try:
+                yield conn
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            conn.execute('COMMIT')
+        finally:
+            conn.close()
+
+    def create(self, job):
+        with self._connect() as conn:
+            self._fail_stale(conn)
+            row = conn.execute(
+                'SELECT * FROM analysis_jobs WHERE flight_key = ? AND status NOT IN (?, ?) '
+                'ORDER BY created_at LIMIT 1',
+                (job.flight_key, *self.FINISHED)
+            ).fetchone()
+            if row is not None:
+                return self._job(row), False
+
+            conn.execute(
+                'INSERT INTO analysis_jobs VALUES (?, ?, ?, ?, ?, ?)',
+                (job.analysis_id, job.flight_key, job.status, json.dumps(job.state()),
+                 job.created_at, job.updated_at)
+            )
+            return job, True
+
+    def get(self, analysis_id):
+        with self._connect(write=False) as conn:
+            row = conn.execute(
+                'SELECT * FROM analysis_jobs WHERE analysis_id = ?', (analysis_id,)
+            ).fetchone()
+            return self._job(row) if row is not None else None
+
+    def save(self, job, events):
+        with self._connect() as conn:
+            # A job already marked failed as stale stays failed
+            updated = conn.execute(
+                'UPDATE analysis_jobs SET status = ?, state = ?, updated_at = ? '
+                'WHERE analysis_id = ? AND status NOT IN (?, ?)',
+                (job.status, json.dumps(job.state()), job.updated_at,
+                 job.analysis_id, *self.FINISHED)
+            ).rowcount
+            if updated:
+                self._append(conn, job.analysis_id, events)
+
+    def read_events(self, analysis_id, after):
+        with self._connect(write=False) as conn:
+            row = conn.execute(
+                'SELECT status FROM analysis_jobs WHERE analysis_id = ?', (analysis_id,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            events = [
+                (event_id, name, json.loads(payload))
+                for event_id, name, payload in conn.execute(
+                    'SELECT event_id, name, payload FROM analysis_events '
+                    'WHERE analysis_id = ? AND event_id >= ? ORDER BY event_id',
+                    (analysis_id, after)
+                )
+            ]
+            return events, row[0] in self.FINISHED
+
+    def wait_for_events(self, analysis_id, after=0, timeout=15):
+        give_up_at = time.monotonic() + timeout
+        while True:
+            update = self.read_events(analysis_id, after)
+            if update is None or update[0] or update[1] or time.monotonic() >= give_up_at:
+                return update
+            time.sleep(self.poll_interval)
+
+    def prune(self, ttl):
+        try:
+            with self._connect() as conn:
+                self._fail_stale(conn)
+                expired = [
+                    row[0] for row in conn.execute(
+                        'SELECT analysis_id FROM analysis_jobs '
+                        'WHERE status IN (?, ?) AND updated_at < ?',
+                        (*self.FINISHED, time.time() - ttl)
+                    )
+                ]
+                for analysis_id in expired:
+                    conn.execute('DELETE FROM analysis_events WHERE analysis_id = ?', (analysis_id,))
+                    conn.execute('DELETE FROM analysis_jobs WHERE analysis_id = ?', (analysis_id,))
+        except sqlite3.Error as e:
+            print(f"Analysis job prune failed: {str(e)}")
+
+    def _fail_stale(self, conn):
+        """Mark jobs whose worker stopped updating or never started them as failed"""
+        now = time.time()
+        rows = conn.execute(
+            'SELECT * FROM analysis_jobs WHERE (status = ? AND updated_at < ?) '
+            'OR (status = ? AND updated_at < ?)',
+            (AnalysisJob.RUNNING, now - self.stale_after,
+             AnalysisJob.QUEUED, now - self.queue_timeout)
+        ).fetchall()
+        for row in rows:
+            job = self._job(row)
+            if job.status == AnalysisJob.QUEUED:
+                job.error = 'Analysis failed: worker never started it'
+            else:
+                job.error = 'Analysis failed: worker stopped responding'
+            job.status = AnalysisJob.FAILED
+            job.updated_at = time.time()
+            conn.execute(
+                'UPDATE analysis_jobs SET status = ?, state = ?, updated_at = ? '
+                'WHERE analysis_id = ?',
+                (job.status, json.dumps(job.state()), job.updated_at, job.analysis_id)
+            )
+            self._append(conn, job.analysis_id, [('failed', {'error': job.error})])
+
+    @staticmethod
+    def _append(conn, analysis_id, events):
+        conn.executemany(
+            'INSERT INTO analysis_events (analysis_id, name, payload) VALUES (?, ?, ?)',
+            [(analysis_id, name, json.dumps(payload)) for name, payload in events]
+        )
+
+    @staticmethod
+    def _job(row):
+        analysis_id, flight_key, status, state, created_at, updated_at = row
+        return AnalysisJob.from_state(
+            analysis_id, flight_key, status, json.loads(state), created_at, updated_at
+        )
+
+
+def create_analysis_job_store(backend=None):
+    """
+    Build a job store for the configured backend
+
+    Args:
+        backend (str): 'sqlite' or 'memory' (default: Config.ANALYSIS_JOB_STORE)
+
+    Returns:
+        AnalysisJobStore: Store instance
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    backend = (backend or Config.ANALYSIS_JOB_STORE).lower()
+
+    if backend == 'memory':
+        return MemoryAnalysisJobStore()
+    if backend == 'sqlite':
+        return SQLiteAnalysisJobStore(
+            os.path.join(Config.ANALYSIS_JOB_DIR, 'jobs.sqlite3'),
+            stale_after=Config.ANALYSIS_JOB_STALE_AFTER,
+            queue_timeout=Config.ANALYSIS_JOB_QUEUE_TIMEOUT
+        )
+
+    raise ValueError(f"Unknown analysis job store: {backend}")
+
+
+class AnalysisJobManager:
+    """
+    Runs analyses on a background pool and tracks them by analysis_id
+
+    Job status and events are kept in a job store for Config.ANALYSIS_JOB_TTL
+    seconds after they finish. With the SQLite store, status and event
+    requests can reach any worker on the host, not just the one running
+    the job.
+    """
+
+    # Seconds of optimized resume text gathered into one chunk event
+    CHUNK_FLUSH_INTERVAL = 0.2
+
+    def __init__(self, max_workers=None, ttl=None, store=None):
+        """
+        Args:
+            max_workers (int): Concurrent background analyses
+                (default: Config.ANALYSIS_JOB_WORKERS)
+            ttl (float): Seconds finished jobs are kept (default: Config.ANALYSIS_JOB_TTL)
+            store (AnalysisJobStore): Job store (default: Config.ANALYSIS_JOB_STORE backend)
+        """
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or Config.ANALYSIS_JOB_WORKERS,
+            thread_name_prefix='analysis-job'
+        )
+        self.ttl = ttl if ttl is not None else Config.ANALYSIS_JOB_TTL
+        self.store = store or create_analysis_job_store()
+
+    def submit(self, resume_text, job_description, mode=None):
+        """
+        Queue an analysis, or join an unfinished one for the same inputs
+
+        Args:
+            resume_text (str): Resume text content
+            job_description (str): Job description text
+            mode (str): Pipeline mode (default: Config.ANALYSIS_MODE)
+
+        Returns:
+            AnalysisJob: The queued (or already running) job
+        """
+        mode = mode or Config.ANALYSIS_MODE
+        flight_key = SingleFlight.make_key(resume_text, job_description, mode)
+
+        self.store.prune(self.ttl)
+
+        job, created = self.store.create(AnalysisJob(str(uuid.uuid4()), flight_key))
+        if not created:
+            return job
+
+        self.executor.submit(self._run, job, resume_text, job_description, mode)
+        return job
+
+    def get(self, analysis_id):
+        """
+        Look up a job
+
+        Args:
+            analysis_id (str): Job identifier
+
+        Returns:
+            AnalysisJob: The job, or None if unknown or expired
+        """
+        return self.store.get(analysis_id)
+
+    def get_status(self, analysis_id):
+        """
+        Get a consistent snapshot of a job's status
+
+        Args:
+            analysis_id (str): Job identifier
+
+        Returns:
+            dict: Serialized job, or None if unknown or expired
+        """
+        job = self.store.get(analysis_id)
+        return job.to_dict() if job is not None else None
+
+    def wait_for_events(self, analysis_id, after=0, timeout=15):
+        """
+        Block until a job has events from a given id on
+
+        Args:
+            analysis_id (str): Job identifier
+            after (int): First event id the caller has not seen
+            timeout (float): Seconds to wait before returning no events
+
+        Returns:
+            tuple: (events, finished) where events is a list of
+                (event_id, event_name, payload); None if the job is unknown
+        """
+        return self.store.wait_for_events(analysis_id, after, timeout)
+
+    def _run(self, job, resume_text, job_description, mode):
+        """Run the pipeline for a job, recording each step as it completes"""
+        current = self.store.get(job.analysis_id)
+        if current is None or current.finished:
+            # Pruned or failed while it waited in the queue
+            return
+
+        self._update(job, status=AnalysisJob.RUNNING)
+
+        chunk_key = STEP_RESULT_KEYS['optimized_resume']
+        pending_chunks = []
+        last_flush = [time.monotonic()]
+
+        def flush_chunks():
+            if pending_chunks:
+                self._update(job, chunk=(chunk_key, ''.join(pending_chunks)))
+                pending_chunks.clear()
+            last_flush[0] = time.monotonic()
+
+        def on_step_complete(name, result):
+            if name in STEP_RESULT_KEYS:
+                if name == 'optimized_resume':
+                    flush_chunks()
+                self._update(job, step=(STEP_RESULT_KEYS[name], result.to_dict()))
+
+        def on_chunk(text):
+            # Gathered so a shared store isn't written once per token
+            pending_chunks.append(text)
+            if time.monotonic() - last_flush[0] >= self.CHUNK_FLUSH_INTERVAL:
+                flush_chunks()
+
+        try:
+            result = AnalysisPipeline(mode=mode).run(
+                job.analysis_id, resume_text, job_description,
+                on_step_complete=on_step_complete,
+                on_chunk=on_chunk
+            )
+            print(f"[{job.analysis_id}] Analysis complete!")
+            self._update(job, status=AnalysisJob.COMPLETED, result=result)
+        except Exception as e:
+            print(f"[{job.analysis_id}] Error during analysis: {str(e)}")
+            self._update(job, status=AnalysisJob.FAILED, error=f"Analysis failed: {str(e)}")
+
+    def _update(self, job, status=None, step=None, chunk=None, error=None, result=None):
+        """Apply a state change to a job and publish its events"""
+        events = []
+        if error is not None:
+            job.error = error
+        if result is not None:
+            job.degraded_steps = list(result.degraded_steps)
+            job.metadata = result.metadata
+        if chunk is not None:
+            events.append(('chunk', {'step': chunk[0], 'text': chunk[1]}))
+        if step is not None:
+            job.results[step[0]] = step[1]
+            events.append(('step', {'step': step[0], 'result': step[1]}))
+        if status is not None:
+            job.status = status
+            if status == AnalysisJob.COMPLETED:
+                events.append(('complete', job.to_dict()))
+            elif status == AnalysisJob.FAILED:
+                events.append(('failed', {'error': job.error}))
+            else:
+                events.append(('status', {'status': status}))
+        job.updated_at = time.time()
+
+        try:
+            self.store.save(job, events)
+        except sqlite3.Error as e:
+            print(f"[{job.analysis_id}] Analysis job update failed: {str(e)}")
+
+
+_job_manager = None
+_job_manager_lock = threading.Lock()
+
+
+def get_analysis_job_manager():
+    """
+    Get the process-wide analysis job manager
+
+    Returns:
+        AnalysisJobManager: Shared manager
+    """
+    global _job_manager
+
+    if _job_manager is None:
+        with _job_manager_lock:
+            if _job_manager is None:
+                _job_manager = AnalysisJobManager()
+
+    return _job_manager
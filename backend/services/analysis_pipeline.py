@@ -0,0 +1,240 @@
+import time
+from config import Config
+from services.claude_service import ClaudeService
+from services.circuit_breaker import CircuitOpenError
+from services.pipeline_executor import PipelineExecutor
+from services.job_analyzer import JobAnalyzer
+from services.gap_analyzer import GapAnalyzer
+from services.ats_scanner import ATSScanner
+from services.resume_optimizer import ResumeOptimizer
+from services.fused_analyzer import FusedAnalyzer
+from models.analysis_models import CompleteAnalysisResult
+
+
+# Pipeline step names and the keys their results use in API responses
+STEP_RESULT_KEYS = {
+    'job_analysis': 'step1_job_analysis',
+    'gap_analysis': 'step2_gap_analysis',
+    'ats_scan': 'step3_ats_scan',
+    'optimized_resume': 'step4_optimized_resume'
+}
+
+
+class AnalysisPipeline:
+    """
+    Runs the 4-step resume analysis as a dependency graph
+
+    Step 1 (job analysis) and Step 3 (ATS scan) only need the raw inputs
+    and start immediately; Step 2 waits for Step 1 and Step 4 waits for
+    Steps 1-3. In 'fused' mode Steps 1-3 are answered by a single Claude
+    call (FusedAnalyzer) and Step 4 follows it.
+
+    While the Claude circuit breaker is open, Steps 2-4 fall back to local
+    results (keyword-based gaps, rule-based ATS scan, no optimized resume)
+    and the result is flagged as degraded. Step 1 has no local fallback
+    beyond the job analysis cache, so an uncached posting still fails fast.
+    """
+
+    MODES = ('standard', 'fused')
+
+    def __init__(self, executor=None, claude_service=None, deadline=None, degraded_mode=None,
+                 mode=None):
+        """
+        Args:
+            executor (Executor): Thread pool for the steps (default: shared pool)
+            claude_service (ClaudeService): Service injected into all 4 steps
+                (default: new service on the shared client)
+            deadline (Deadline): Time budget for the whole run, shared by all
+                4 steps (only used when claude_service is not given)
+            degraded_mode (bool): Serve local results while the circuit breaker
+                is open (default: Config.CIRCUIT_BREAKER_DEGRADED_MODE)
+            mode (str): 'standard' or 'fused' (default: Config.ANALYSIS_MODE)
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        self.mode = (mode or Config.ANALYSIS_MODE).lower()
+        if self.mode not in self.MODES:
+            raise ValueError(f"Unknown analysis mode: {self.mode}")
+
+        self.executor = executor
+        self.degraded_mode = (
+            Config.CIRCUIT_BREAKER_DEGRADED_MODE if degraded_mode is None else degraded_mode
+        )
+        # A session, so this run's token usage is counted apart from others
+        # sharing the same service
+        self.claude_service = (claude_service or ClaudeService(deadline=deadline)).session()
+        self.job_analyzer = JobAnalyzer(self.claude_service)
+        self.gap_analyzer = GapAnalyzer(self.claude_service)
+        self.ats_scanner = ATSScanner(self.claude_service)
+        self.resume_optimizer = ResumeOptimizer(self.claude_service)
+        self.fused_analyzer = FusedAnalyzer(self.claude_service)
+
+    def run(self, analysis_id, resume_text, job_description, on_step_complete=None,
+            on_chunk=None, job_analysis=None, ats_scan=None, optimize=True):
+        """
+        Run the complete analysis
+
+        Args:
+            analysis_id (str): Identifier used in log lines and the result
+            resume_text (str): Resume text content
+            job_description (str): Job description text
+            on_step_complete (callable): Called as on_step_complete(name, result)
+                as soon as each step's result is available
+            on_chunk (callable): If given, Step 4 is streamed and on_chunk(text)
+                receives the optimized resume text as it is generated
+            job_analysis (JobAnalysisResult): Precomputed Step 1 result; when
+                given, Step 1 is skipped
+            ats_scan (ATSScanResult): Precomputed Step 3 result; when given,
+                Step 3 is skipped
+            optimize (bool): Set to False to skip Step 4
+
+        Precomputed or cached Step 1 results and precomputed Step 3 results
+        leave nothing to fuse, so those runs use the standard per-step graph
+        in either mode.
+
+        Returns:
+            CompleteAnalysisResult: Results from all 4 steps (Step 4 is
+                empty when optimize is False), with metadata on the mode
+                used, per-step timings, token usage and model routing
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open and Step 1 isn't
+                cached (or degraded mode is off)
+            Exception: If any step fails
+        """
+        started_at = time.monotonic()
+        usage_before = self.claude_service.get_usage()
+        degraded_steps = []
+        timings = {}
+
+        def timed(name, func):
+            def run_step(**kwargs):
+                step_started = time.monotonic()
+                try:
+                    return func(**kwargs)
+                finally:
+                    timings[name] = round(time.monotonic() - step_started, 3)
+            return run_step
+
+        def degrade(error, step, fallback, *args):
+            if not self.degraded_mode:
+                raise error
+            print(f"[{analysis_id}] Claude unavailable, using local {step} result")
+            degraded_steps.append(step)
+            return fallback(*args)
+
+        def analyze_job(job_description):
+            if cached_job_analysis is not None:
+                return cached_job_analysis
+            print(f"[{analysis_id}] Step 1: Analyzing job description...")
+            return self.job_analyzer.analyze_job_description(job_description)
+
+        def analyze_gaps(resume_text, job_analysis):
+            print(f"[{analysis_id}] Step 2: Analyzing resume gaps...")
+            try:
+                return self.gap_analyzer.analyze_resume_gaps(resume_text, job_analysis)
+            except CircuitOpenError as e:
+                return degrade(
+                    e, 'gap_analysis', self.gap_analyzer.analyze_locally, resume_text, job_analysis
+                )
+
+        def scan_ats(resume_text):
+            print(f"[{analysis_id}] Step 3: Scanning ATS compatibility...")
+            try:
+                return self.ats_scanner.scan_ats_compatibility(resume_text)
+            except CircuitOpenError as e:
+                return degrade(e, 'ats_scan', self.ats_scanner.rule_engine.scan, resume_text)
+
+        def optimize_resume(resume_text, job_analysis, gap_analysis, ats_scan):
+            print(f"[{analysis_id}] Step 4: Optimizing resume...")
+            try:
+                return self.resume_optimizer.optimize_resume(
+                    resume_text, job_analysis, gap_analysis, ats_scan, on_chunk=on_chunk
+                )
+            except CircuitOpenError as e:
+                # Rewriting needs Claude; return the steps that could run
+                return degrade(e, 'optimized_resume', ResumeOptimizer.build_result, resume_text, '')
+
+        def analyze_fused(resume_text, job_description):
+            print(f"[{analysis_id}] Steps 1-3: Analyzing job, gaps and ATS compatibility...")
+            try:
+                return self.fused_analyzer.analyze(resume_text, job_description)
+            except CircuitOpenError as e:
+                if not self.degraded_mode:
+                    raise
+                # Step 1 can still come from the job analysis cache
+                job = self.job_analyzer.analyze_job_description(job_description)
+                return (
+                    job,
+                    degrade(e, 'gap_analysis', self.gap_analyzer.analyze_locally, resume_text, job),
+                    degrade(e, 'ats_scan', self.ats_scanner.rule_engine.scan, resume_text)
+                )
+
+        fused = self.mode == 'fused' and job_analysis is None and ats_scan is None
+
+        # A cached Step 1, from either mode, leaves only Steps 2-3, which the
+        # standard graph runs in parallel
+        cached_job_analysis = None
+        if fused:
+            cached_job_analysis = self.job_analyzer.get_cached(
+                job_description, steps=('job', 'fused')
+            )
+            fused = cached_job_analysis is None
+
+        pipeline = PipelineExecutor(self.executor)
+        if fused:
+            pipeline.add_step(
+                'fused_analysis', timed('fused_analysis', analyze_fused),
+                ['resume_text', 'job_description']
+            )
+            # Split the combined result back into the per-step results
+            for index, name in enumerate(('job_analysis', 'gap_analysis', 'ats_scan')):
+                pipeline.add_step(
+                    name, lambda fused_analysis, index=index: fused_analysis[index],
+                    ['fused_analysis']
+                )
+        else:
+            pipeline.add_step('job_analysis', timed('job_analysis', analyze_job), ['job_description'])
+            pipeline.add_step(
+                'gap_analysis', timed('gap_analysis', analyze_gaps), ['resume_text', 'job_analysis']
+            )
+            pipeline.add_step('ats_scan', timed('ats_scan', scan_ats), ['resume_text'])
+        if optimize:
+            pipeline.add_step(
+                'optimized_resume', timed('optimized_resume', optimize_resume),
+                ['resume_text', 'job_analysis', 'gap_analysis', 'ats_scan']
+            )
+
+        initial_results = {
+            'resume_text': resume_text,
+            'job_description': job_description
+        }
+        if job_analysis is not None:
+            initial_results['job_analysis'] = job_analysis
+        if ats_scan is not None:
+            initial_results['ats_scan'] = ats_scan
+
+        results = pipeline.run(initial_results, on_step_complete=on_step_complete)
+
+        return CompleteAnalysisResult(
+            success=True,
+            analysis_id=analysis_id,
+            job_analysis=results['job_analysis'].to_dict(),
+            gap_analysis=results['gap_analysis'].to_dict(),
+            ats_scan=results['ats_scan'].to_dict(),
+            optimized_resume=(
+                results['optimized_resume'].to_dict() if optimize else {}
+            ),
+            degraded_steps=[name for name in STEP_RESULT_KEYS if name in degraded_steps],
+            metadata={
+                'mode': 'fused' if fused else 'standard',
+                'timings': timings,
+                'total_seconds': round(time.monotonic() - started_at, 3),
+                'usage': {
+                    key: value - usage_before[key]
+                    for key, value in self.claude_service.get_usage().items()
+                },
+                'routing': self.claude_service.get_routing()
+            }
+        )
@@ -0,0 +1,209 @@
+import re
+from services.resume_parser import ResumeParser
+from models.analysis_models import ATSScanResult
+
+
+# Sections graded in ATSScanResult.section_readability
+READABILITY_SECTIONS = ('contact', 'summary', 'experience', 'education', 'skills', 'certifications')
+
+# Sections an ATS expects; missing ones cost points, and how many
+REQUIRED_SECTIONS = {'experience': 15, 'education': 10, 'skills': 10}
+EXPECTED_SECTIONS = {'summary': 5}
+
+EMAIL_PATTERN = re.compile(r'[\w.+-]+@[\w-]+(?:\.[\w-]+)+')
+PHONE_PATTERN = re.compile(r'(?:\+?\d[\d\s().-]{7,}\d)')
+LINKEDIN_PATTERN = re.compile(r'linkedin\.com/', re.IGNORECASE)
+
+# Bullet glyphs most ATS parsers read; anything else in the leading
+# position of a line is reported as a non-standard bullet
+STANDARD_BULLETS = {'•', '-', '*', '–'}
+BULLET_PATTERN = re.compile(r'^[ \t]*([^\w\s\(\[\"\'$€£#@+])[ \t]+\S', re.MULTILINE)
+
+# Two or more tabs, or three or more wide gaps, on one line suggest
+# tables or side-by-side columns
+COLUMN_PATTERN = re.compile(r'^[^\n]*(?:\t[^\n]*\t|\S {3,}\S[^\n]* {3,}\S[^\n]* {3,}\S)', re.MULTILINE)
+TABLE_BORDER_PATTERN = re.compile(r'^[ \t]*(?:\|.*\|.*\||[+\-=]{10,})[ \t]*$', re.MULTILINE)
+
+MAX_LINE_LENGTH = 200
+MIN_WORDS = 200
+MAX_WORDS = 1100
+MIN_SECTION_CHARS = 40
+
+
+class ATSRuleEngine:
+    """
+    Scores ATS compatibility with local, deterministic rules
+
+    Covers the mechanical checks an ATS parser trips on: missing standard
+    sections and contact details, tables and columns, overlong lines,
+    non-standard bullet glyphs and resume length. Judgment calls (vague
+    descriptions, keyword strategy) are left to Claude.
+    """
+
+    def scan(self, resume_text):
+        """
+        Scan resume text for mechanical ATS issues
+
+        Args:
+            resume_text (str): Resume text content
+
+        Returns:
+            ATSScanResult: Local scan result
+        """
+        text = resume_text or ''
+        sections = ResumeParser.parse_text(text)['sections']
+
+        findings = []  # (category, issue, penalty, recommendation)
+        findings.extend(self._check_contact(text, sections))
+        findings.extend(self._check_sections(text, sections))
+        findings.extend(self._check_layout(text))
+        findings.extend(self._check_length(text))
+
+        issues = {'formatting': [], 'content': [], 'keywords': []}
+        recommendations = []
+        penalty = 0
+        for category, issue, points, recommendation in findings:
+            issues[category].append(issue)
+            penalty += points
+            if recommendation and recommendation not in recommendations:
+                recommendations.append(recommendation)
+
+        return ATSScanResult(
+            ats_score=max(0, min(100, 100 - penalty)),
+            issues=issues,
+            section_readability=self._grade_sections(text, sections),
+            recommendations=recommendations[:5]
+        )
+
+    @staticmethod
+    def _check_contact(text, sections):
+        """Check for the contact details an ATS extracts"""
+        findings = []
+
+        # Contact details normally sit above the first section header
+        first_header = min((s['start'] for s in sections.values()), default=len(text))
+        header_text = text[:first_header] or text
+
+        if not EMAIL_PATTERN.search(text):
+            findings.append(('content', 'No email address found', 10,
+                             'Add a professional email address to the contact line'))
+        elif not EMAIL_PATTERN.search(header_text):
+            findings.append(('formatting', 'Email address is not at the top of the resume', 3,
+                             'Put contact details directly under your name'))
+
+        if not ATSRuleEngine._has_phone(text):
+            findings.append(('content', 'No phone number found', 5,
+                             'Add a phone number to the contact line'))
+
+        return findings
+
+    @staticmethod
+    def _has_phone(text):
+        """Check for a phone number (10-15 digits, so date ranges don't count)"""
+        return any(
+            10 <= len(re.sub(r'\D', '', match)) <= 15
+            for match in PHONE_PATTERN.findall(text)
+        )
+
+    @staticmethod
+    def _check_sections(text, sections):
+        """Check for standard, non-empty section headings"""
+        findings = []
+
+        for name, points in list(REQUIRED_SECTIONS.items()) + list(EXPECTED_SECTIONS.items()):
+            if name not in sections:
+                findings.append((
+                    'content', f'Missing a standard "{name.title()}" section heading', points,
+                    f'Add a clearly labeled {name.upper()} section'
+                ))
+
+        if 'skills' not in sections:
+            findings.append(('keywords', 'No dedicated skills section for keyword scanning', 5,
+                             'List technical skills in a SKILLS section so ATS keyword scans find them'))
+
+        for section in sections.values():
+            body = text[section['start'] + len(section['header']):section['end']]
+            if len(body.strip(' \t\n:')) < MIN_SECTION_CHARS:
+                findings.append((
+                    'content', f'"{section["header"]}" section is nearly empty', 3, None
+                ))
+
+        return findings
+
+    @staticmethod
+    def _check_layout(text):
+        """Check for tables, columns, overlong lines and unusual bullets"""
+        findings = []
+
+        if TABLE_BORDER_PATTERN.search(text) or len(COLUMN_PATTERN.findall(text)) >= 3:
+            findings.append(('formatting', 'Tables or multi-column layout detected', 15,
+                             'Replace tables and columns with a single-column layout'))
+
+        long_lines = [line for line in text.splitlines() if len(line) > MAX_LINE_LENGTH]
+        if long_lines:
+            findings.append((
+                'formatting', f'{len(long_lines)} line(s) longer than {MAX_LINE_LENGTH} characters', 5,
+                'Break long paragraphs into concise bullet points'
+            ))
+
+        glyphs = sorted({
+            glyph for glyph in BULLET_PATTERN.findall(text)
+            if glyph not in STANDARD_BULLETS and not glyph.isascii()
+        })
+        if glyphs:
+            findings.append((
+                'formatting', f'Non-standard bullet characters: {" ".join(glyphs)}', 5,
+                'Use standard bullets (•) or hyphens (-)'
+            ))
+
+        if any(ord(char) > 0xFFFF or 0xE000 <= ord(char) <= 0xF8FF for char in text):
+            findings.append(('formatting', 'Symbols or icons that may not parse as text', 5,
+                             'Remove icons and emoji; spell out labels like "Email:"'))
+
+        return findings
+
+    @staticmethod
+    def _check_length(text):
+        """Check overall resume length"""
+        words = len(text.split())
+
+        if words < MIN_WORDS:
+            return [('content', f'Resume is short ({words} words)', 10,
+                     'Expand experience bullets with measurable results')]
+        if words > MAX_WORDS:
+            return [('content', f'Resume is long ({words} words)', 5,
+                     'Trim to the most relevant roles to keep the resume within two pages')]
+        return []
+
+    @staticmethod
+    def _grade_sections(text, sections):
+        """Grade each standard section: missing, needs_improvement or good"""
+        readability = {}
+
+        for name in READABILITY_SECTIONS:
+            if name == 'contact':
+                has_email = bool(EMAIL_PATTERN.search(text))
+                has_phone = ATSRuleEngine._has_phone(text)
+                if has_email and has_phone:
+                    readability[name] = 'excellent' if LINKEDIN_PATTERN.search(text) else 'good'
+                elif has_email or has_phone:
+                    readability[name] = 'needs_improvement'
+                else:
+                    readability[name] = 'missing'
+                continue
+
+            section = sections.get(name)
+            if section is None:
+                readability[name] = 'missing'
+                continue
+
+            body = text[section['start'] + len(section['header']):section['end']]
+            lines = body.splitlines()
+            if len(body.strip(' \t\n:')) < MIN_SECTION_CHARS or any(
+                len(line) > MAX_LINE_LENGTH for line in lines
+            ):
+                readability[name] = 'needs_improvement'
+            else:
+                readability[name] = 'good'
+
+        return readability
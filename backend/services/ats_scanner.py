@@ -1,13 +1,44 @@
+from config import Config
 from services.claude_service import ClaudeService
-from models.prompts import ATS_SCAN_PROMPT, SYSTEM_MESSAGE
+from services.retry_policy import DeadlineExceededError
+from services.circuit_breaker import CircuitOpenError
+from services.prompt_budget import PromptBudget
+from services.ats_rules import ATSRuleEngine
+from models.prompts import ATS_SCAN_PROMPT, ATS_RESIDUAL_PROMPT, SYSTEM_MESSAGE
 from models.analysis_models import ATSScanResult
 
 
 class ATSScanner:
-    """Service for scanning resume ATS compatibility (Step 3)"""
+    """
+    Service for scanning resume ATS compatibility (Step 3)
 
-    def __init__(self):
-        self.claude_service = ClaudeService()
+    Modes:
+        llm: Claude performs the whole scan
+        fast: Local rules only, no API call
+        hybrid: Local rules for the mechanical checks, Claude for the
+            judgment calls with a smaller prompt
+    """
+
+    MODES = ('llm', 'fast', 'hybrid')
+    HYBRID_LLM_WEIGHT = 0.4  # Share of the hybrid score from Claude's content score
+    READABILITY_GRADES = ('excellent', 'good', 'needs_improvement')
+
+    def __init__(self, claude_service=None, mode=None, rule_engine=None):
+        """
+        Args:
+            claude_service (ClaudeService): Service to use (default: new service on the shared client)
+            mode (str): 'llm', 'fast' or 'hybrid' (default: Config.ATS_SCAN_MODE)
+            rule_engine (ATSRuleEngine): Local rules (default: new engine)
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        self.mode = (mode or Config.ATS_SCAN_MODE).lower()
+        if self.mode not in self.MODES:
+            raise ValueError(f"Unknown ATS scan mode: {self.mode}")
+
+        self.claude_service = claude_service or ClaudeService()
+        self.rule_engine = rule_engine or ATSRuleEngine()
 
     def scan_ats_compatibility(self, resume_text):
         """
@@ -23,13 +54,19 @@ class ATSScanner:
             Exception: If scanning fails
         """
         try:
-            # Format prompt
-            prompt = ATS_SCAN_PROMPT.format(resume_text=resume_text)
+            if self.mode == 'fast':
+                return self.rule_engine.scan(resume_text)
+            if self.mode == 'hybrid':
+                return self._scan_hybrid(resume_text)
+
+            # Format prompt within the step's token budget
+            prompt = PromptBudget.build_prompt('ats_scan', ATS_SCAN_PROMPT, resume_text)
 
             # Get response from Claude as JSON
             response_data = self.claude_service.send_prompt_with_json(
                 prompt=prompt,
-                system_message=SYSTEM_MESSAGE
+                system_message=SYSTEM_MESSAGE,
+                step='ats'
             )
 
             # Create result object
@@ -46,5 +83,107 @@ class ATSScanner:
 
             return result
 
+        except (DeadlineExceededError, CircuitOpenError):
+            raise
+
         except Exception as e:
             raise Exception(f"ATS scanning failed: {str(e)}")
+
+    def apply_mode(self, resume_text, llm_scan):
+        """
+        Apply the scan mode to a full scan Claude made as part of another
+        call (fused mode)
+
+        Args:
+            resume_text (str): Resume text content
+            llm_scan (ATSScanResult): Claude's scan
+
+        Returns:
+            ATSScanResult: Claude's scan in llm mode, the local rules' scan in
+                fast mode, or both combined in hybrid mode
+        """
+        if self.mode == 'fast':
+            return self.rule_engine.scan(resume_text)
+        if self.mode == 'llm':
+            return llm_scan
+
+        issues = llm_scan.issues if isinstance(llm_scan.issues, dict) else {}
+        return self._combine(
+            self.rule_engine.scan(resume_text),
+            content_score=llm_scan.ats_score,
+            section_readability=llm_scan.section_readability,
+            content_issues=issues.get('content', []),
+            keyword_issues=issues.get('keywords', []),
+            recommendations=llm_scan.recommendations
+        )
+
+    def _scan_hybrid(self, resume_text):
+        """Run the local rules, then ask Claude only the judgment questions"""
+        local = self.rule_engine.scan(resume_text)
+
+        present_sections = [
+            name for name, grade in local.section_readability.items()
+            if grade != 'missing' and name != 'contact'
+        ]
+        local_findings = [
+            issue for category in local.issues.values() for issue in category
+        ]
+
+        prompt = PromptBudget.build_prompt(
+            'ats_scan', ATS_RESIDUAL_PROMPT, resume_text,
+            local_findings=PromptBudget.compact_json(local_findings or ['No issues found']),
+            present_sections=', '.join(present_sections) or 'none'
+        )
+        response_data = self.claude_service.send_prompt_with_json(
+            prompt=prompt,
+            system_message=SYSTEM_MESSAGE,
+            step='ats'
+        )
+
+        return self._combine(
+            local,
+            content_score=response_data.get('content_score', local.ats_score),
+            section_readability=response_data.get('section_readability', {}),
+            content_issues=response_data.get('content', []),
+            keyword_issues=response_data.get('keywords', []),
+            recommendations=response_data.get('recommendations', [])
+        )
+
+    def _combine(self, local, content_score, section_readability, content_issues,
+                 keyword_issues, recommendations):
+        """Combine the local rules' scan with Claude's judgment (hybrid mode)"""
+        present_sections = [
+            name for name, grade in local.section_readability.items()
+            if grade != 'missing' and name != 'contact'
+        ]
+
+        # Local rules own formatting and section presence; Claude grades
+        # the quality of the sections that exist
+        graded = dict(local.section_readability)
+        for name, grade in (section_readability or {}).items():
+            if name in present_sections and grade in self.READABILITY_GRADES:
+                graded[name] = grade
+
+        try:
+            ats_score = round(
+                (1 - self.HYBRID_LLM_WEIGHT) * local.ats_score
+                + self.HYBRID_LLM_WEIGHT * float(content_score)
+            )
+        except (TypeError, ValueError):
+            ats_score = local.ats_score
+
+        merged = []
+        for recommendation in list(recommendations or []) + local.recommendations:
+            if recommendation not in merged:
+                merged.append(recommendation)
+
+        return ATSScanResult(
+            ats_score=max(0, min(100, ats_score)),
+            issues={
+                'formatting': local.issues['formatting'],
+                'content': local.issues['content'] + list(content_issues or []),
+                'keywords': local.issues['keywords'] + list(keyword_issues or [])
+            },
+            section_readability=graded,
+            recommendations=merged[:5]
+        )
@@ -0,0 +1,235 @@
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from config import Config
+from services.claude_service import ClaudeService
+from services.rate_limiter import RateLimiter
+from services.job_analyzer import JobAnalyzer
+from services.ats_scanner import ATSScanner
+from services.analysis_pipeline import AnalysisPipeline
+from services.circuit_breaker import CircuitOpenError
+from services.pipeline_executor import InlineExecutor
+
+
+# Process-wide pool so concurrent batches share one concurrency limit
+_batch_executor = None
+_batch_executor_lock = threading.Lock()
+
+
+def get_batch_executor():
+    """
+    Get the process-wide thread pool that runs per-resume analyses
+
+    Returns:
+        ThreadPoolExecutor: Bounded pool sized by Config.BATCH_MAX_CONCURRENCY
+    """
+    global _batch_executor
+
+    if _batch_executor is None:
+        with _batch_executor_lock:
+            if _batch_executor is None:
+                _batch_executor = ThreadPoolExecutor(
+                    max_workers=Config.BATCH_MAX_CONCURRENCY,
+                    thread_name_prefix='batch'
+                )
+
+    return _batch_executor
+
+
+# Comparisons are interactive, so they get their own pool rather than
+# waiting behind bulk batches for batch workers
+_compare_executor = None
+_compare_executor_lock = threading.Lock()
+
+
+def get_compare_executor():
+    """
+    Get the process-wide thread pool that runs per-posting comparisons
+
+    Returns:
+        ThreadPoolExecutor: Bounded pool sized by Config.COMPARE_MAX_CONCURRENCY
+    """
+    global _compare_executor
+
+    if _compare_executor is None:
+        with _compare_executor_lock:
+            if _compare_executor is None:
+                _compare_executor = ThreadPoolExecutor(
+                    max_workers=Config.COMPARE_MAX_CONCURRENCY,
+                    thread_name_prefix='compare'
+                )
+
+    return _compare_executor
+
+
+class BatchAnalyzer:
+    """
+    Runs the pipeline for many resumes or many job descriptions at once
+
+    Screening many resumes against one job description runs Step 1 once
+    and fans Steps 2-4 out per resume. Comparing one resume against many
+    job descriptions runs Step 3 once and fans Steps 1, 2 and 4 out per
+    job description. Both use a bounded worker pool, and each item's steps
+    run inline on its pool thread, so a batch never queues work on the
+    pipeline pool that interactive requests use.
+    """
+
+    def __init__(self, claude_service=None, executor=None):
+        """
+        Args:
+            claude_service (ClaudeService): Service shared by every analysis
+                in the batch (default: new bulk-priority service on the shared client)
+            executor (Executor): Pool for per-resume analyses (default: shared batch pool)
+        """
+        # Batches yield rate limit capacity to interactive requests
+        self.claude_service = claude_service or ClaudeService(priority=RateLimiter.BULK)
+        self.executor = executor or get_batch_executor()
+
+    def analyze_job(self, job_description):
+        """
+        Run Step 1 once for the whole batch
+
+        Args:
+            job_description (str): Job description text
+
+        Returns:
+            JobAnalysisResult: Structured job analysis data
+
+        Raises:
+            Exception: If analysis fails
+        """
+        return JobAnalyzer(self.claude_service).analyze_job_description(job_description)
+
+    def iter_resume_analyses(self, job_description, job_analysis, resumes):
+        """
+        Run Steps 2-4 for every resume, yielding results as they complete
+
+        Args:
+            job_description (str): Job description text
+            job_analysis (JobAnalysisResult): Shared Step 1 result
+            resumes (list): Dicts with 'name' and 'text' for each resume
+
+        Yields:
+            dict: One result per resume, in completion order, with the
+                resume's index and name and either 'results' or 'error'
+        """
+        futures = {
+            self.executor.submit(
+                self._analyze_one, job_description, job_analysis, resume
+            ): (index, resume)
+            for index, resume in enumerate(resumes)
+        }
+
+        try:
+            for future in as_completed(futures):
+                index, resume = futures[future]
+                entry = {'index': index, 'name': resume['name']}
+
+                try:
+                    entry.update(future.result())
+                except Exception as e:
+                    print(f"Batch analysis failed for {resume['name']}: {str(e)}")
+                    entry.update({'success': False, 'error': f'Analysis failed: {str(e)}'})
+
+                yield entry
+        finally:
+            # The client went away or the caller stopped early
+            for future in futures:
+                future.cancel()
+
+    def _analyze_one(self, job_description, job_analysis, resume):
+        """Run Steps 2-4 for one resume against the shared Step 1 result"""
+        analysis_id = str(uuid.uuid4())
+        result = AnalysisPipeline(
+            executor=InlineExecutor(), claude_service=self.claude_service
+        ).run(
+            analysis_id, resume['text'], job_description, job_analysis=job_analysis
+        )
+        return result.to_dict()
+
+    def compare_job_descriptions(self, resume_text, job_descriptions, optimize=True):
+        """
+        Analyze one resume against many job descriptions and rank them
+
+        Args:
+            resume_text (str): Resume text content
+            job_descriptions (list): Job description texts
+            optimize (bool): Set to False to skip Step 4 for every posting
+
+        Returns:
+            dict: The shared ATS scan, the successful analyses ranked by
+                match score (best first), and the postings that failed
+
+        Raises:
+            CircuitOpenError: If Claude is unavailable and degraded mode is off
+        """
+        # Step 3 depends only on the resume, so it runs once
+        ats_scanner = ATSScanner(self.claude_service)
+        degraded_steps = []
+        try:
+            ats_scan = ats_scanner.scan_ats_compatibility(resume_text)
+        except CircuitOpenError:
+            if not Config.CIRCUIT_BREAKER_DEGRADED_MODE:
+                raise
+            print("Claude unavailable, using local ats_scan result")
+            ats_scan = ats_scanner.rule_engine.scan(resume_text)
+            degraded_steps.append('ats_scan')
+
+        futures = {
+            self.executor.submit(
+                self._analyze_posting, resume_text, job_description, ats_scan, optimize
+            ): index
+            for index, job_description in enumerate(job_descriptions)
+        }
+
+        ranking = []
+        failed = []
+        try:
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"Comparison failed for job description {index}: {str(e)}")
+                    failed.append({'index': index, 'error': f'Analysis failed: {str(e)}'})
+                    continue
+
+                results = result['results']
+                # The ATS scan is identical for every posting; report it once
+                results.pop('step3_ats_scan', None)
+                if not optimize:
+                    results.pop('step4_optimized_resume', None)
+                ranking.append({
+                    'index': index,
+                    'analysis_id': result['analysis_id'],
+                    'match_score': results['step2_gap_analysis'].get('match_score', 0),
+                    'results': results
+                })
+        finally:
+            for future in futures:
+                future.cancel()
+
+        ranking.sort(key=lambda entry: (-entry['match_score'], entry['index']))
+        for rank, entry in enumerate(ranking, start=1):
+            entry['rank'] = rank
+
+        comparison = {
+            'ats_scan': ats_scan.to_dict(),
+            'ranking': ranking,
+            'failed': sorted(failed, key=lambda entry: entry['index'])
+        }
+        if degraded_steps:
+            comparison['degraded'] = True
+            comparison['degraded_steps'] = degraded_steps
+        return comparison
+
+    def _analyze_posting(self, resume_text, job_description, ats_scan, optimize):
+        """Run Steps 1, 2 and 4 for one posting against the shared ATS scan"""
+        analysis_id = str(uuid.uuid4())
+        result = AnalysisPipeline(
+            executor=InlineExecutor(), claude_service=self.claude_service
+        ).run(
+            analysis_id, resume_text, job_description,
+            ats_scan=ats_scan, optimize=optimize
+        )
+        return result.to_dict()
@@ -0,0 +1,201 @@
+import math
+import threading
+import time
+from collections import deque
+from config import Config
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling Claude while the circuit breaker is open"""
+
+    def __init__(self, message, retry_after=0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for the Claude API dependency
+
+    Tracks the outcome of recent calls in a sliding time window. When the
+    share of failed or slow calls crosses the threshold, the circuit opens
+    and calls fail immediately with CircuitOpenError instead of tying up a
+    worker in the retry chain. After a cool-down a limited number of trial
+    calls are let through (half-open); success closes the circuit, failure
+    opens it again.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_rate=0.5, min_calls=10, window=60, slow_call_seconds=60,
+                 open_seconds=30, half_open_calls=1):
+        """
+        Args:
+            failure_rate (float): Share of failed or slow calls that opens the circuit
+            min_calls (int): Calls needed in the window before the rate is trusted
+            window (float): Seconds of call history considered
+            slow_call_seconds (float): Calls slower than this count as failures
+            open_seconds (float): Seconds the circuit stays open before a trial call
+            half_open_calls (int): Trial calls allowed at once while half-open
+        """
+        self.failure_rate = failure_rate
+        self.min_calls = max(1, min_calls)
+        self.window = window
+        self.slow_call_seconds = slow_call_seconds
+        self.open_seconds = open_seconds
+        self.half_open_calls = max(1, half_open_calls)
+
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._trial_calls = 0
+        self._calls = deque()  # (timestamp, failed)
+        self._times_opened = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def before_call(self):
+        """
+        Get permission to make a call
+
+        Every successful before_call() must be followed by one record().
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with its
+                trial calls already in flight
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+
+            if state == self.CLOSED:
+                return
+
+            if state == self.HALF_OPEN and self._trial_calls < self.half_open_calls:
+                self._state = self.HALF_OPEN
+                self._trial_calls += 1
+                return
+
+            self._rejected += 1
+            retry_after = max(0.0, self._opened_at + self.open_seconds - now)
+            raise CircuitOpenError(
+                f"Claude API circuit is open after repeated failures; retry in {math.ceil(retry_after)}s",
+                retry_after=retry_after
+            )
+
+    def record(self, failed, latency=None):
+        """
+        Record the outcome of a call
+
+        Args:
+            failed (bool): True if the call failed in a way that suggests the
+                API is unhealthy (timeouts, 5xx, rate limits)
+            latency (float): Call duration in seconds, if it should be
+                checked against slow_call_seconds
+        """
+        if latency is not None and latency >= self.slow_call_seconds:
+            failed = True
+
+        with self._lock:
+            now = time.monotonic()
+
+            if self._state == self.HALF_OPEN:
+                self._trial_calls = max(0, self._trial_calls - 1)
+                if failed:
+                    self._open(now)
+                elif self._trial_calls == 0:
+                    print("Claude API circuit closed")
+                    self._state = self.CLOSED
+                    self._calls.clear()
+                return
+
+            if self._state == self.OPEN:
+                # A call that started before the circuit opened
+                return
+
+            self._calls.append((now, failed))
+            self._prune(now)
+
+            failures = sum(1 for _, call_failed in self._calls if call_failed)
+            if len(self._calls) >= self.min_calls and failures / len(self._calls) >= self.failure_rate:
+                self._open(now)
+
+    def stats(self):
+        """
+        Get breaker state for health reporting
+
+        Returns:
+            dict: State, recent call and failure counts, and times opened
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            self._prune(now)
+            failures = sum(1 for _, call_failed in self._calls if call_failed)
+
+            stats = {
+                'state': state,
+                'recent_calls': len(self._calls),
+                'recent_failures': failures,
+                'times_opened': self._times_opened,
+                'rejected_calls': self._rejected
+            }
+            if state == self.OPEN:
+                stats['retry_after'] = round(max(0.0, self._opened_at + self.open_seconds - now), 1)
+            return stats
+
+    def _current_state(self, now):
+        """State, with an open circuit turning half-open once its cool-down ends"""
+        if self._state == self.OPEN and now - self._opened_at >= self.open_seconds:
+            return self.HALF_OPEN
+        return self._state
+
+    def _open(self, now):
+        """Open the circuit (caller holds the lock)"""
+        print(f"Claude API circuit opened for {self.open_seconds:g}s")
+        self._state = self.OPEN
+        self._opened_at = now
+        self._trial_calls = 0
+        self._times_opened += 1
+        self._calls.clear()
+
+    def _prune(self, now):
+        """Forget calls older than the window (caller holds the lock)"""
+        while self._calls and now - self._calls[0][0] > self.window:
+            self._calls.popleft()
+
+
+_circuit_breaker = None
+_circuit_breaker_lock = threading.Lock()
+
+
+def get_circuit_breaker():
+    """
+    Get the process-wide circuit breaker for the Claude API
+
+    Returns:
+        CircuitBreaker: Shared breaker, or None if disabled
+    """
+    global _circuit_breaker
+
+    if not Config.CIRCUIT_BREAKER_ENABLED:
+        return None
+
+    if _circuit_breaker is None:
+        with _circuit_breaker_lock:
+            if _circuit_breaker is None:
+                _circuit_breaker = CircuitBreaker(
+                    failure_rate=Config.CIRCUIT_BREAKER_FAILURE_RATE,
+                    min_calls=Config.CIRCUIT_BREAKER_MIN_CALLS,
+                    window=Config.CIRCUIT_BREAKER_WINDOW,
+                    slow_call_seconds=Config.CIRCUIT_BREAKER_SLOW_CALL,
+                    open_seconds=Config.CIRCUIT_BREAKER_OPEN_SECONDS
+                )
+
+    return _circuit_breaker
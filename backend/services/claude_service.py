@@ -1,83 +1,323 @@
 import anthropic
+import copy
+import httpx
 import json
+import threading
 import time
+from contextlib import contextmanager
 from config import Config
+from services.response_cache import get_response_cache
+from services.rate_limiter import RateLimiter, get_rate_limiter
+from services.prompt_budget import PromptBudget
+from services.retry_policy import RetryPolicy, DeadlineExceededError
+from services.circuit_breaker import CircuitOpenError, get_circuit_breaker
+
+
+# One client per worker process; anthropic.Anthropic is thread-safe and
+# reuses pooled keep-alive connections across requests
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_client():
+    """
+    Get the process-wide Claude client, creating it on first use
+
+    Returns:
+        anthropic.Anthropic: Shared client backed by a pooled HTTP connection pool
+
+    Raises:
+        ValueError: If CLAUDE_API_KEY is not configured
+    """
+    global _shared_client
+
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                if not Config.CLAUDE_API_KEY:
+                    raise ValueError("CLAUDE_API_KEY not configured")
+
+                http_client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=Config.CLAUDE_POOL_MAX_CONNECTIONS,
+                        max_keepalive_connections=Config.CLAUDE_POOL_MAX_KEEPALIVE,
+                        keepalive_expiry=Config.CLAUDE_KEEPALIVE_EXPIRY
+                    )
+                )
+                # Retries are handled by ClaudeService's RetryPolicy, so the
+                # SDK's own retries would only multiply the attempts
+                _shared_client = anthropic.Anthropic(
+                    api_key=Config.CLAUDE_API_KEY,
+                    http_client=http_client,
+                    max_retries=0
+                )
+
+    return _shared_client
 
 
 class ClaudeService:
     """Service for interacting with Claude API"""
 
-    def __init__(self):
-        """Initialize Claude client"""
-        if not Config.CLAUDE_API_KEY:
-            raise ValueError("CLAUDE_API_KEY not configured")
+    # Settings for calls without a routed step (see Config.MODEL_ROUTING)
+    DEFAULT_MAX_TOKENS = 4096
+    DEFAULT_TEMPERATURE = 0.7
+    JSON_TEMPERATURE = 0.3
+
+    # Calls allowed more output than this (the optimizer's 8192) can
+    # legitimately outlast the breaker's slow-call threshold, so only their
+    # errors count, as for streams
+    LATENCY_TRACKED_MAX_TOKENS = 2048
+
+    def __init__(self, client=None, response_cache=None, rate_limiter=None,
+                 priority=RateLimiter.INTERACTIVE, retry_policy=None, deadline=None,
+                 circuit_breaker=None):
+        """
+        Initialize Claude service
+
+        Args:
+            client (anthropic.Anthropic): Client to use (default: shared process-wide client)
+            response_cache (ResponseCache): Cache for JSON responses (default: shared cache, if enabled)
+            rate_limiter (RateLimiter): Quota guard (default: shared process-wide limiter)
+            priority (str): 'interactive' for requests a user is waiting on,
+                'bulk' for batch work that yields to them
+            retry_policy (RetryPolicy): When to retry failed calls (default: from Config)
+            deadline (Deadline): Time budget shared by every call made through
+                this service (default: none)
+            circuit_breaker (CircuitBreaker): Fails calls fast while the API is
+                unhealthy (default: shared process-wide breaker, if enabled)
+        """
+        self.client = client or get_shared_client()
+        self.response_cache = response_cache or get_response_cache()
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.priority = priority
+        self.retry_policy = retry_policy or RetryPolicy.from_config()
+        self.deadline = deadline
+        self.circuit_breaker = circuit_breaker or get_circuit_breaker()
+        self.model = Config.CLAUDE_MODEL  # Default for steps without a route
+        self._usage = {'api_calls': 0, 'input_tokens': 0, 'output_tokens': 0}
+        self._routing = {}  # step -> settings used
+        self._usage_lock = threading.Lock()
+
+    def session(self):
+        """
+        Get a copy of this service that counts its own API usage
+
+        The copy shares the client, caches, limiter and breaker, so one
+        analysis can report its token usage and routing while sharing a
+        service with other concurrent analyses.
+
+        Returns:
+            ClaudeService: Service with zeroed usage counters
+        """
+        service = copy.copy(self)
+        service._usage = {key: 0 for key in self._usage}
+        service._routing = {}
+        service._usage_lock = threading.Lock()
+        return service
+
+    def route(self, step=None, max_tokens=None, temperature=None):
+        """
+        Get the model settings for a pipeline step
+
+        Explicit arguments win over the step's entry in Config.MODEL_ROUTING,
+        which wins over the service defaults.
+
+        Args:
+            step (str): 'job', 'gap', 'ats', 'optimize' or 'fused' (None = defaults)
+            max_tokens (int): Override the routed max_tokens
+            temperature (float): Override the routed temperature
+
+        Returns:
+            dict: model, max_tokens and temperature
+        """
+        settings = {
+            'model': self.model,
+            'max_tokens': self.DEFAULT_MAX_TOKENS,
+            'temperature': self.DEFAULT_TEMPERATURE
+        }
+        settings.update(Config.MODEL_ROUTING.get(step) or {})
+        if max_tokens is not None:
+            settings['max_tokens'] = max_tokens
+        if temperature is not None:
+            settings['temperature'] = temperature
+
+        return settings
 
-        self.client = anthropic.Anthropic(api_key=Config.CLAUDE_API_KEY)
-        self.model = "claude-sonnet-4-5-20250929"  # Latest Sonnet 4.5
-        self.max_retries = 3
-        self.retry_delay = 2  # seconds
+    def get_routing(self):
+        """
+        Get the settings each routed step used for calls sent through this
+        service (steps answered from a cache are not included)
+
+        Returns:
+            dict: step -> model, max_tokens and temperature
+        """
+        with self._usage_lock:
+            return {step: dict(settings) for step, settings in self._routing.items()}
 
-    def send_prompt(self, prompt, system_message="", max_tokens=4096, temperature=0.7):
+    def get_usage(self):
+        """
+        Get the API usage counted by this service
+
+        Returns:
+            dict: api_calls, input_tokens and output_tokens (cache hits excluded)
+        """
+        with self._usage_lock:
+            return dict(self._usage)
+
+    def send_prompt(self, prompt, system_message="", max_tokens=None, temperature=None, step=None):
         """
         Send a prompt to Claude and get response
 
         Args:
             prompt (str): The user prompt
             system_message (str): Optional system message
-            max_tokens (int): Maximum tokens in response
-            temperature (float): Temperature for response generation
+            max_tokens (int): Maximum tokens in response (default: routed)
+            temperature (float): Temperature for response generation (default: routed)
+            step (str): Pipeline step whose model route to use
 
         Returns:
             str: Claude's response text
 
         Raises:
+            DeadlineExceededError: If the call can't finish before the deadline
+            CircuitOpenError: If the circuit breaker is open
             Exception: If API call fails after retries
         """
-        for attempt in range(self.max_retries):
+        settings = self.route(step, max_tokens, temperature)
+
+        delay = 0
+        attempt = 0
+        while True:
+            attempt += 1
+            reserved = 0
             try:
                 messages = [{"role": "user", "content": prompt}]
 
                 kwargs = {
-                    "model": self.model,
-                    "max_tokens": max_tokens,
+                    "model": settings['model'],
+                    "max_tokens": settings['max_tokens'],
                     "messages": messages,
-                    "temperature": temperature
+                    "temperature": settings['temperature']
                 }
 
                 if system_message:
                     kwargs["system"] = system_message
 
-                response = self.client.messages.create(**kwargs)
+                reserved = self._reserve(prompt, system_message, settings['max_tokens'])
+                deadline_bound = self._apply_deadline(kwargs)
+                track_latency = settings['max_tokens'] <= self.LATENCY_TRACKED_MAX_TOKENS
+                with self._guard(track_latency=track_latency, deadline_bound=deadline_bound):
+                    self._record_route(step, settings)
+                    response = self.client.messages.create(**kwargs)
+                self._record_usage(response, reserved)
 
                 # Extract text from response
                 return response.content[0].text
 
-            except anthropic.RateLimitError as e:
-                if attempt < self.max_retries - 1:
-                    wait_time = self.retry_delay * (2 ** attempt)  # Exponential backoff
-                    print(f"Rate limit hit, retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                else:
-                    raise Exception(f"Rate limit exceeded: {str(e)}")
+            except (DeadlineExceededError, CircuitOpenError):
+                # The call was never made
+                self.rate_limiter.reconcile(reserved, 0)
+                raise
+
+            except anthropic.APIError as e:
+                delay = self._retry_delay(e, attempt, delay, reserved)
+                print(f"{self._describe(e)}, retrying in {delay:.1f}s...")
+                time.sleep(delay)
+
+            except Exception as e:
+                raise Exception(f"Unexpected error calling Claude: {str(e)}")
+
+    def stream_prompt(self, prompt, system_message="", max_tokens=None, temperature=None, step=None):
+        """
+        Send a prompt to Claude and yield the response text as it is generated
+
+        Failures before the first chunk are retried like send_prompt; once
+        text has been yielded the error is raised to the caller. If the
+        stream ends early (an error, or the consumer closing the generator),
+        the rate limit reservation is settled with the text received so far.
+
+        Args:
+            prompt (str): The user prompt
+            system_message (str): Optional system message
+            max_tokens (int): Maximum tokens in response (default: routed)
+            temperature (float): Temperature for response generation (default: routed)
+            step (str): Pipeline step whose model route to use
+
+        Yields:
+            str: Chunks of Claude's response text
+
+        Raises:
+            DeadlineExceededError: If the call can't finish before the deadline
+            CircuitOpenError: If the circuit breaker is open
+            Exception: If API call fails after retries
+        """
+        settings = self.route(step, max_tokens, temperature)
+        kwargs = {
+            "model": settings['model'],
+            "max_tokens": settings['max_tokens'],
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": settings['temperature']
+        }
+
+        if system_message:
+            kwargs["system"] = system_message
+
+        delay = 0
+        attempt = 0
+        while True:
+            attempt += 1
+            streamed = []
+            settled = False
+            reserved = 0
+            try:
+                reserved = self._reserve(prompt, system_message, settings['max_tokens'])
+                deadline_bound = self._apply_deadline(kwargs)
+                # Stream duration depends on output length, so only errors count
+                with self._guard(track_latency=False, deadline_bound=deadline_bound), self.client.messages.stream(**kwargs) as stream:
+                    self._record_route(step, settings)
+                    for text in stream.text_stream:
+                        streamed.append(text)
+                        yield text
+                    self._record_usage(stream.get_final_message(), reserved)
+                    settled = True
+                return
+
+            except (DeadlineExceededError, CircuitOpenError):
+                # The call was never made
+                self.rate_limiter.reconcile(reserved, 0)
+                raise
 
             except anthropic.APIError as e:
-                if attempt < self.max_retries - 1:
-                    wait_time = self.retry_delay * (2 ** attempt)
-                    print(f"API error, retrying in {wait_time}s...")
-                    time.sleep(wait_time)
-                else:
-                    raise Exception(f"Claude API error: {str(e)}")
+                if streamed:
+                    raise Exception(f"Claude API error during streaming: {str(e)}")
+                delay = self._retry_delay(e, attempt, delay, reserved)
+                print(f"{self._describe(e)}, retrying stream in {delay:.1f}s...")
+                time.sleep(delay)
 
             except Exception as e:
                 raise Exception(f"Unexpected error calling Claude: {str(e)}")
 
-    def send_prompt_with_json(self, prompt, system_message=""):
+            finally:
+                if streamed and not settled:
+                    # No final usage for a cut-off stream; charge the input
+                    # estimate and the text generated so far
+                    input_estimate = reserved - settings['max_tokens']
+                    self.rate_limiter.reconcile(
+                        reserved, input_estimate + PromptBudget.estimate_tokens(''.join(streamed))
+                    )
+
+    def send_prompt_with_json(self, prompt, system_message="", use_cache=True, step=None):
         """
         Send prompt and expect JSON response
 
+        Identical requests are answered from the response cache, so retried
+        and duplicate submissions don't hit the API twice.
+
         Args:
             prompt (str): The user prompt
             system_message (str): Optional system message
+            use_cache (bool): Set to False to always call the API
+            step (str): Pipeline step whose model route to use
 
         Returns:
             dict: Parsed JSON response
@@ -85,8 +325,193 @@ class ClaudeService:
         Raises:
             Exception: If response is not valid JSON
         """
-        response_text = self.send_prompt(prompt, system_message, temperature=0.3)
+        if step in Config.MODEL_ROUTING:
+            settings = self.route(step)
+        else:
+            settings = self.route(step, temperature=self.JSON_TEMPERATURE)
+        cache = self.response_cache if use_cache else None
+        cache_key = None
+
+        if cache is not None:
+            # Keyed by the routed model, so changing a route doesn't serve stale answers
+            cache_key = cache.make_key(
+                prompt, system_message, settings['model'], settings['temperature'],
+                settings['max_tokens']
+            )
+            cached_text = cache.get(cache_key)
+            if cached_text is not None:
+                return self._parse_json(cached_text)
+
+        response_text = self.send_prompt(
+            prompt, system_message, max_tokens=settings['max_tokens'],
+            temperature=settings['temperature'], step=step
+        )
+        parsed = self._parse_json(response_text)
+
+        # Only cache responses that parsed, so a bad reply can be retried
+        if cache is not None:
+            cache.set(cache_key, response_text)
+
+        return parsed
+
+    def _reserve(self, prompt, system_message, max_tokens):
+        """
+        Wait for rate limit capacity for one API call
+
+        Returns:
+            int: Tokens reserved (estimated input plus max_tokens)
+
+        Raises:
+            DeadlineExceededError: If the deadline passes before capacity frees up
+        """
+        if self.deadline is not None:
+            self.deadline.check("calling Claude")
+
+        estimate = PromptBudget.estimate_tokens(prompt) + PromptBudget.estimate_tokens(system_message)
+        timeout = self.deadline.remaining() if self.deadline is not None else None
+        return self.rate_limiter.acquire(estimate + max_tokens, self.priority, timeout=timeout)
+
+    @contextmanager
+    def _guard(self, track_latency, deadline_bound=False):
+        """
+        Run one API call through the circuit breaker, recording its outcome
+
+        Args:
+            track_latency (bool): Count calls slower than the breaker's
+                slow-call threshold as failures
+            deadline_bound (bool): The call's timeout was cut to the time
+                left before the request's deadline
+        """
+        breaker = self.circuit_breaker
+        if breaker is None:
+            yield
+            return
+
+        breaker.before_call()
+        started_at = time.monotonic()
+        try:
+            yield
+        except anthropic.APITimeoutError:
+            # A timeout shortened by our own deadline says nothing about the API's health
+            breaker.record(failed=not deadline_bound)
+            raise
+        except anthropic.APIError as e:
+            # Bad requests say nothing about the API's health
+            breaker.record(failed=RetryPolicy.is_transient(e))
+            raise
+        except BaseException:
+            breaker.record(failed=False)
+            raise
+        breaker.record(
+            failed=False,
+            latency=(time.monotonic() - started_at) if track_latency else None
+        )
+
+    def _apply_deadline(self, kwargs):
+        """
+        Limit the API call's timeout to the time left before the deadline
+
+        Returns:
+            bool: True if the deadline set the call's timeout
+        """
+        if self.deadline is None:
+            return False
+        self.deadline.check("calling Claude")
+        kwargs["timeout"] = self.deadline.remaining()
+        return True
+
+    def _retry_delay(self, error, attempt, previous_delay, reserved):
+        """
+        Decide how long to wait before retrying a failed API call
 
+        Args:
+            error (anthropic.APIError): Error raised by the attempt
+            attempt (int): Number of the attempt that failed, from 1
+            previous_delay (float): Delay before the previous retry
+            reserved (int): Tokens reserved for the failed attempt
+
+        Returns:
+            float: Seconds to wait before the next attempt
+
+        Raises:
+            DeadlineExceededError: If the retry could not finish before the deadline
+            Exception: If the error should not be retried
+        """
+        rate_limited = isinstance(error, anthropic.RateLimitError)
+        if rate_limited:
+            # Rejected requests use no quota
+            self.rate_limiter.reconcile(reserved, 0)
+
+        if not self.retry_policy.should_retry(error, attempt):
+            if rate_limited:
+                raise Exception(f"Rate limit exceeded: {str(error)}")
+            raise Exception(f"Claude API error: {str(error)}")
+
+        delay = self.retry_policy.next_delay(previous_delay, error)
+        if self.deadline is not None and delay >= self.deadline.remaining():
+            raise DeadlineExceededError(
+                f"Deadline of {self.deadline.seconds:g}s leaves no time to retry: {str(error)}"
+            )
+
+        if rate_limited:
+            # Every worker pauses, not just this one
+            self.rate_limiter.backoff(delay)
+
+        return delay
+
+    @staticmethod
+    def _describe(error):
+        """Short description of an API error for log lines"""
+        if isinstance(error, anthropic.RateLimitError):
+            return "Rate limit hit"
+        if isinstance(error, anthropic.APITimeoutError):
+            return "API timeout"
+        return "API error"
+
+    def _record_route(self, step, settings):
+        """Record the settings a routed step's call is being sent with"""
+        if step is None:
+            return
+        with self._usage_lock:
+            self._routing[step] = dict(settings)
+
+    def _record_usage(self, response, reserved):
+        """
+        Count a finished call's token usage and settle its rate limit reservation
+
+        Args:
+            response: Message returned by the API
+            reserved (int): Tokens reserved for the call
+        """
+        usage = getattr(response, 'usage', None)
+        try:
+            input_tokens = int(usage.input_tokens)
+            output_tokens = int(usage.output_tokens)
+        except (AttributeError, TypeError, ValueError):
+            # Usage unavailable; the reservation stands as the estimate
+            input_tokens = output_tokens = 0
+        else:
+            self.rate_limiter.reconcile(reserved, input_tokens + output_tokens)
+
+        with self._usage_lock:
+            self._usage['api_calls'] += 1
+            self._usage['input_tokens'] += input_tokens
+            self._usage['output_tokens'] += output_tokens
+
+    @staticmethod
+    def _parse_json(response_text):
+        """
+        Parse JSON from a Claude response
+
+        Args:
+            response_text (str): Raw response text
+
+        Returns:
+            dict: Parsed JSON response
+
+        Raises:
+            Exception: If response is not valid JSON
+        """
         try:
             # Try to extract JSON from response (handle markdown code blocks)
             json_text = response_text.strip()
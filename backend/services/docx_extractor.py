@@ -0,0 +1,93 @@
+import zipfile
+import xml.etree.ElementTree as ET
+
+
+W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+_P = W_NS + 'p'
+_T = W_NS + 't'
+_TAB = W_NS + 'tab'
+_BR = W_NS + 'br'
+_CR = W_NS + 'cr'
+_PPR = W_NS + 'pPr'
+_NUMPR = W_NS + 'numPr'
+_PSTYLE = W_NS + 'pStyle'
+_VAL = W_NS + 'val'
+_BODY = W_NS + 'body'
+
+LIST_BULLET = '• '
+
+
+class DocxExtractor:
+    """
+    Extracts body text from a DOCX by streaming word/document.xml
+
+    Only the main document part is read from the archive; images, headers
+    and other parts are never decompressed. Each paragraph becomes one
+    line and list items are prefixed with a bullet, so section headers stay
+    on lines of their own.
+    """
+
+    @staticmethod
+    def extract_text(source):
+        """
+        Extract text from a DOCX file
+
+        Args:
+            source (str or file-like): Path to the DOCX or a binary stream
+
+        Returns:
+            str: Document text, one paragraph per line
+
+        Raises:
+            KeyError: If the archive has no word/document.xml
+            zipfile.BadZipFile: If the file is not a DOCX archive
+            xml.etree.ElementTree.ParseError: If the document XML is malformed
+        """
+        with zipfile.ZipFile(source) as archive:
+            with archive.open('word/document.xml') as document:
+                return '\n'.join(DocxExtractor._iter_paragraphs(document))
+
+    @staticmethod
+    def _iter_paragraphs(document):
+        """Yield the text of each paragraph in document order"""
+        # Paragraphs can nest (e.g. inside text boxes), so keep a stack of
+        # [text parts, is list item] for the paragraphs currently open
+        stack = []
+        in_properties = 0
+
+        for event, elem in ET.iterparse(document, events=('start', 'end')):
+            tag = elem.tag
+
+            if event == 'start':
+                if tag == _P:
+                    stack.append([[], False])
+                elif tag == _PPR:
+                    in_properties += 1
+                continue
+
+            if tag == _PPR:
+                in_properties -= 1
+            elif not stack:
+                pass
+            elif tag == _T:
+                stack[-1][0].append(elem.text or '')
+            elif tag == _TAB and not in_properties:
+                stack[-1][0].append('\t')
+            elif tag in (_BR, _CR):
+                stack[-1][0].append('\n')
+            elif tag == _NUMPR:
+                stack[-1][1] = True
+            elif tag == _PSTYLE and elem.get(_VAL, '').startswith('List'):
+                # Lists numbered through the paragraph style have no numPr
+                stack[-1][1] = True
+            elif tag == _P:
+                parts, is_list_item = stack.pop()
+                text = ''.join(parts)
+                if is_list_item and text.strip():
+                    text = LIST_BULLET + text
+                yield text
+
+            # Free finished paragraphs so memory stays flat for long documents
+            if tag == _P or (tag != _BODY and not stack):
+                elem.clear()
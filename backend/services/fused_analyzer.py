@@ -0,0 +1,113 @@
+from services.claude_service import ClaudeService
+from services.retry_policy import DeadlineExceededError
+from services.circuit_breaker import CircuitOpenError
+from services.prompt_budget import PromptBudget
+from services.job_analyzer import JobAnalyzer
+from services.gap_analyzer import GapAnalyzer
+from services.ats_scanner import ATSScanner
+from services.keyword_matcher import get_keyword_matcher
+from services.job_analysis_cache import get_job_analysis_cache
+from models.prompts import FUSED_ANALYSIS_PROMPT, SYSTEM_MESSAGE
+from models.analysis_models import JobAnalysisResult, GapAnalysisResult, ATSScanResult
+
+
+class FusedAnalyzer:
+    """
+    Runs Steps 1-3 (job analysis, gap analysis, ATS scan) in one Claude call
+
+    Sends the job description and resume once, instead of three round
+    trips that each repeat the system message and resume. The response is
+    parsed into the same result objects the per-step analyzers return,
+    normalized and post-processed the same way, and the ATS scan follows
+    Config.ATS_SCAN_MODE like Step 3 does.
+    """
+
+    def __init__(self, claude_service=None, cache=None, ats_scanner=None):
+        """
+        Args:
+            claude_service (ClaudeService): Service to use (default: new service on the shared client)
+            cache (JobAnalysisCache): Job analysis cache to fill (default: shared cache, if enabled)
+            ats_scanner (ATSScanner): Applies the ATS scan mode (default: new scanner)
+        """
+        self.claude_service = claude_service or ClaudeService()
+        self.cache = cache or get_job_analysis_cache()
+        self.ats_scanner = ats_scanner or ATSScanner(self.claude_service)
+
+    def analyze(self, resume_text, job_description):
+        """
+        Analyze the job description and the resume against it in one call
+
+        Args:
+            resume_text (str): Resume text content
+            job_description (str): Job description text
+
+        Returns:
+            tuple: (JobAnalysisResult, GapAnalysisResult, ATSScanResult)
+
+        Raises:
+            Exception: If analysis fails
+        """
+        try:
+            prompt = PromptBudget.build_prompt(
+                'fused', FUSED_ANALYSIS_PROMPT, resume_text,
+                job_description=job_description
+            )
+
+            response_data = self.claude_service.send_prompt_with_json(
+                prompt=prompt,
+                system_message=SYSTEM_MESSAGE,
+                step='fused'
+            )
+
+            job_data = self._section(response_data, 'job_analysis')
+            gap_data = self._section(response_data, 'gap_analysis')
+            ats_data = self._section(response_data, 'ats_scan')
+
+            job_analysis = JobAnalyzer._normalize(JobAnalysisResult(
+                required_skills=job_data.get('required_skills', []),
+                preferred_skills=job_data.get('preferred_skills', []),
+                key_responsibilities=job_data.get('key_responsibilities', []),
+                ats_keywords=job_data.get('ats_keywords', [])
+            ))
+
+            # Keyed by the model that produced it, the 'fused' route's; fused
+            # runs reuse it, and standard runs do when the 'job' route uses
+            # the same model
+            model = self.claude_service.route('fused')['model']
+            if self.cache is not None and self.cache.get(job_description, model) is None:
+                self.cache.set(job_description, model, job_analysis)
+
+            gap_analysis = GapAnalysisResult(
+                match_score=gap_data.get('match_score', 0),
+                strengths=gap_data.get('strengths', []),
+                gaps=GapAnalyzer._normalize_gaps(gap_data.get('gaps', [])),
+                # Keyword presence is exact matching, so it is computed locally
+                keyword_matches=get_keyword_matcher(job_analysis.ats_keywords).match(resume_text)
+            )
+
+            ats_scan = self.ats_scanner.apply_mode(resume_text, ATSScanResult(
+                ats_score=ats_data.get('ats_score', 0),
+                issues=ats_data.get('issues', {
+                    "formatting": [],
+                    "content": [],
+                    "keywords": []
+                }),
+                section_readability=ats_data.get('section_readability', {}),
+                recommendations=ats_data.get('recommendations', [])
+            ))
+
+            return job_analysis, gap_analysis, ats_scan
+
+        except (DeadlineExceededError, CircuitOpenError):
+            raise
+
+        except Exception as e:
+            raise Exception(f"Fused analysis failed: {str(e)}")
+
+    @staticmethod
+    def _section(response_data, key):
+        """Get one part of the fused response"""
+        section = response_data.get(key)
+        if not isinstance(section, dict):
+            raise ValueError(f"Response is missing '{key}'")
+        return section
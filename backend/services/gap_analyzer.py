@@ -1,5 +1,9 @@
-import json
 from services.claude_service import ClaudeService
+from services.retry_policy import DeadlineExceededError
+from services.circuit_breaker import CircuitOpenError
+from services.prompt_budget import PromptBudget
+from services.keyword_matcher import get_keyword_matcher
+from services.skill_taxonomy import get_skill_taxonomy
 from models.prompts import GAP_ANALYSIS_PROMPT, SYSTEM_MESSAGE
 from models.analysis_models import GapAnalysisResult, JobAnalysisResult
 
@@ -7,8 +11,12 @@ from models.analysis_models import GapAnalysisResult, JobAnalysisResult
 class GapAnalyzer:
     """Service for analyzing resume gaps against job requirements (Step 2)"""
 
-    def __init__(self):
-        self.claude_service = ClaudeService()
+    def __init__(self, claude_service=None):
+        """
+        Args:
+            claude_service (ClaudeService): Service to use (default: new service on the shared client)
+        """
+        self.claude_service = claude_service or ClaudeService()
 
     def analyze_resume_gaps(self, resume_text, job_analysis):
         """
@@ -31,30 +39,120 @@ class GapAnalyzer:
             else:
                 job_analysis_dict = job_analysis
 
-            # Format job analysis as readable text
-            job_analysis_text = json.dumps(job_analysis_dict, indent=2)
-
-            # Format prompt
-            prompt = GAP_ANALYSIS_PROMPT.format(
-                resume_text=resume_text,
-                job_analysis=job_analysis_text
+            # Format prompt with only the resume sections this step needs
+            prompt = PromptBudget.build_prompt(
+                'gap_analysis', GAP_ANALYSIS_PROMPT, resume_text,
+                job_analysis=PromptBudget.compact_json(job_analysis_dict)
             )
 
             # Get response from Claude as JSON
             response_data = self.claude_service.send_prompt_with_json(
                 prompt=prompt,
-                system_message=SYSTEM_MESSAGE
+                system_message=SYSTEM_MESSAGE,
+                step='gap'
             )
 
+            # Keyword presence is exact matching, so it is computed locally
+            keyword_matches = get_keyword_matcher(
+                job_analysis_dict.get('ats_keywords', [])
+            ).match(resume_text)
+
             # Create result object
             result = GapAnalysisResult(
                 match_score=response_data.get('match_score', 0),
                 strengths=response_data.get('strengths', []),
-                gaps=response_data.get('gaps', []),
-                keyword_matches=response_data.get('keyword_matches', {})
+                gaps=self._normalize_gaps(response_data.get('gaps', [])),
+                keyword_matches=keyword_matches
             )
 
             return result
 
+        except (DeadlineExceededError, CircuitOpenError):
+            raise
+
         except Exception as e:
             raise Exception(f"Gap analysis failed: {str(e)}")
+
+    @staticmethod
+    def analyze_locally(resume_text, job_analysis):
+        """
+        Estimate the gap analysis from keyword matching alone, without Claude
+
+        Used as a degraded fallback while the Claude API is unavailable.
+        The score is the weighted share of required skills (x2), preferred
+        skills and ATS keywords found in the resume; missing ones become gaps.
+
+        Args:
+            resume_text (str): Resume text content
+            job_analysis (JobAnalysisResult or dict): Job analysis results
+
+        Returns:
+            GapAnalysisResult: Keyword-based gap analysis
+        """
+        if isinstance(job_analysis, JobAnalysisResult):
+            job_analysis = job_analysis.to_dict()
+
+        # (term, weight, gap priority), most important first, each term once
+        terms = []
+        seen = set()
+        for key, weight, priority in (
+            ('required_skills', 2, 'critical'),
+            ('preferred_skills', 1, 'high'),
+            ('ats_keywords', 1, 'medium')
+        ):
+            for term in job_analysis.get(key, []):
+                if term and term.casefold() not in seen:
+                    seen.add(term.casefold())
+                    terms.append((term, weight, priority))
+
+        found = get_keyword_matcher([term for term, _, _ in terms]).find(resume_text)
+
+        total = sum(weight for _, weight, _ in terms)
+        matched = sum(weight for index, (_, weight, _) in enumerate(terms) if index in found)
+
+        return GapAnalysisResult(
+            match_score=round(100 * matched / total) if total else 0,
+            strengths=[
+                f"Resume mentions {term}" for index, (term, _, _) in enumerate(terms)
+                if index in found
+            ][:7],
+            gaps=[
+                {
+                    'keyword': term,
+                    'priority': priority,
+                    'suggestion': f"Add {term} to the Skills or Experience section if you have it"
+                }
+                for index, (term, _, priority) in enumerate(terms) if index not in found
+            ][:5],
+            keyword_matches=get_keyword_matcher(
+                job_analysis.get('ats_keywords', [])
+            ).match(resume_text)
+        )
+
+    @staticmethod
+    def _normalize_gaps(gaps):
+        """
+        Rewrite gap keywords to canonical taxonomy names, one gap per skill
+
+        Args:
+            gaps (list): Gap dicts with 'keyword', 'priority' and 'suggestion'
+
+        Returns:
+            list: Normalized gaps in their original order
+        """
+        taxonomy = get_skill_taxonomy()
+        normalized = []
+        seen = set()
+
+        for gap in gaps:
+            if not isinstance(gap, dict) or not gap.get('keyword'):
+                normalized.append(gap)
+                continue
+
+            keyword = taxonomy.canonical_name(gap['keyword'])
+            if keyword.casefold() in seen:
+                continue
+            seen.add(keyword.casefold())
+            normalized.append({**gap, 'keyword': keyword})
+
+        return normalized
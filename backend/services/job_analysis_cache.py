@@ -0,0 +1,127 @@
+import hashlib
+import re
+import threading
+import unicodedata
+from config import Config
+from models.prompts import PROMPT_VERSION
+from models.analysis_models import JobAnalysisResult
+from services.skill_taxonomy import get_skill_taxonomy
+from utils.cache import LRUCache, DiskCache, TieredCache
+
+
+class JobAnalysisCache:
+    """
+    Content-addressed cache for Step 1 job description analysis
+
+    Entries are keyed by a hash of the normalized job description, the
+    prompt version, the model and the skill taxonomy version (results are
+    normalized through the taxonomy), so changing any of them never serves
+    a stale analysis.
+    """
+
+    def __init__(self, cache=None):
+        """
+        Args:
+            cache (TieredCache): Backing store (default: built from Config)
+        """
+        if cache is None:
+            disk = None
+            if Config.JOB_CACHE_DIR:
+                disk = DiskCache(Config.JOB_CACHE_DIR, ttl=Config.JOB_CACHE_TTL)
+            cache = TieredCache(LRUCache(Config.JOB_CACHE_MAX_ENTRIES), disk)
+
+        self.cache = cache
+
+    @staticmethod
+    def normalize(job_description):
+        """
+        Normalize a job description so cosmetic differences hash the same
+
+        Args:
+            job_description (str): Job description text
+
+        Returns:
+            str: Text with unicode normalized and whitespace collapsed
+        """
+        text = unicodedata.normalize('NFC', job_description or '')
+        return re.sub(r'\s+', ' ', text).strip()
+
+    @staticmethod
+    def make_key(job_description, model):
+        """
+        Build the cache key for a job description
+
+        Args:
+            job_description (str): Job description text
+            model (str): Claude model used for the analysis
+
+        Returns:
+            str: SHA-256 hex digest
+        """
+        normalized = JobAnalysisCache.normalize(job_description)
+        taxonomy = get_skill_taxonomy()
+        taxonomy_version = taxonomy.version if taxonomy is not None else ''
+        material = f"{PROMPT_VERSION}\0{model}\0{taxonomy_version}\0{normalized}"
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def get(self, job_description, model):
+        """
+        Look up a cached analysis
+
+        Args:
+            job_description (str): Job description text
+            model (str): Claude model used for the analysis
+
+        Returns:
+            JobAnalysisResult: Fresh result object, or None on a miss
+        """
+        data = self.cache.get(self.make_key(job_description, model))
+        if data is None:
+            return None
+
+        # Copy the lists so callers can't mutate the cached entry
+        return JobAnalysisResult(**{k: list(v) for k, v in data.items()})
+
+    def set(self, job_description, model, result):
+        """
+        Store an analysis
+
+        Args:
+            job_description (str): Job description text
+            model (str): Claude model used for the analysis
+            result (JobAnalysisResult): Analysis to cache
+        """
+        self.cache.set(self.make_key(job_description, model), result.to_dict())
+
+    def stats(self):
+        """
+        Get hit/miss counters
+
+        Returns:
+            dict: Cache statistics
+        """
+        return self.cache.stats()
+
+
+_job_analysis_cache = None
+_job_analysis_cache_lock = threading.Lock()
+
+
+def get_job_analysis_cache():
+    """
+    Get the process-wide job analysis cache
+
+    Returns:
+        JobAnalysisCache: Shared cache, or None if caching is disabled
+    """
+    global _job_analysis_cache
+
+    if not Config.JOB_CACHE_ENABLED:
+        return None
+
+    if _job_analysis_cache is None:
+        with _job_analysis_cache_lock:
+            if _job_analysis_cache is None:
+                _job_analysis_cache = JobAnalysisCache()
+
+    return _job_analysis_cache
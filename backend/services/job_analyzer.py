@@ -1,4 +1,8 @@
 from services.claude_service import ClaudeService
+from services.retry_policy import DeadlineExceededError
+from services.circuit_breaker import CircuitOpenError
+from services.job_analysis_cache import get_job_analysis_cache
+from services.skill_taxonomy import get_skill_taxonomy
 from models.prompts import JOB_ANALYSIS_PROMPT, SYSTEM_MESSAGE
 from models.analysis_models import JobAnalysisResult
 
@@ -6,8 +10,14 @@ from models.analysis_models import JobAnalysisResult
 class JobAnalyzer:
     """Service for analyzing job descriptions (Step 1)"""
 
-    def __init__(self):
-        self.claude_service = ClaudeService()
+    def __init__(self, claude_service=None, cache=None):
+        """
+        Args:
+            claude_service (ClaudeService): Service to use (default: new service on the shared client)
+            cache (JobAnalysisCache): Result cache (default: shared cache, if enabled)
+        """
+        self.claude_service = claude_service or ClaudeService()
+        self.cache = cache or get_job_analysis_cache()
 
     def analyze_job_description(self, job_description):
         """
@@ -23,24 +33,92 @@ class JobAnalyzer:
             Exception: If analysis fails
         """
         try:
+            # Serve repeat postings from the cache
+            cached = self.get_cached(job_description)
+            if cached is not None:
+                return cached
+
+            model = self.claude_service.route('job')['model']
+
             # Format prompt with job description
             prompt = JOB_ANALYSIS_PROMPT.format(job_description=job_description)
 
             # Get response from Claude as JSON
             response_data = self.claude_service.send_prompt_with_json(
                 prompt=prompt,
-                system_message=SYSTEM_MESSAGE
+                system_message=SYSTEM_MESSAGE,
+                step='job'
             )
 
-            # Create result object
-            result = JobAnalysisResult(
+            # Create result object with skills in their canonical form
+            result = self._normalize(JobAnalysisResult(
                 required_skills=response_data.get('required_skills', []),
                 preferred_skills=response_data.get('preferred_skills', []),
                 key_responsibilities=response_data.get('key_responsibilities', []),
                 ats_keywords=response_data.get('ats_keywords', [])
-            )
+            ))
+
+            if self.cache is not None:
+                self.cache.set(job_description, model, result)
 
             return result
 
+        except (DeadlineExceededError, CircuitOpenError):
+            raise
+
         except Exception as e:
             raise Exception(f"Job description analysis failed: {str(e)}")
+
+    def get_cached(self, job_description, steps=('job',)):
+        """
+        Look up a cached analysis of a job description
+
+        Entries are keyed by the model that produced them: the 'job' route's
+        model for Step 1, the 'fused' route's for fused Steps 1-3. A route
+        change therefore never serves a stale result.
+
+        Args:
+            job_description (str): Job description text
+            steps (tuple): Routes whose models' entries are accepted, in order
+
+        Returns:
+            JobAnalysisResult: Cached result, or None on a miss
+        """
+        if self.cache is None:
+            return None
+
+        models = []
+        for step in steps:
+            model = self.claude_service.route(step)['model']
+            if model not in models:
+                models.append(model)
+
+        for model in models:
+            cached = self.cache.get(job_description, model)
+            if cached is not None:
+                # Entries may predate the current taxonomy
+                return self._normalize(cached)
+
+        return None
+
+    @staticmethod
+    def _normalize(result):
+        """
+        Rewrite skills and keywords to their canonical taxonomy names
+
+        "k8s" and "Kubernetes" become one "Kubernetes" entry, so results
+        compare and match the same however the posting spelled them.
+
+        Args:
+            result (JobAnalysisResult): Raw job analysis
+
+        Returns:
+            JobAnalysisResult: Normalized job analysis
+        """
+        taxonomy = get_skill_taxonomy()
+        return JobAnalysisResult(
+            required_skills=taxonomy.normalize_terms(result.required_skills),
+            preferred_skills=taxonomy.normalize_terms(result.preferred_skills),
+            key_responsibilities=result.key_responsibilities,
+            ats_keywords=taxonomy.normalize_terms(result.ats_keywords)
+        )
@@ -0,0 +1,224 @@
+import functools
+from collections import deque
+from services.skill_taxonomy import get_skill_taxonomy
+from utils.tokenizer import tokenize, split_forms
+
+
+# Acronyms and the phrases they stand for, matched in both directions even
+# without the skill taxonomy. Only unambiguous expansions belong here;
+# acronyms are derived from nothing else, so "Go To Market" never matches "GM".
+ACRONYM_ALIASES = {
+    'AI': 'Artificial Intelligence',
+    'API': 'Application Programming Interface',
+    'AWS': 'Amazon Web Services',
+    'BI': 'Business Intelligence',
+    'CRM': 'Customer Relationship Management',
+    'ERP': 'Enterprise Resource Planning',
+    'GCP': 'Google Cloud Platform',
+    'IaC': 'Infrastructure as Code',
+    'KPI': 'Key Performance Indicator',
+    'ML': 'Machine Learning',
+    'NLP': 'Natural Language Processing',
+    'OOP': 'Object-Oriented Programming',
+    'QA': 'Quality Assurance',
+    'RHEL': 'Red Hat Enterprise Linux',
+    'SaaS': 'Software as a Service',
+    'SDLC': 'Software Development Life Cycle',
+    'SEO': 'Search Engine Optimization',
+    'SQL': 'Structured Query Language',
+    'SRE': 'Site Reliability Engineering',
+    'TDD': 'Test-Driven Development',
+    'UX': 'User Experience',
+}
+
+_EXPANSIONS = {}  # acronym tokens -> phrase tokens
+_ACRONYMS = {}  # phrase tokens -> (acronym tokens, acronym words as written)
+for _acronym, _phrase in ACRONYM_ALIASES.items():
+    _acronym_tokens = tuple(token for token, _ in tokenize(_acronym))
+    _phrase_tokens = tuple(token for token, _ in tokenize(_phrase))
+    _EXPANSIONS[_acronym_tokens] = _phrase_tokens
+    _ACRONYMS[_phrase_tokens] = (_acronym_tokens, tuple(word for _, word in tokenize(_acronym)))
+
+
+def keyword_variants(keyword, case_sensitive=False):
+    """
+    Expand a keyword into the forms it can appear as in a resume
+
+    "Red Hat Enterprise Linux (RHEL)" yields the spelled-out phrase and the
+    parenthesized acronym. A keyword in ACRONYM_ALIASES also yields its
+    other form, so "RHEL" matches "Red Hat Enterprise Linux".
+
+    Args:
+        keyword (str): ATS keyword
+        case_sensitive (bool): Set to True to match the keyword's own forms
+            only as written
+
+    Returns:
+        list: (tokens, casing) for each variant; casing is None for
+            case-insensitive variants, or the words as they must be written
+    """
+    variants = []
+
+    for form in split_forms(keyword):
+        words = tokenize(form)
+        tokens = tuple(token for token, _ in words)
+        casing = tuple(word for _, word in words) if case_sensitive else None
+        if tokens and (tokens, casing) not in variants:
+            variants.append((tokens, casing))
+
+    for tokens, _ in list(variants):
+        expansion = _EXPANSIONS.get(tokens)
+        if expansion is not None and (expansion, None) not in variants:
+            variants.append((expansion, None))
+
+        # Only trusted when written with the acronym's own casing, so
+        # "Artificial Intelligence" matches "AI" but not the word "ai"
+        acronym = _ACRONYMS.get(tokens)
+        if acronym is not None and (acronym[0], None) not in variants:
+            variants.append(acronym)
+
+    return variants
+
+
+class KeywordMatcher:
+    """
+    Matches a fixed keyword list against resume text in one pass
+
+    Every keyword variant is compiled into an Aho-Corasick automaton over
+    word tokens, so a resume is scanned once no matter how many keywords
+    there are. Matching is case-insensitive, tolerant of simple inflections
+    and accepts the acronym and spelled-out forms a keyword spells out
+    itself or that ACRONYM_ALIASES lists.
+    """
+
+    def __init__(self, keywords, taxonomy=None):
+        """
+        Args:
+            keywords (list): ATS keywords to match
+            taxonomy (SkillTaxonomy): If given, each keyword also matches
+                every known alias of its skill ("k8s" for "Kubernetes"), and
+                forms the taxonomy marks case-sensitive match only as written
+        """
+        self.keywords = list(keywords)
+
+        # Trie over tokens: per-node transitions, failure link and outputs
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]  # (keyword index, casing)
+
+        for index, keyword in enumerate(self.keywords):
+            forms = [keyword]
+            if taxonomy is not None:
+                forms.extend(taxonomy.surface_forms(keyword))
+
+            variants = set()
+            for form in forms:
+                for part in split_forms(form):
+                    cased = taxonomy.cased_form(part) if taxonomy is not None else None
+                    if cased is not None:
+                        variants.update(keyword_variants(cased, case_sensitive=True))
+                    else:
+                        variants.update(keyword_variants(part))
+            for tokens, casing in variants:
+                self._add(tokens, (index, casing))
+
+        self._build_failure_links()
+
+    def _add(self, tokens, output):
+        """Insert one token sequence into the trie"""
+        node = 0
+        for token in tokens:
+            next_node = self._goto[node].get(token)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][token] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        self._output[node].append(output)
+
+    def _build_failure_links(self):
+        """Link every node to its longest proper suffix in the trie (BFS)"""
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            node = queue.popleft()
+            for token, child in self._goto[node].items():
+                queue.append(child)
+
+                fallback = self._fail[node]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[child] = target if target != child else 0
+
+                # Inherit matches that end at the suffix node
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def find(self, text):
+        """
+        Find which keywords appear in text
+
+        Args:
+            text (str): Resume text
+
+        Returns:
+            set: Indexes into self.keywords of the keywords found
+        """
+        found = set()
+        tokens = tokenize(text)
+        node = 0
+
+        for position, (token, _) in enumerate(tokens):
+            while node and token not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(token, 0)
+
+            for index, casing in self._output[node]:
+                if casing is not None and not self._has_casing(tokens, position, casing):
+                    continue
+                found.add(index)
+
+        return found
+
+    @staticmethod
+    def _has_casing(tokens, end, casing):
+        """Check that the words ending at tokens[end] are written as casing"""
+        start = end - len(casing) + 1
+        return tuple(word for _, word in tokens[start:end + 1]) == casing
+
+    def match(self, text):
+        """
+        Check every keyword against text
+
+        Args:
+            text (str): Resume text
+
+        Returns:
+            dict: Keyword -> True if present, False if missing, in keyword order
+        """
+        found = self.find(text)
+        return {keyword: index in found for index, keyword in enumerate(self.keywords)}
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(keywords):
+    return KeywordMatcher(keywords, taxonomy=get_skill_taxonomy())
+
+
+def get_keyword_matcher(keywords):
+    """
+    Get a compiled matcher for a keyword list
+
+    Matchers expand keywords with the shared skill taxonomy and are cached by
+    keyword list, so screening many resumes against the same job compiles
+    the automaton once.
+
+    Args:
+        keywords (list): ATS keywords to match
+
+    Returns:
+        KeywordMatcher: Compiled matcher
+    """
+    return _compile(tuple(keywords))
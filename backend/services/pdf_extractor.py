@@ -0,0 +1,166 @@
+import multiprocessing
+import threading
+import time
+from io import BytesIO
+from PyPDF2 import PdfReader
+from config import Config
+
+
+def _extract_pages(data, max_pages, deadline):
+    """
+    Parse a PDF once and extract the text of its first max_pages pages
+
+    Returns:
+        list: Text of each extracted page
+
+    Raises:
+        Exception: If the wall-clock deadline passes before every page
+            within the page budget is extracted, so a partial resume is
+            never mistaken for the whole document
+    """
+    reader = PdfReader(BytesIO(data))
+    page_count = min(len(reader.pages), max_pages)
+    pages = []
+    for index in range(page_count):
+        if time.time() > deadline:
+            raise Exception(
+                f"PDF parsing ran out of time after {index} of {page_count} pages"
+            )
+        pages.append(reader.pages[index].extract_text() or '')
+    return pages
+
+
+def _serve(conn):
+    """Worker process loop: extract each PDF sent over the pipe"""
+    while True:
+        try:
+            data, max_pages, deadline = conn.recv()
+        except EOFError:
+            return
+        try:
+            conn.send(('ok', _extract_pages(data, max_pages, deadline)))
+        except Exception as e:
+            conn.send(('error', str(e)))
+
+
+class _PDFWorker:
+    """A worker process that extracts one PDF at a time"""
+
+    def __init__(self):
+        # fork is unsafe from a multi-threaded server process
+        context = multiprocessing.get_context('spawn')
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_serve, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def kill(self):
+        """Stop this worker only; other requests' workers keep running"""
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+# Idle workers, and a limit on extractions running at once in this worker
+_idle_workers = []
+_slots = None
+_workers_lock = threading.Lock()
+
+
+def _get_slots():
+    """Get the semaphore bounding concurrent extractions, creating it on first use"""
+    global _slots
+
+    if _slots is None:
+        with _workers_lock:
+            if _slots is None:
+                _slots = threading.BoundedSemaphore(Config.PDF_PROCESS_WORKERS)
+
+    return _slots
+
+
+def _checkout_worker():
+    """Take an idle worker, or start one"""
+    with _workers_lock:
+        while _idle_workers:
+            worker = _idle_workers.pop()
+            if worker.process.is_alive():
+                return worker
+    return _PDFWorker()
+
+
+def _return_worker(worker):
+    with _workers_lock:
+        _idle_workers.append(worker)
+
+
+class PDFExtractor:
+    """Extracts PDF text off the request thread, with page and time budgets"""
+
+    # Seconds the parent waits past the worker's own deadline, so pages
+    # extracted right at the limit are sent back before the worker is killed
+    RESULT_GRACE_SECONDS = 1.0
+
+    @staticmethod
+    def extract_text(source, max_pages=None, timeout=None):
+        """
+        Extract text from a PDF
+
+        The PDF is parsed once in a worker process of its own, so a
+        pathological file that runs over the time budget is killed without
+        affecting other requests' extractions. Only the first max_pages
+        pages are read; running out of time before they are all read is an
+        error rather than a truncated result.
+
+        Args:
+            source (str or file-like): Path to the PDF or a binary stream
+            max_pages (int): Page budget (default: Config.PDF_MAX_PAGES)
+            timeout (float): Time budget in seconds (default: Config.PDF_PARSE_TIMEOUT)
+
+        Returns:
+            str: Extracted text, one page per line block
+
+        Raises:
+            Exception: If extraction fails or runs over the time budget
+        """
+        max_pages = max_pages or Config.PDF_MAX_PAGES
+        timeout = timeout or Config.PDF_PARSE_TIMEOUT
+
+        if isinstance(source, str):
+            with open(source, 'rb') as f:
+                data = f.read()
+        else:
+            data = source.read()
+
+        give_up_at = time.monotonic() + timeout
+        deadline = time.time() + timeout
+
+        if Config.PDF_PROCESS_WORKERS <= 0:
+            return '\n'.join(_extract_pages(data, max_pages, deadline))
+
+        slots = _get_slots()
+        # Waiting for a worker and parsing share one time budget
+        if not slots.acquire(timeout=max(0.0, give_up_at - time.monotonic())):
+            raise Exception(f"PDF parsing timed out after {timeout}s waiting for a worker")
+
+        try:
+            worker = _checkout_worker()
+            try:
+                worker.conn.send((data, max_pages, deadline))
+                wait = give_up_at + PDFExtractor.RESULT_GRACE_SECONDS - time.monotonic()
+                if not worker.conn.poll(max(0.0, wait)):
+                    print(f"PDF extraction exceeded {timeout}s, stopping its worker")
+                    worker.kill()
+                    raise Exception(f"PDF parsing timed out after {timeout}s")
+                status, value = worker.conn.recv()
+            except (EOFError, OSError):
+                worker.kill()
+                raise Exception("PDF worker crashed while parsing")
+
+            _return_worker(worker)
+        finally:
+            slots.release()
+
+        if status != 'ok':
+            raise Exception(value)
+        return '\n'.join(value)
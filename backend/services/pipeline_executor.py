@@ -0,0 +1,166 @@
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from config import Config
+
+
+# Process-wide pool shared by every pipeline run in this worker
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_pipeline_executor():
+    """
+    Get the process-wide thread pool used to run pipeline steps
+
+    Returns:
+        ThreadPoolExecutor: Bounded pool sized by Config.PIPELINE_MAX_WORKERS
+    """
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=Config.PIPELINE_MAX_WORKERS,
+                    thread_name_prefix='pipeline'
+                )
+
+    return _executor
+
+
+class InlineExecutor(Executor):
+    """
+    Executor that runs each submitted call immediately on the calling thread
+
+    Lets a pipeline run its steps one after another on a thread that is
+    already bounded elsewhere (e.g. a batch worker) instead of queueing
+    them on the shared pool.
+    """
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+class PipelineStep:
+    """A single named step in a pipeline and the steps it depends on"""
+
+    def __init__(self, name, func, depends_on=None):
+        """
+        Args:
+            name (str): Unique step name; its result is stored under this key
+            func (callable): Called with the results of its dependencies as
+                keyword arguments, named after the dependency steps
+            depends_on (list): Names of steps whose results this step needs
+        """
+        self.name = name
+        self.func = func
+        self.depends_on = list(depends_on or [])
+
+
+class PipelineExecutor:
+    """
+    Dependency-graph executor for multi-step analysis pipelines
+
+    Every step is submitted to the shared thread pool as soon as all of
+    its dependencies have produced a result, so independent steps run
+    concurrently while dependent steps still see their inputs.
+    """
+
+    def __init__(self, executor=None):
+        """
+        Args:
+            executor (Executor): Pool to run steps on (default: shared pool)
+        """
+        self.executor = executor or get_pipeline_executor()
+        self.steps = {}
+
+    def add_step(self, name, func, depends_on=None):
+        """
+        Register a step
+
+        Args:
+            name (str): Unique step name
+            func (callable): Step function, see PipelineStep
+            depends_on (list): Names of steps this step depends on
+
+        Returns:
+            PipelineExecutor: self, so calls can be chained
+
+        Raises:
+            ValueError: If the step name is already registered
+        """
+        if name in self.steps:
+            raise ValueError(f"Duplicate pipeline step: {name}")
+
+        self.steps[name] = PipelineStep(name, func, depends_on)
+        return self
+
+    def run(self, initial_results=None, on_step_complete=None):
+        """
+        Run all registered steps, honouring their dependencies
+
+        Args:
+            initial_results (dict): Results that are already available and
+                can satisfy dependencies without running a step
+            on_step_complete (callable): Called as on_step_complete(name, result)
+                on the calling thread as soon as each step finishes
+
+        Returns:
+            dict: Mapping of step name to its result
+
+        Raises:
+            ValueError: If the graph has unknown dependencies or a cycle
+            Exception: The first exception raised by any step
+        """
+        results = dict(initial_results or {})
+        self._validate(results)
+
+        pending = {
+            name: step for name, step in self.steps.items()
+            if name not in results
+        }
+        running = {}
+
+        try:
+            while pending or running:
+                # Submit every step whose inputs are now available
+                for name in list(pending):
+                    step = pending[name]
+                    if all(dep in results for dep in step.depends_on):
+                        kwargs = {dep: results[dep] for dep in step.depends_on}
+                        running[self.executor.submit(step.func, **kwargs)] = name
+                        del pending[name]
+
+                if not running:
+                    raise ValueError(
+                        f"Pipeline steps can never run: {', '.join(pending)}"
+                    )
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    results[name] = future.result()
+                    if on_step_complete is not None:
+                        on_step_complete(name, results[name])
+
+        except Exception:
+            # Don't start anything else once a step has failed
+            for future in running:
+                future.cancel()
+            raise
+
+        return results
+
+    def _validate(self, available):
+        """Check that every dependency refers to a known step or result"""
+        for step in self.steps.values():
+            for dep in step.depends_on:
+                if dep not in self.steps and dep not in available:
+                    raise ValueError(
+                        f"Step '{step.name}' depends on unknown step '{dep}'"
+                    )
@@ -0,0 +1,209 @@
+import json
+import math
+from config import Config
+from services.resume_parser import ResumeParser
+
+
+# Text before the first detected header (name, contact details)
+PREAMBLE = 'preamble'
+
+# Resume sections each step needs, and the order they are dropped in when
+# the prompt is over budget (first dropped first). include=None keeps every
+# section; sections not in drop are only shortened, never removed, as a last
+# resort. truncate=False sends the resume whole whatever the budget.
+STEP_SECTIONS = {
+    'gap_analysis': {
+        'include': {'summary', 'experience', 'education', 'skills',
+                    'certifications', 'projects', 'awards'},
+        'drop': ('awards', 'projects', 'summary', 'certifications', 'education'),
+    },
+    # The ATS scan grades contact, summary, experience, education, skills and
+    # certifications as missing when absent, so only ungraded sections are dropped
+    'ats_scan': {
+        'include': None,
+        'drop': ('awards', 'projects'),
+    },
+    # The optimizer rewrites the whole resume; its JSON context shrinks instead
+    'optimize': {
+        'include': None,
+        'drop': (),
+        'truncate': False,
+    },
+    # Steps 1-3 in one call; the ATS part needs every graded section
+    'fused': {
+        'include': None,
+        'drop': ('awards', 'projects'),
+    },
+}
+
+
+class PromptBudget:
+    """
+    Keeps each step's prompt within an input-token budget
+
+    The resume is split with ResumeParser.split_sections, only the sections
+    a step needs are kept, and low-priority sections are dropped until the
+    whole prompt fits Config's per-step budget. Token counts are estimated
+    from character counts (Config.PROMPT_CHARS_PER_TOKEN).
+    """
+
+    TRUNCATION_MARKER = '\n[...]\n'
+
+    @staticmethod
+    def get_budget(step):
+        """
+        Get the input-token budget for a step
+
+        Args:
+            step (str): 'gap_analysis', 'ats_scan', 'optimize' or 'fused'
+
+        Returns:
+            int: Budget in tokens (0 = unlimited)
+        """
+        return {
+            'gap_analysis': Config.PROMPT_BUDGET_GAP_ANALYSIS,
+            'ats_scan': Config.PROMPT_BUDGET_ATS_SCAN,
+            'optimize': Config.PROMPT_BUDGET_OPTIMIZE,
+            'fused': Config.PROMPT_BUDGET_FUSED,
+        }.get(step, 0)
+
+    @staticmethod
+    def estimate_tokens(text):
+        """
+        Estimate the token count of a piece of text
+
+        Args:
+            text (str): Text to measure
+
+        Returns:
+            int: Approximate number of tokens
+        """
+        return math.ceil(len(text or '') / max(1, Config.PROMPT_CHARS_PER_TOKEN))
+
+    @staticmethod
+    def compact_json(data):
+        """
+        Serialize an intermediate result for embedding in a prompt
+
+        Args:
+            data (dict): Result data
+
+        Returns:
+            str: JSON without indentation or padding
+        """
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+
+    @staticmethod
+    def fits(step, prompt):
+        """
+        Check whether a formatted prompt is within a step's budget
+
+        Args:
+            step (str): Step name, see get_budget
+            prompt (str): Formatted prompt
+
+        Returns:
+            bool: True if within budget or the step is unlimited
+        """
+        budget = PromptBudget.get_budget(step)
+        return budget <= 0 or PromptBudget.estimate_tokens(prompt) <= budget
+
+    @staticmethod
+    def build_prompt(step, template, resume_text, **fields):
+        """
+        Format a step's prompt with a resume scoped to the step's budget
+
+        Args:
+            step (str): 'gap_analysis', 'ats_scan' or 'optimize'
+            template (str): Prompt template with a {resume_text} placeholder
+            resume_text (str): Full resume text
+            **fields: The template's other placeholders, already serialized
+
+        Returns:
+            str: Formatted prompt
+        """
+        reserved = PromptBudget.estimate_tokens(template.format(resume_text='', **fields))
+        scoped = PromptBudget.scope_resume(resume_text, step, reserved_tokens=reserved)
+        return template.format(resume_text=scoped, **fields)
+
+    @staticmethod
+    def scope_resume(resume_text, step, reserved_tokens=0):
+        """
+        Keep only the resume sections a step needs, within its budget
+
+        Args:
+            resume_text (str): Full resume text
+            step (str): 'gap_analysis', 'ats_scan' or 'optimize'
+            reserved_tokens (int): Tokens already taken by the rest of the prompt
+
+        Returns:
+            str: Resume text for the step's prompt
+        """
+        rules = STEP_SECTIONS.get(step, {'include': None, 'drop': ()})
+        spans = ResumeParser.split_sections(resume_text)
+
+        blocks = []
+        if spans:
+            blocks.append((PREAMBLE, resume_text[:spans[0][3]]))
+        blocks.extend((name, resume_text[start:end]) for name, _, _, start, end in spans)
+
+        if rules['include'] is not None:
+            scoped = [block for block in blocks if block[0] in rules['include']]
+            # Nothing recognizable to scope to; send the resume as it is
+            if scoped:
+                blocks = scoped
+
+        text = ''.join(block for _, block in blocks) if blocks else resume_text
+
+        budget = PromptBudget.get_budget(step)
+        if budget <= 0 or not rules.get('truncate', True):
+            return text.strip()
+
+        available = max(0, budget - reserved_tokens)
+        for name in rules['drop']:
+            # No sections to drop; the resume is cut as a whole below
+            if not blocks or PromptBudget.estimate_tokens(text) <= available:
+                break
+            blocks = [block for block in blocks if block[0] != name]
+            text = ''.join(block for _, block in blocks)
+
+        chars_per_token = max(1, Config.PROMPT_CHARS_PER_TOKEN)
+        shortened = set()
+        while blocks and PromptBudget.estimate_tokens(text) > available:
+            # Shorten the longest section, keeping its header line, so every
+            # remaining section survives
+            candidates = [index for index in range(len(blocks)) if index not in shortened]
+            if not candidates:
+                break
+            longest = max(candidates, key=lambda index: len(blocks[index][1]))
+            shortened.add(longest)
+            name, block = blocks[longest]
+            excess = (PromptBudget.estimate_tokens(text) - available) * chars_per_token
+            keep = (block.find('\n') + 1 or len(block)) + len(PromptBudget.TRUNCATION_MARKER)
+            blocks[longest] = (
+                name, PromptBudget._truncate(block, max(keep, len(block) - excess))
+            )
+            text = ''.join(block for _, block in blocks)
+
+        if not blocks and PromptBudget.estimate_tokens(text) > available:
+            text = PromptBudget._truncate(text, available * chars_per_token)
+
+        text = text.strip()
+        if len(text) < len(resume_text.strip()):
+            print(
+                f"Prompt budget: {step} resume scoped from "
+                f"{PromptBudget.estimate_tokens(resume_text)} to "
+                f"{PromptBudget.estimate_tokens(text)} tokens"
+            )
+
+        return text
+
+    @staticmethod
+    def _truncate(text, limit):
+        """Cut text to about limit characters at a line boundary, marking the cut"""
+        marker = PromptBudget.TRUNCATION_MARKER
+        if len(text) <= limit:
+            return text
+        limit = max(0, limit - len(marker))
+        cut = text.rfind('\n', 0, limit)
+        return text[:cut if cut > 0 else limit] + marker
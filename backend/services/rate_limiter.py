@@ -0,0 +1,238 @@
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from config import Config
+from services.retry_policy import DeadlineExceededError
+
+try:
+    import fcntl
+except ImportError:  # Windows: limiter state is per-process only
+    fcntl = None
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter for Claude requests per minute and tokens per minute
+
+    Callers reserve capacity before each API call and block until it is
+    available, so the service stays under its quota instead of finding it
+    through 429s. With a state file, every worker process on the host draws
+    from the same buckets (guarded by an flock).
+
+    Bulk callers must leave a reserve of each bucket untouched, so
+    interactive requests still go through while a large batch is running.
+    """
+
+    INTERACTIVE = 'interactive'
+    BULK = 'bulk'
+    PRIORITIES = (INTERACTIVE, BULK)
+
+    def __init__(self, requests_per_minute=0, tokens_per_minute=0, state_file=None,
+                 interactive_reserve=0.2, max_wait=120):
+        """
+        Args:
+            requests_per_minute (int): Request quota (0 = unlimited)
+            tokens_per_minute (int): Input plus output token quota (0 = unlimited)
+            state_file (str): File shared by worker processes (None = per-process)
+            interactive_reserve (float): Share of each bucket bulk callers may not use
+            max_wait (float): Seconds acquire() may block before giving up
+        """
+        self.capacity = {'requests': requests_per_minute, 'tokens': tokens_per_minute}
+        self.state_file = state_file if fcntl is not None else None
+        self.interactive_reserve = interactive_reserve
+        self.max_wait = max_wait
+        self._state = None
+        self._lock = threading.Lock()
+
+        if state_file and fcntl is None:
+            print("fcntl unavailable, rate limiter state is per-process only")
+        if self.state_file:
+            os.makedirs(os.path.dirname(os.path.abspath(self.state_file)), exist_ok=True)
+
+    @property
+    def enabled(self):
+        return any(capacity > 0 for capacity in self.capacity.values())
+
+    def acquire(self, tokens, priority=INTERACTIVE, timeout=None):
+        """
+        Block until a request fits within the quota, then reserve it
+
+        Args:
+            tokens (int): Estimated input plus output tokens for the request
+            priority (str): 'interactive' or 'bulk'
+            timeout (float): Give up sooner than max_wait (e.g. at a request deadline)
+
+        Returns:
+            int: Tokens reserved; pass to reconcile() once usage is known
+
+        Raises:
+            DeadlineExceededError: If capacity does not free up before timeout
+                (when it is shorter than max_wait)
+            Exception: If capacity does not free up within max_wait
+        """
+        if not self.enabled:
+            return 0
+
+        cut_short = timeout is not None and timeout < self.max_wait
+        max_wait = timeout if cut_short else self.max_wait
+        deadline = time.time() + max_wait
+        while True:
+            wait = self._try_acquire(tokens, priority)
+            if wait <= 0:
+                return tokens
+
+            if time.time() + wait > deadline:
+                if cut_short:
+                    raise DeadlineExceededError(
+                        f"Deadline reached waiting for rate limit capacity ({max_wait:.1f}s left)"
+                    )
+                raise Exception(f"Rate limit: no capacity available within {max_wait:g}s")
+
+            # Short, jittered sleeps so waiting workers don't wake in lockstep
+            time.sleep(min(wait, 1.0) * random.uniform(0.8, 1.2))
+
+    def reconcile(self, reserved, actual):
+        """
+        Correct a reservation once the real token usage is known
+
+        Args:
+            reserved (int): Tokens reserved by acquire()
+            actual (int): Tokens the request actually used (0 if it was rejected)
+        """
+        if not self.enabled or self.capacity['tokens'] <= 0:
+            return
+
+        with self._state_lock() as state:
+            self._refill(state)
+            # Refunds can't overfill the bucket; overruns leave it in debt
+            state['tokens'] = min(
+                self.capacity['tokens'], state['tokens'] + reserved - actual
+            )
+
+    def backoff(self, seconds):
+        """
+        Pause every caller after the API reported a rate limit
+
+        Args:
+            seconds (float): How long no new requests may start
+        """
+        if not self.enabled:
+            return
+
+        with self._state_lock() as state:
+            state['blocked_until'] = max(state.get('blocked_until', 0), time.time() + seconds)
+            # Restart from empty buckets so callers resume gradually, not all at once
+            for bucket in self.capacity:
+                state[bucket] = min(state[bucket], 0)
+
+    def _try_acquire(self, tokens, priority):
+        """
+        Reserve capacity if it is available
+
+        Returns:
+            float: 0 if reserved, otherwise seconds until it may be available
+        """
+        need = {'requests': 1, 'tokens': tokens}
+        reserve = self.interactive_reserve if priority == self.BULK else 0
+
+        with self._state_lock() as state:
+            now = time.time()
+            self._refill(state, now)
+
+            blocked = state.get('blocked_until', 0) - now
+            if blocked > 0:
+                return blocked
+
+            wait = 0
+            for bucket, capacity in self.capacity.items():
+                if capacity <= 0:
+                    continue
+                floor = capacity * reserve
+                # A request larger than the usable bucket waits for a full one
+                amount = min(need[bucket], capacity - floor)
+                shortfall = floor + amount - state[bucket]
+                if shortfall > 0:
+                    wait = max(wait, shortfall * 60.0 / capacity)
+
+            if wait > 0:
+                return wait
+
+            for bucket, capacity in self.capacity.items():
+                if capacity > 0:
+                    state[bucket] -= need[bucket]
+            return 0
+
+    def _refill(self, state, now=None):
+        """Add the capacity accrued since the state was last updated"""
+        now = now or time.time()
+        elapsed = max(0.0, now - state.get('updated', now))
+        for bucket, capacity in self.capacity.items():
+            if capacity > 0:
+                state[bucket] = min(capacity, state[bucket] + elapsed * capacity / 60.0)
+        state['updated'] = now
+
+    def _new_state(self):
+        """Full buckets"""
+        state = {bucket: capacity for bucket, capacity in self.capacity.items()}
+        state['updated'] = time.time()
+        return state
+
+    @contextmanager
+    def _state_lock(self):
+        """Yield the bucket state for exclusive update"""
+        with self._lock:
+            if not self.state_file:
+                if self._state is None:
+                    self._state = self._new_state()
+                yield self._state
+                return
+
+            with open(self.state_file, 'a+') as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    try:
+                        state = json.loads(f.read())
+                    except ValueError:
+                        state = self._new_state()
+                    for bucket in self.capacity:
+                        state.setdefault(bucket, self.capacity[bucket])
+
+                    yield state
+
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(state))
+                    f.flush()
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """
+    Get the process-wide Claude rate limiter
+
+    Returns:
+        RateLimiter: Shared limiter (disabled if no quota is configured)
+    """
+    global _rate_limiter
+
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = RateLimiter(
+                    requests_per_minute=Config.RATE_LIMIT_RPM,
+                    tokens_per_minute=Config.RATE_LIMIT_TPM,
+                    state_file=Config.RATE_LIMIT_STATE_FILE or None,
+                    interactive_reserve=Config.RATE_LIMIT_INTERACTIVE_RESERVE,
+                    max_wait=Config.RATE_LIMIT_MAX_WAIT
+                )
+
+    return _rate_limiter
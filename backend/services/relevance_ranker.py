@@ -0,0 +1,137 @@
+import heapq
+import math
+from collections import Counter, defaultdict
+from utils.tokenizer import index_terms, count_terms
+
+
+class BM25Index:
+    """
+    Okapi BM25 index over a corpus of documents
+
+    Documents are tokenized once into unigram and bigram terms and stored
+    in an inverted index, so scoring a query only touches the postings of
+    the query's own terms. Document length is the number of non-stop words.
+    """
+
+    K1 = 1.5   # Term frequency saturation
+    B = 0.75   # Document length normalization
+
+    def __init__(self, documents, vocabulary=None):
+        """
+        Args:
+            documents (list): Document texts
+            vocabulary (set): If given, only these terms are indexed. Ranking
+                for a single query only needs the query's own terms, which
+                makes indexing a large corpus much cheaper.
+        """
+        self.doc_count = len(documents)
+        self._postings = defaultdict(list)  # term -> [(doc_id, term frequency)]
+        if vocabulary is not None:
+            vocabulary = frozenset(vocabulary)
+
+        lengths = []
+        for doc_id, text in enumerate(documents):
+            counts, length = count_terms(text, vocabulary)
+            lengths.append(length)
+            for term, frequency in counts.items():
+                self._postings[term].append((doc_id, frequency))
+
+        average = (sum(lengths) / len(lengths)) if lengths else 0
+        average = average or 1
+
+        # Length-dependent part of the BM25 denominator, per document
+        self._norms = [
+            self.K1 * (1 - self.B + self.B * length / average) for length in lengths
+        ]
+
+    def idf(self, term):
+        """
+        Inverse document frequency of a term (never negative)
+
+        Args:
+            term (str): Index term
+
+        Returns:
+            float: IDF weight
+        """
+        containing = len(self._postings.get(term, ()))
+        return math.log(1 + (self.doc_count - containing + 0.5) / (containing + 0.5))
+
+    def score(self, query):
+        """
+        Score every document against a query
+
+        Args:
+            query (str): Query text (e.g. a job description)
+
+        Returns:
+            list: BM25 score of each document, in document order
+        """
+        scores = [0.0] * self.doc_count
+
+        for term, query_frequency in Counter(index_terms(query)).items():
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+
+            # Terms the query repeats matter more, with diminishing returns
+            weight = self.idf(term) * (1 + math.log(query_frequency))
+            for doc_id, frequency in postings:
+                scores[doc_id] += weight * frequency * (self.K1 + 1) / (frequency + self._norms[doc_id])
+
+        return scores
+
+    def rank(self, query, top_k=None):
+        """
+        Rank documents against a query
+
+        Args:
+            query (str): Query text
+            top_k (int): Only return the best top_k documents (default: all)
+
+        Returns:
+            list: (doc_id, score) pairs, best first; ties keep document order
+        """
+        scores = self.score(query)
+        order = range(self.doc_count)
+        key = lambda doc_id: (-scores[doc_id], doc_id)
+
+        if top_k is not None and top_k < self.doc_count:
+            best = heapq.nsmallest(top_k, order, key=key)
+        else:
+            best = sorted(order, key=key)
+
+        return [(doc_id, scores[doc_id]) for doc_id in best]
+
+
+class RelevanceRanker:
+    """Ranks resumes against a job description locally, without Claude"""
+
+    @staticmethod
+    def rank_resumes(job_description, resumes, top_k=None):
+        """
+        Rank resumes by lexical relevance to a job description
+
+        Args:
+            job_description (str): Job description text
+            resumes (list): Dicts with 'name' and 'text' for each resume
+            top_k (int): Only return the best top_k resumes (default: all)
+
+        Returns:
+            list: Dicts with 'rank', 'index' (position in resumes), 'name'
+                and 'score', best first
+        """
+        index = BM25Index(
+            [resume['text'] for resume in resumes],
+            vocabulary=set(index_terms(job_description))
+        )
+
+        return [
+            {
+                'rank': rank,
+                'index': doc_id,
+                'name': resumes[doc_id]['name'],
+                'score': round(score, 4)
+            }
+            for rank, (doc_id, score) in enumerate(index.rank(job_description, top_k), start=1)
+        ]
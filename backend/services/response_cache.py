@@ -0,0 +1,344 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from config import Config
+
+
+class ResponseCache:
+    """
+    Base class for Claude response caches
+
+    Backends store raw response text keyed by a hash of everything that
+    determines the response, and evict least recently used entries once
+    their total size exceeds max_bytes.
+    """
+
+    backend_name = 'base'
+
+    def __init__(self, max_bytes):
+        """
+        Args:
+            max_bytes (int): Total size of cached responses before eviction
+        """
+        self.max_bytes = max_bytes
+        self._stats_lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    @staticmethod
+    def make_key(prompt, system_message, model, temperature, max_tokens):
+        """
+        Build the cache key for a request
+
+        Returns:
+            str: SHA-256 hex digest of the request parameters
+        """
+        material = json.dumps(
+            [model, temperature, max_tokens, system_message, prompt],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """
+        Get a cached response
+
+        Args:
+            key (str): Cache key from make_key
+
+        Returns:
+            str: Response text, or None on a miss
+        """
+        value = self._get(key)
+        self._count('hits' if value is not None else 'misses')
+        return value
+
+    def set(self, key, value):
+        """
+        Store a response, evicting old entries if over the size limit
+
+        Args:
+            key (str): Cache key from make_key
+            value (str): Response text
+        """
+        evicted = self._set(key, value)
+        if evicted:
+            self._count('evictions', evicted)
+
+    def stats(self):
+        """
+        Get hit/miss counters
+
+        Returns:
+            dict: Counters, hit rate and backend name
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 4) if lookups else 0.0
+        stats['backend'] = self.backend_name
+        return stats
+
+    def _count(self, name, amount=1):
+        with self._stats_lock:
+            self._stats[name] += amount
+
+    def _get(self, key):
+        raise NotImplementedError
+
+    def _set(self, key, value):
+        """Store a value and return the number of evicted entries"""
+        raise NotImplementedError
+
+
+class MemoryResponseCache(ResponseCache):
+    """In-process LRU response cache"""
+
+    backend_name = 'memory'
+
+    def __init__(self, max_bytes):
+        super().__init__(max_bytes)
+        self._data = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _get(self, key):
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def _set(self, key, value):
+        evicted = 0
+        with self._lock:
+            if key in self._data:
+                self._size -= len(self._data.pop(key))
+            self._data[key] = value
+            self._size += len(value)
+
+            while self._size > self.max_bytes and len(self._data) > 1:
+                _, old = self._data.popitem(last=False)
+                self._size -= len(old)
+                evicted += 1
+
+        return evicted
+
+
+class SQLiteResponseCache(ResponseCache):
+    """SQLite response cache, shared by every worker on the host"""
+
+    backend_name = 'sqlite'
+
+    def __init__(self, path, max_bytes):
+        super().__init__(max_bytes)
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT PRIMARY KEY, value TEXT NOT NULL, '
+                'size INTEGER NOT NULL, accessed REAL NOT NULL)'
+            )
+            conn.execute(
+                'CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)'
+            )
+
+    @contextmanager
+    def _connect(self):
+        # A connection per operation keeps this safe across threads
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _get(self, key):
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    'SELECT value FROM responses WHERE key = ?', (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    'UPDATE responses SET accessed = ? WHERE key = ?',
+                    (time.time(), key)
+                )
+                return row[0]
+        except sqlite3.Error as e:
+            print(f"Response cache read failed: {str(e)}")
+            return None
+
+    def _set(self, key, value):
+        evicted = 0
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO responses (key, value, size, accessed) '
+                    'VALUES (?, ?, ?, ?)',
+                    (key, value, len(value), time.time())
+                )
+
+                total = conn.execute(
+                    'SELECT COALESCE(SUM(size), 0) FROM responses'
+                ).fetchone()[0]
+
+                while total > self.max_bytes:
+                    row = conn.execute(
+                        'SELECT key, size FROM responses WHERE key != ? '
+                        'ORDER BY accessed LIMIT 1', (key,)
+                    ).fetchone()
+                    if row is None:
+                        break
+                    conn.execute('DELETE FROM responses WHERE key = ?', (row[0],))
+                    total -= row[1]
+                    evicted += 1
+        except sqlite3.Error as e:
+            print(f"Response cache write failed: {str(e)}")
+
+        return evicted
+
+
+class FileSystemResponseCache(ResponseCache):
+    """One file per response; file mtimes track recency for eviction"""
+
+    backend_name = 'filesystem'
+
+    def __init__(self, directory, max_bytes):
+        super().__init__(max_bytes)
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._size = sum(size for _, _, size in self._entries())
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.txt")
+
+    def _entries(self):
+        """List (path, mtime, size) for every cached file"""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.txt'):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, st.st_mtime, st.st_size))
+        return entries
+
+    def _get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                value = f.read()
+            os.utime(path)  # mark as recently used
+            return value
+        except OSError:
+            return None
+
+    def _set(self, key, value):
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(value)
+            try:
+                replaced = os.stat(path).st_size
+            except OSError:
+                replaced = 0
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Response cache write failed: {str(e)}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return 0
+
+        with self._lock:
+            # Overwriting a key replaces its old file rather than adding one
+            self._size += len(value.encode('utf-8')) - replaced
+            if self._size <= self.max_bytes:
+                return 0
+            return self._evict(path)
+
+    def _evict(self, keep_path):
+        """Delete least recently used files until under the size limit"""
+        entries = sorted(self._entries(), key=lambda e: e[1])
+        self._size = sum(size for _, _, size in entries)
+        evicted = 0
+
+        for path, _, size in entries:
+            if self._size <= self.max_bytes:
+                break
+            if path == keep_path:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._size -= size
+            evicted += 1
+
+        return evicted
+
+
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+
+def create_response_cache(backend=None):
+    """
+    Build a response cache for the configured backend
+
+    Args:
+        backend (str): 'memory', 'sqlite', 'filesystem' or 'none'
+            (default: Config.RESPONSE_CACHE_BACKEND)
+
+    Returns:
+        ResponseCache: Cache instance, or None if caching is disabled
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    backend = (backend or Config.RESPONSE_CACHE_BACKEND).lower()
+    max_bytes = Config.RESPONSE_CACHE_MAX_BYTES
+
+    if backend == 'none':
+        return None
+    if backend == 'memory':
+        return MemoryResponseCache(max_bytes)
+    if backend == 'sqlite':
+        return SQLiteResponseCache(
+            os.path.join(Config.RESPONSE_CACHE_DIR, 'responses.sqlite3'), max_bytes
+        )
+    if backend == 'filesystem':
+        return FileSystemResponseCache(Config.RESPONSE_CACHE_DIR, max_bytes)
+
+    raise ValueError(f"Unknown response cache backend: {backend}")
+
+
+def get_response_cache():
+    """
+    Get the process-wide response cache
+
+    Returns:
+        ResponseCache: Shared cache, or None if caching is disabled
+    """
+    global _response_cache
+
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                _response_cache = create_response_cache()
+
+    return _response_cache
@@ -0,0 +1,111 @@
+import copy
+import hashlib
+import threading
+from config import Config
+from utils.cache import LRUCache, DiskCache, TieredCache
+
+
+class ResumeCache:
+    """
+    Content-addressed cache for parsed resume files
+
+    Entries are keyed by a hash of the raw file bytes, the file type and
+    the parser version, so re-uploading the same file skips PDF and DOCX
+    extraction while a parser change never serves stale text.
+    """
+
+    def __init__(self, cache=None):
+        """
+        Args:
+            cache (TieredCache): Backing store (default: built from Config)
+        """
+        if cache is None:
+            disk = None
+            if Config.RESUME_CACHE_DIR:
+                disk = DiskCache(Config.RESUME_CACHE_DIR, ttl=Config.RESUME_CACHE_TTL)
+            cache = TieredCache(LRUCache(Config.RESUME_CACHE_MAX_ENTRIES), disk)
+
+        self.cache = cache
+
+    @staticmethod
+    def make_key(data, file_type, parser_version):
+        """
+        Build the cache key for a resume file
+
+        Args:
+            data (bytes): Raw file contents
+            file_type (str): File extension, e.g. '.pdf'
+            parser_version (str): Version of the parser producing the entry
+
+        Returns:
+            str: SHA-256 hex digest
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        material = f"{parser_version}\0{file_type}\0{digest}"
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def get(self, data, file_type, parser_version):
+        """
+        Look up a parsed resume
+
+        Args:
+            data (bytes): Raw file contents
+            file_type (str): File extension, e.g. '.pdf'
+            parser_version (str): Version of the current parser
+
+        Returns:
+            dict: Copy of the parsed resume data, or None on a miss
+        """
+        parsed = self.cache.get(self.make_key(data, file_type, parser_version))
+        if parsed is None:
+            return None
+
+        # Copy so callers can't mutate the cached entry
+        return copy.deepcopy(parsed)
+
+    def set(self, data, file_type, parser_version, parsed):
+        """
+        Store a parsed resume
+
+        Args:
+            data (bytes): Raw file contents
+            file_type (str): File extension, e.g. '.pdf'
+            parser_version (str): Version of the parser that produced it
+            parsed (dict): Parsed resume data (text, sections, file_type)
+        """
+        self.cache.set(
+            self.make_key(data, file_type, parser_version), copy.deepcopy(parsed)
+        )
+
+    def stats(self):
+        """
+        Get hit/miss counters
+
+        Returns:
+            dict: Cache statistics
+        """
+        return self.cache.stats()
+
+
+_resume_cache = None
+_resume_cache_lock = threading.Lock()
+
+
+def get_resume_cache():
+    """
+    Get the process-wide parsed resume cache
+
+    Returns:
+        ResumeCache: Shared cache, or None if caching is disabled
+    """
+    global _resume_cache
+
+    if not Config.RESUME_CACHE_ENABLED:
+        return None
+
+    if _resume_cache is None:
+        with _resume_cache_lock:
+            if _resume_cache is None:
+                _resume_cache = ResumeCache()
+
+    return _resume_cache
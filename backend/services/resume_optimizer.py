@@ -1,5 +1,7 @@
-import json
 from services.claude_service import ClaudeService
+from services.retry_policy import DeadlineExceededError
+from services.circuit_breaker import CircuitOpenError
+from services.prompt_budget import PromptBudget
 from models.prompts import RESUME_OPTIMIZATION_PROMPT, SYSTEM_MESSAGE
 from models.analysis_models import (
     OptimizedResumeResult,
@@ -10,12 +12,21 @@ from models.analysis_models import (
 
 
 class ResumeOptimizer:
-    """Service for optimizing resumes (Step 4)"""
+    """
+    Service for optimizing resumes (Step 4)
 
-    def __init__(self):
-        self.claude_service = ClaudeService()
+    Model, max_tokens and temperature come from the 'optimize' entry of
+    Config.MODEL_ROUTING.
+    """
 
-    def optimize_resume(self, resume_text, job_analysis, gap_analysis, ats_scan):
+    def __init__(self, claude_service=None):
+        """
+        Args:
+            claude_service (ClaudeService): Service to use (default: new service on the shared client)
+        """
+        self.claude_service = claude_service or ClaudeService()
+
+    def optimize_resume(self, resume_text, job_analysis, gap_analysis, ats_scan, on_chunk=None):
         """
         Generate optimized resume based on all analysis results
 
@@ -24,6 +35,8 @@ class ResumeOptimizer:
             job_analysis: Job analysis results (JobAnalysisResult or dict)
             gap_analysis: Gap analysis results (GapAnalysisResult or dict)
             ats_scan: ATS scan results (ATSScanResult or dict)
+            on_chunk (callable): If given, the response is streamed and
+                on_chunk(text) is called with each chunk as it is generated
 
         Returns:
             OptimizedResumeResult: Optimized resume data
@@ -32,51 +45,147 @@ class ResumeOptimizer:
             Exception: If optimization fails
         """
         try:
-            # Convert analysis objects to dicts if needed
-            if isinstance(job_analysis, JobAnalysisResult):
-                job_analysis_dict = job_analysis.to_dict()
-            else:
-                job_analysis_dict = job_analysis
-
-            if isinstance(gap_analysis, GapAnalysisResult):
-                gap_analysis_dict = gap_analysis.to_dict()
-            else:
-                gap_analysis_dict = gap_analysis
-
-            if isinstance(ats_scan, ATSScanResult):
-                ats_scan_dict = ats_scan.to_dict()
-            else:
-                ats_scan_dict = ats_scan
-
-            # Format analysis results as readable text
-            job_analysis_text = json.dumps(job_analysis_dict, indent=2)
-            gap_analysis_text = json.dumps(gap_analysis_dict, indent=2)
-            ats_scan_text = json.dumps(ats_scan_dict, indent=2)
-
-            # Format prompt
-            prompt = RESUME_OPTIMIZATION_PROMPT.format(
-                resume_text=resume_text,
-                job_analysis=job_analysis_text,
-                gap_analysis=gap_analysis_text,
-                ats_scan=ats_scan_text
-            )
+            if on_chunk is not None:
+                chunks = []
+                for chunk in self.stream_optimized_resume(
+                    resume_text, job_analysis, gap_analysis, ats_scan
+                ):
+                    chunks.append(chunk)
+                    on_chunk(chunk)
+                return self.build_result(resume_text, ''.join(chunks))
+
+            prompt = self._build_prompt(resume_text, job_analysis, gap_analysis, ats_scan)
 
             # Get response from Claude (plain text, not JSON)
             optimized_text = self.claude_service.send_prompt(
                 prompt=prompt,
                 system_message=SYSTEM_MESSAGE,
-                max_tokens=8192,  # Larger for complete resume
-                temperature=0.5   # Balanced creativity and consistency
+                step='optimize'
             )
 
-            # Create result object
-            result = OptimizedResumeResult(
-                formatted_text=optimized_text.strip(),
-                original_length=len(resume_text),
-                optimized_length=len(optimized_text)
-            )
+            return self.build_result(resume_text, optimized_text)
 
-            return result
+        except (DeadlineExceededError, CircuitOpenError):
+            raise
 
         except Exception as e:
             raise Exception(f"Resume optimization failed: {str(e)}")
+
+    def stream_optimized_resume(self, resume_text, job_analysis, gap_analysis, ats_scan):
+        """
+        Generate the optimized resume text chunk by chunk
+
+        Args:
+            resume_text (str): Original resume text
+            job_analysis: Job analysis results (JobAnalysisResult or dict)
+            gap_analysis: Gap analysis results (GapAnalysisResult or dict)
+            ats_scan: ATS scan results (ATSScanResult or dict)
+
+        Yields:
+            str: Chunks of optimized resume text; join them and pass the
+                text to build_result for the final OptimizedResumeResult
+
+        Raises:
+            Exception: If optimization fails
+        """
+        prompt = self._build_prompt(resume_text, job_analysis, gap_analysis, ats_scan)
+
+        yield from self.claude_service.stream_prompt(
+            prompt=prompt,
+            system_message=SYSTEM_MESSAGE,
+            step='optimize'
+        )
+
+    @staticmethod
+    def build_result(resume_text, optimized_text):
+        """
+        Create the result object for a generated resume
+
+        Args:
+            resume_text (str): Original resume text
+            optimized_text (str): Complete optimized resume text
+
+        Returns:
+            OptimizedResumeResult: Optimized resume data
+        """
+        return OptimizedResumeResult(
+            formatted_text=optimized_text.strip(),
+            original_length=len(resume_text),
+            optimized_length=len(optimized_text)
+        )
+
+    @staticmethod
+    def _build_prompt(resume_text, job_analysis, gap_analysis, ats_scan):
+        """Format the optimization prompt from the analysis results"""
+        # Convert analysis objects to dicts if needed
+        if isinstance(job_analysis, JobAnalysisResult):
+            job_analysis_dict = job_analysis.to_dict()
+        else:
+            job_analysis_dict = job_analysis
+
+        if isinstance(gap_analysis, GapAnalysisResult):
+            gap_analysis_dict = gap_analysis.to_dict()
+        else:
+            gap_analysis_dict = gap_analysis
+
+        if isinstance(ats_scan, ATSScanResult):
+            ats_scan_dict = ats_scan.to_dict()
+        else:
+            ats_scan_dict = ats_scan
+
+        # Send only what the rewrite uses: the missing keywords rather than
+        # the full keyword map, and the ATS issues rather than section grades
+        keyword_matches = gap_analysis_dict.get('keyword_matches', {})
+        missing_keywords = [k for k, present in keyword_matches.items() if not present]
+        gaps = gap_analysis_dict.get('gaps', [])
+
+        # The resume is never cut; over budget, the context shrinks instead,
+        # from the full analysis down to the skills and gaps to address
+        contexts = [
+            (
+                job_analysis_dict,
+                {
+                    'match_score': gap_analysis_dict.get('match_score'),
+                    'strengths': gap_analysis_dict.get('strengths', []),
+                    'gaps': gaps,
+                    'missing_keywords': missing_keywords
+                },
+                {
+                    'issues': ats_scan_dict.get('issues', {}),
+                    'recommendations': ats_scan_dict.get('recommendations', [])
+                }
+            ),
+            (
+                {
+                    key: job_analysis_dict.get(key, [])
+                    for key in ('required_skills', 'preferred_skills', 'ats_keywords')
+                },
+                {'gaps': gaps, 'missing_keywords': missing_keywords},
+                {'issues': ats_scan_dict.get('issues', {})}
+            ),
+            (
+                {key: job_analysis_dict.get(key, []) for key in ('required_skills', 'ats_keywords')},
+                {
+                    'gaps': [
+                        gap.get('keyword', gap) if isinstance(gap, dict) else gap
+                        for gap in gaps
+                    ],
+                    'missing_keywords': missing_keywords
+                },
+                {}
+            ),
+        ]
+
+        for job_context, gap_context, ats_context in contexts:
+            prompt = PromptBudget.build_prompt(
+                'optimize', RESUME_OPTIMIZATION_PROMPT, resume_text,
+                job_analysis=PromptBudget.compact_json(job_context),
+                gap_analysis=PromptBudget.compact_json(gap_context),
+                ats_scan=PromptBudget.compact_json(ats_context)
+            )
+            if PromptBudget.fits('optimize', prompt):
+                break
+        else:
+            print("Prompt budget: optimize prompt over budget with minimal context; resume sent whole")
+
+        return prompt
@@ -1,19 +1,65 @@
 import os
 import re
-from PyPDF2 import PdfReader
+from io import BytesIO
 import docx2txt
+from services.pdf_extractor import PDFExtractor
+from services.docx_extractor import DocxExtractor
+from services.resume_cache import get_resume_cache
+
+
+# Common section headers (case-insensitive); longer alternatives first
+SECTION_HEADERS = {
+    'contact': [r'contact\s+information', r'contact\s+details'],
+    'summary': [r'professional\s+summary', r'summary', r'profile', r'objective'],
+    'experience': [r'work\s+experience', r'professional\s+experience',
+                   r'employment\s+history', r'experience'],
+    'education': [r'education', r'academic\s+background'],
+    'skills': [r'technical\s+skills', r'core\s+competencies', r'competencies', r'skills'],
+    'certifications': [r'certifications', r'certificates', r'licenses'],
+    'projects': [r'key\s+projects', r'projects'],
+    'awards': [r'awards', r'honors', r'achievements'],
+}
+
+
+def _compile_section_pattern(headers):
+    """
+    Build the single-pass section header regex
+
+    One named group per section, matched only as a whole line: an optional
+    bullet or markdown marker, the header, then an optional colon and inline
+    content. Header words are separated by spaces or tabs, never newlines.
+    """
+    groups = []
+    for name, alternatives in headers.items():
+        words = '|'.join(alt.replace(r'\s+', r'[ \t]+') for alt in alternatives)
+        groups.append(f'(?P<{name}>{words})')
+
+    return re.compile(
+        r'^[ \t]*(?:[#*\u2022\-]+[ \t]*)?(?:' + '|'.join(groups) + r')[ \t]*(?::[^\r\n]*)?\r?$',
+        re.IGNORECASE | re.MULTILINE
+    )
+
+
+SECTION_HEADER_PATTERN = _compile_section_pattern(SECTION_HEADERS)
 
 
 class ResumeParser:
     """Service for parsing resumes from various file formats"""
 
+    # Bump whenever extraction or section detection output changes, so
+    # parsed resumes cached by an older parser are not served
+    PARSER_VERSION = "2"
+
     @staticmethod
-    def parse_file(file_path):
+    def parse_file(file, filename=None):
         """
         Parse a resume file and extract text content
 
         Args:
-            file_path (str): Path to the resume file
+            file (str, bytes or file-like): Path to the resume file, its raw
+                bytes, or a binary file-like object
+            filename (str): Original filename, used for the file type when
+                file is not a path
 
         Returns:
             dict: Parsed resume data with text content and detected sections
@@ -22,22 +68,38 @@ class ResumeParser:
             ValueError: If file format is not supported
             Exception: If parsing fails
         """
-        file_ext = os.path.splitext(file_path)[1].lower()
+        if filename is None and isinstance(file, str):
+            filename = file
+        file_ext = os.path.splitext(filename or '')[1].lower()
+
+        try:
+            data = ResumeParser._read_bytes(file)
+        except Exception as e:
+            raise Exception(f"Failed to parse resume: {str(e)}")
+
+        # Repeat uploads of the same file skip extraction entirely
+        cache = get_resume_cache()
+        if cache is not None:
+            parsed = cache.get(data, file_ext, ResumeParser.PARSER_VERSION)
+            if parsed is not None:
+                return parsed
+
+        source = BytesIO(data)
 
         try:
             if file_ext == '.pdf':
-                text = ResumeParser._parse_pdf(file_path)
+                text = ResumeParser._parse_pdf(source)
             elif file_ext in ['.docx', '.doc']:
-                text = ResumeParser._parse_docx(file_path)
+                text = ResumeParser._parse_docx(source)
             elif file_ext == '.txt':
-                text = ResumeParser._parse_txt(file_path)
+                text = ResumeParser._parse_txt(source)
             else:
                 raise ValueError(f"Unsupported file format: {file_ext}")
 
             # Detect sections
             sections = ResumeParser._detect_sections(text)
 
-            return {
+            parsed = {
                 'text': text,
                 'sections': sections,
                 'file_type': file_ext
@@ -46,6 +108,13 @@ class ResumeParser:
         except Exception as e:
             raise Exception(f"Failed to parse resume: {str(e)}")
 
+        # Only complete extractions get here: a PDF that runs out of time
+        # raises above, so a partial parse under load is never cached
+        if cache is not None:
+            cache.set(data, file_ext, ResumeParser.PARSER_VERSION, parsed)
+
+        return parsed
+
     @staticmethod
     def parse_text(text):
         """
@@ -66,36 +135,83 @@ class ResumeParser:
         }
 
     @staticmethod
-    def _parse_pdf(file_path):
-        """Extract text from PDF file"""
+    def _read_bytes(file):
+        """Read the raw contents of a path, bytes or binary stream"""
+        if isinstance(file, (bytes, bytearray)):
+            return bytes(file)
+        if isinstance(file, str):
+            with open(file, 'rb') as f:
+                return f.read()
+        return file.read()
+
+    @staticmethod
+    def _parse_pdf(source):
+        """Extract text from PDF file (path or binary stream)"""
         try:
-            reader = PdfReader(file_path)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
-            return text.strip()
+            # Runs in the process pool with page and time budgets
+            return PDFExtractor.extract_text(source).strip()
         except Exception as e:
             raise Exception(f"PDF parsing failed: {str(e)}")
 
     @staticmethod
-    def _parse_docx(file_path):
-        """Extract text from DOCX file"""
+    def _parse_docx(source):
+        """Extract text from DOCX file (path or binary stream)"""
         try:
-            text = docx2txt.process(file_path)
+            try:
+                # Fast path: stream only word/document.xml out of the archive
+                text = DocxExtractor.extract_text(source)
+            except Exception as e:
+                print(f"DOCX fast path failed, falling back to docx2txt: {str(e)}")
+                if not isinstance(source, str):
+                    source.seek(0)
+                text = docx2txt.process(source)
             return text.strip()
         except Exception as e:
             raise Exception(f"DOCX parsing failed: {str(e)}")
 
     @staticmethod
-    def _parse_txt(file_path):
-        """Extract text from TXT file"""
+    def _parse_txt(source):
+        """Extract text from TXT file (path or binary stream)"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read()
+            if isinstance(source, str):
+                with open(source, 'r', encoding='utf-8') as f:
+                    text = f.read()
+            else:
+                text = source.read().decode('utf-8')
             return text.strip()
         except Exception as e:
             raise Exception(f"TXT parsing failed: {str(e)}")
 
+    @staticmethod
+    def split_sections(text):
+        """
+        Split resume text into sections in a single pass
+
+        A section header must sit on a line of its own, optionally followed
+        by a colon and inline content, so words like "experience" in body
+        text are not mistaken for headers. Each section runs from its header
+        line to the next detected header line or the end of the text.
+
+        Args:
+            text (str): Resume text content
+
+        Returns:
+            list: (name, header, header_start, start, end) for every header
+                in document order, where [start, end) covers the whole
+                section including its header line
+        """
+        headers = []
+        for match in SECTION_HEADER_PATTERN.finditer(text):
+            name = match.lastgroup
+            headers.append((name, match.group(name), match.start(name), match.start()))
+
+        spans = []
+        for index, (name, header, header_start, start) in enumerate(headers):
+            end = headers[index + 1][3] if index + 1 < len(headers) else len(text)
+            spans.append((name, header, header_start, start, end))
+
+        return spans
+
     @staticmethod
     def _detect_sections(text):
         """
@@ -105,29 +221,21 @@ class ResumeParser:
             text (str): Resume text content
 
         Returns:
-            dict: Detected sections with their positions
+            dict: Detected sections keyed by name, each with 'found',
+                'position' (header offset), 'start', 'end' and 'header'
         """
         sections = {}
-
-        # Common section headers (case-insensitive)
-        section_patterns = {
-            'contact': r'(?i)(contact\s+information|contact\s+details)',
-            'summary': r'(?i)(professional\s+summary|summary|profile|objective)',
-            'experience': r'(?i)(work\s+experience|professional\s+experience|experience|employment\s+history)',
-            'education': r'(?i)(education|academic\s+background)',
-            'skills': r'(?i)(skills|technical\s+skills|core\s+competencies|competencies)',
-            'certifications': r'(?i)(certifications|certificates|licenses)',
-            'projects': r'(?i)(projects|key\s+projects)',
-            'awards': r'(?i)(awards|honors|achievements)',
-        }
-
-        for section_name, pattern in section_patterns.items():
-            matches = re.finditer(pattern, text)
-            for match in matches:
-                sections[section_name] = {
-                    'found': True,
-                    'position': match.start()
-                }
-                break  # Only take first match for each section
+        for name, header, header_start, _, end in ResumeParser.split_sections(text):
+            if name in sections:
+                continue  # Only take first match for each section
+
+            # A repeated header still closes the section before it
+            sections[name] = {
+                'found': True,
+                'position': header_start,
+                'start': header_start,
+                'end': end,
+                'header': header
+            }
 
         return sections
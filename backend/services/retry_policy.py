@@ -0,0 +1,177 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+import anthropic
+from config import Config
+
+
+# HTTP statuses worth retrying: timeouts, conflicts, rate limits and
+# server-side failures (529 = API overloaded)
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+class DeadlineExceededError(Exception):
+    """Raised when a request can no longer finish before its deadline"""
+
+
+class Deadline:
+    """
+    Time budget for one client request, shared by every Claude call it makes
+
+    Steps check the deadline before each API call and before each retry
+    sleep, so a request that can't finish in time fails fast instead of
+    sleeping past the client's own timeout.
+    """
+
+    def __init__(self, seconds):
+        """
+        Args:
+            seconds (float): Time budget from now
+        """
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self):
+        """
+        Returns:
+            float: Seconds left (never negative)
+        """
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self):
+        return self.remaining() <= 0
+
+    def check(self, action="request"):
+        """
+        Raise if no time is left
+
+        Args:
+            action (str): What was about to happen, for the error message
+
+        Raises:
+            DeadlineExceededError: If the deadline has passed
+        """
+        if self.expired:
+            raise DeadlineExceededError(
+                f"Deadline of {self.seconds:g}s exceeded before {action}"
+            )
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed Claude call is retried
+
+    Delays use decorrelated jitter, so workers that failed together spread
+    out their retries instead of retrying in lockstep. A Retry-After hint
+    from the API is used as the minimum delay.
+    """
+
+    def __init__(self, max_attempts=3, base_delay=1.0, max_delay=30.0):
+        """
+        Args:
+            max_attempts (int): Total attempts, including the first
+            base_delay (float): Smallest delay between attempts, in seconds
+            max_delay (float): Largest jittered delay, in seconds
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    @classmethod
+    def from_config(cls):
+        """
+        Returns:
+            RetryPolicy: Policy configured by Config.CLAUDE_RETRY_*
+        """
+        return cls(
+            max_attempts=Config.CLAUDE_RETRY_MAX_ATTEMPTS,
+            base_delay=Config.CLAUDE_RETRY_BASE_DELAY,
+            max_delay=Config.CLAUDE_RETRY_MAX_DELAY
+        )
+
+    def should_retry(self, error, attempt):
+        """
+        Check whether a failed attempt should be retried
+
+        Args:
+            error (Exception): Error raised by the attempt
+            attempt (int): Number of the attempt that failed, from 1
+
+        Returns:
+            bool: True if another attempt is allowed and could succeed
+        """
+        if attempt >= self.max_attempts:
+            return False
+        return self.is_transient(error)
+
+    @staticmethod
+    def is_transient(error):
+        """
+        Check whether an error is a transient API failure rather than a bad request
+
+        Args:
+            error (Exception): Error raised by an API call
+
+        Returns:
+            bool: True for connection errors, timeouts, rate limits and 5xx
+        """
+        # Connection errors and timeouts never reached a response
+        if isinstance(error, anthropic.APIConnectionError):
+            return True
+        if isinstance(error, anthropic.APIStatusError):
+            return error.status_code in RETRYABLE_STATUS_CODES
+        return isinstance(error, anthropic.APIError)
+
+    def next_delay(self, previous_delay, error=None):
+        """
+        Get the delay before the next attempt
+
+        Args:
+            previous_delay (float): Delay before the previous retry (0 for the first)
+            error (Exception): Error that caused the retry
+
+        Returns:
+            float: Seconds to wait
+        """
+        previous = max(previous_delay, self.base_delay)
+        delay = min(self.max_delay, random.uniform(self.base_delay, previous * 3))
+
+        retry_after = self.retry_after(error)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        return delay
+
+    @staticmethod
+    def retry_after(error):
+        """
+        Read the server's Retry-After hint from an API error
+
+        Args:
+            error (Exception): Error raised by an API call
+
+        Returns:
+            float: Seconds the server asked us to wait, or None
+        """
+        response = getattr(error, 'response', None)
+        headers = getattr(response, 'headers', None)
+        if not headers:
+            return None
+
+        try:
+            milliseconds = headers.get('retry-after-ms')
+            if milliseconds is not None:
+                return max(0.0, float(milliseconds) / 1000)
+
+            value = headers.get('retry-after')
+            if value is None:
+                return None
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                # HTTP-date form
+                retry_at = parsedate_to_datetime(value)
+                return max(0.0, retry_at.timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
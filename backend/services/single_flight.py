@@ -0,0 +1,167 @@
+import hashlib
+import json
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows: cross-process coalescing is unavailable
+    fcntl = None
+
+
+class _Call:
+    """An in-flight call that duplicate callers wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces identical in-flight calls
+
+    The first caller for a key runs the function; callers arriving while it
+    is still running wait for and share its result instead of starting
+    their own. With a lock directory, workers on the same host coalesce
+    too: the leader holds an flock on the key's lock file while it runs,
+    writes its JSON result into that file and unlinks it before letting go.
+    Workers queued on the lock read the result from the file they already
+    have open; callers arriving afterwards find no file and start a fresh
+    call, so nothing is left behind in the lock directory.
+    """
+
+    def __init__(self, lock_dir=None):
+        """
+        Args:
+            lock_dir (str): Directory for cross-process lock files
+                (None = coalesce within this process only)
+        """
+        self.lock_dir = lock_dir if fcntl is not None else None
+        self._calls = {}
+        self._lock = threading.Lock()
+
+        if lock_dir and fcntl is None:
+            print("fcntl unavailable, single-flight coalescing is per-process only")
+        if self.lock_dir:
+            os.makedirs(self.lock_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(*parts):
+        """
+        Build a coalescing key from the call inputs
+
+        Args:
+            *parts (str): Inputs that identify the call
+
+        Returns:
+            str: SHA-256 hex digest
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update((part or '').encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def do(self, key, func):
+        """
+        Run func once for all concurrent callers with the same key
+
+        Args:
+            key (str): Coalescing key (filename-safe, e.g. from make_key)
+            func (callable): Zero-argument function; its result must be
+                JSON-serializable when a lock directory is configured
+
+        Returns:
+            tuple: (result, shared) where shared is True if this caller
+                received another caller's result
+
+        Raises:
+            Exception: Whatever func raised, re-raised in every waiting caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        shared = False
+        try:
+            if self.lock_dir:
+                call.result, shared = self._do_across_processes(key, func)
+            else:
+                call.result = func()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result, shared
+
+    def _do_across_processes(self, key, func):
+        """Run func under a per-key file lock, or share the result of the worker holding it"""
+        lock_path = os.path.join(self.lock_dir, f"{key}.lock")
+
+        while True:
+            with open(lock_path, 'a+', encoding='utf-8') as lock_file:
+                # Blocks while another worker is running the same call
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    if not self._is_current(lock_file, lock_path):
+                        # The leader finished and unlinked the file while we
+                        # were queued on it; no result means it failed
+                        result = self._read_result(lock_file)
+                        if result is not None:
+                            return result, True
+                        continue
+
+                    # Leader: a stale file left by a crashed leader is reused
+                    try:
+                        result = func()
+                        self._write_result(lock_file, result)
+                    finally:
+                        os.remove(lock_path)
+                    return result, False
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _is_current(lock_file, lock_path):
+        """Check that a locked file is still the one at lock_path"""
+        try:
+            return os.fstat(lock_file.fileno()).st_ino == os.stat(lock_path).st_ino
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def _read_result(lock_file):
+        """Read the result a leader wrote into the lock file"""
+        try:
+            lock_file.seek(0)
+            content = lock_file.read()
+            return json.loads(content)['result'] if content else None
+        except (OSError, ValueError, KeyError):
+            return None
+
+    @staticmethod
+    def _write_result(lock_file, result):
+        """Publish a result for workers queued on the same lock file"""
+        try:
+            content = json.dumps({'result': result})
+            lock_file.seek(0)
+            lock_file.truncate()
+            lock_file.write(content)
+            lock_file.flush()
+        except (OSError, TypeError) as e:
+            print(f"Single-flight result write failed: {str(e)}")
@@ -0,0 +1,170 @@
+import json
+import os
+import threading
+from config import Config
+from utils.tokenizer import term_key, split_forms
+
+
+class SkillTaxonomy:
+    """
+    Maps the surface forms of a skill to one canonical skill
+
+    The taxonomy file lists each skill's canonical ID, display name and
+    aliases. Every form is indexed by its normalized token key, so "k8s",
+    "Kubernetes" and "kubernetes" all resolve to the same skill. Forms that
+    are also ordinary words ("ML", "Excel") are listed under case_sensitive
+    and only count as the skill when written that way.
+    """
+
+    def __init__(self, skills, version=''):
+        """
+        Args:
+            skills (dict): Skill ID -> {'name': display name, 'aliases': [...],
+                'case_sensitive': [...]}
+            version (str): Taxonomy version
+        """
+        self.skills = skills
+        self.version = version
+        self._index = {}
+        self._cased_forms = {}  # term key -> the form as it must be written
+
+        for skill_id, skill in skills.items():
+            for form in [skill['name'], skill_id] + skill.get('aliases', []):
+                for part in split_forms(form):
+                    key = term_key(part)
+                    if key:
+                        self._index.setdefault(key, skill_id)
+
+            for form in skill.get('case_sensitive', []):
+                key = term_key(form)
+                if key:
+                    self._cased_forms[key] = form
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a taxonomy from a JSON file
+
+        Args:
+            path (str): Path to the taxonomy file
+
+        Returns:
+            SkillTaxonomy: Loaded taxonomy
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data.get('skills', {}), version=data.get('version', ''))
+
+    def lookup(self, term):
+        """
+        Find the canonical skill for a term
+
+        Args:
+            term (str): Skill or keyword, e.g. "k8s" or "Postgres (PostgreSQL)"
+
+        Returns:
+            str: Canonical skill ID, or None if the term is not a known skill
+        """
+        skill_id = self._index.get(term_key(term))
+        if skill_id is not None:
+            return skill_id
+
+        # "Kubernetes (K8s)" resolves only if every form names the same
+        # skill; "Java (Spring Boot)" says more than "Java" and is left alone
+        skill_ids = {self._index.get(term_key(form)) for form in split_forms(term)}
+        if len(skill_ids) == 1:
+            return skill_ids.pop()
+
+        return None
+
+    def canonical_name(self, term):
+        """
+        Get the display name of a term's skill
+
+        Args:
+            term (str): Skill or keyword
+
+        Returns:
+            str: Canonical display name, or the term unchanged if unknown
+        """
+        skill_id = self.lookup(term)
+        return self.skills[skill_id]['name'] if skill_id is not None else term
+
+    def surface_forms(self, term):
+        """
+        Get every known way of writing a term's skill
+
+        Args:
+            term (str): Skill or keyword
+
+        Returns:
+            list: Display name and aliases, or an empty list if unknown
+        """
+        skill_id = self.lookup(term)
+        if skill_id is None:
+            return []
+        skill = self.skills[skill_id]
+        return [skill['name']] + list(skill.get('aliases', []))
+
+    def cased_form(self, term):
+        """
+        Get how a term must be written to count as a skill in resume text
+
+        Args:
+            term (str): One form of a skill, e.g. "ml"
+
+        Returns:
+            str: The case-sensitive spelling (e.g. "ML"), or None if the term
+                matches in any case
+        """
+        return self._cased_forms.get(term_key(term))
+
+    def normalize_terms(self, terms):
+        """
+        Rewrite terms to canonical names and drop duplicates
+
+        Args:
+            terms (list): Skills or keywords
+
+        Returns:
+            list: Canonical names in first-seen order, one per skill
+        """
+        normalized = []
+        seen = set()
+        for term in terms:
+            if not isinstance(term, str) or not term.strip():
+                continue
+            skill_id = self.lookup(term)
+            identity = skill_id or term_key(term) or term.strip().casefold()
+            if identity in seen:
+                continue
+            seen.add(identity)
+            normalized.append(self.skills[skill_id]['name'] if skill_id else term.strip())
+        return normalized
+
+
+_skill_taxonomy = None
+_skill_taxonomy_lock = threading.Lock()
+
+
+def get_skill_taxonomy():
+    """
+    Get the process-wide skill taxonomy
+
+    Returns:
+        SkillTaxonomy: Shared taxonomy (empty if the file is unavailable)
+    """
+    global _skill_taxonomy
+
+    if _skill_taxonomy is None:
+        with _skill_taxonomy_lock:
+            if _skill_taxonomy is None:
+                taxonomy = SkillTaxonomy({})
+                if Config.SKILL_TAXONOMY_PATH and os.path.exists(Config.SKILL_TAXONOMY_PATH):
+                    try:
+                        taxonomy = SkillTaxonomy.load(Config.SKILL_TAXONOMY_PATH)
+                    except Exception as e:
+                        print(f"Failed to load skill taxonomy: {str(e)}")
+                _skill_taxonomy = taxonomy
+
+    return _skill_taxonomy
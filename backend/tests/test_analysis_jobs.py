@@ -0,0 +1,192 @@
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from models.analysis_models import CompleteAnalysisResult
+from services import analysis_jobs
+from services.analysis_pipeline import STEP_RESULT_KEYS
+from services.analysis_jobs import (
+    AnalysisJob, AnalysisJobManager, MemoryAnalysisJobStore, SQLiteAnalysisJobStore
+)
+
+
+class _Step:
+    def __init__(self, data):
+        self.data = data
+
+    def to_dict(self):
+        return self.data
+
+
+class FakePipeline:
+    """Stands in for AnalysisPipeline; emits each step without calling Claude"""
+
+    def __init__(self, mode=None):
+        self.mode = mode
+
+    def run(self, analysis_id, resume_text, job_description, on_step_complete=None,
+            on_chunk=None):
+        # Long enough for a duplicate to arrive while this job is unfinished
+        step_seconds = 0.5 if job_description == 'slow job description' else 0.05
+
+        results = {}
+        for name in ('job_analysis', 'ats_scan', 'gap_analysis'):
+            results[name] = {'name': name}
+            on_step_complete(name, _Step(results[name]))
+            time.sleep(step_seconds)
+
+        for word in ('Optimized ', 'resume'):
+            on_chunk(word)
+        results['optimized_resume'] = {'optimized_text': 'Optimized resume'}
+        on_step_complete('optimized_resume', _Step(results['optimized_resume']))
+
+        return CompleteAnalysisResult(
+            success=True,
+            analysis_id=analysis_id,
+            job_analysis=results['job_analysis'],
+            gap_analysis=results['gap_analysis'],
+            ats_scan=results['ats_scan'],
+            optimized_resume=results['optimized_resume'],
+            metadata={'mode': 'standard'}
+        )
+
+
+def _worker(db_path, requests, replies):
+    """A separate worker process that accepts and runs jobs"""
+    analysis_jobs.AnalysisPipeline = FakePipeline
+    manager = AnalysisJobManager(max_workers=2, store=SQLiteAnalysisJobStore(db_path))
+    while True:
+        request = requests.get()
+        if request is None:
+            break
+        job = manager.submit(*request)
+        replies.put(job.analysis_id)
+    manager.executor.shutdown(wait=True)
+
+
+@pytest.fixture
+def worker(tmp_path):
+    """Start a job-running worker process on a shared SQLite store"""
+    context = multiprocessing.get_context('spawn')
+    requests, replies = context.Queue(), context.Queue()
+    db_path = os.path.join(str(tmp_path), 'jobs.sqlite3')
+    process = context.Process(target=_worker, args=(db_path, requests, replies))
+    process.start()
+    yield db_path, requests, replies
+    requests.put(None)
+    process.join(timeout=30)
+
+
+def test_status_and_events_are_visible_from_another_worker(worker):
+    db_path, requests, replies = worker
+    requests.put(('resume text', 'job description', 'standard'))
+    analysis_id = replies.get(timeout=30)
+
+    # This process never ran the job; it reads it through the shared store
+    manager = AnalysisJobManager(max_workers=1, store=SQLiteAnalysisJobStore(db_path))
+    assert manager.get(analysis_id) is not None
+
+    names = []
+    position = 0
+    give_up_at = time.monotonic() + 30
+    while time.monotonic() < give_up_at:
+        events, finished = manager.wait_for_events(analysis_id, position, timeout=1)
+        for event_id, name, payload in events:
+            names.append(name)
+            position = event_id + 1
+        if 'complete' in names:
+            break
+
+    assert names[0] == 'status'
+    assert names.count('step') == 4
+    assert 'chunk' in names
+    assert names[-1] == 'complete'
+
+    status = manager.get_status(analysis_id)
+    assert status['status'] == AnalysisJob.COMPLETED
+    assert status['results']['step4_optimized_resume'] == {'optimized_text': 'Optimized resume'}
+
+    # Resuming after the last event returns nothing more
+    events, finished = manager.wait_for_events(analysis_id, position, timeout=0)
+    assert events == [] and finished
+
+
+def test_duplicate_submission_joins_job_running_in_another_worker(worker, monkeypatch):
+    db_path, requests, replies = worker
+    requests.put(('resume text', 'slow job description', 'standard'))
+    analysis_id = replies.get(timeout=30)
+
+    manager = AnalysisJobManager(max_workers=1, store=SQLiteAnalysisJobStore(db_path))
+    monkeypatch.setattr(analysis_jobs, 'AnalysisPipeline', FakePipeline)
+    job = manager.submit('resume text', 'slow job description', 'standard')
+    manager.executor.shutdown(wait=True)
+
+    assert job.analysis_id == analysis_id
+
+
+def test_stale_job_is_marked_failed(tmp_path):
+    store = SQLiteAnalysisJobStore(os.path.join(str(tmp_path), 'jobs.sqlite3'), stale_after=0)
+    job, created = store.create(AnalysisJob('lost', 'key'))
+    assert created
+    queued, _ = store.create(AnalysisJob('waiting', 'other key'))
+
+    job.status = AnalysisJob.RUNNING
+    store.save(job, [])
+    store.prune(ttl=3600)
+
+    assert store.get('waiting').status == AnalysisJob.QUEUED
+
+    events, finished = store.read_events('lost', 0)
+    assert finished
+    assert events[-1][1] == 'failed'
+    assert store.get('lost').status == AnalysisJob.FAILED
+
+
+def test_job_never_started_is_failed_and_not_joined(tmp_path):
+    store = SQLiteAnalysisJobStore(os.path.join(str(tmp_path), 'jobs.sqlite3'), queue_timeout=0)
+    # Queued by a worker that died before picking it up
+    lost, created = store.create(AnalysisJob('lost', 'key'))
+    assert created
+
+    job, created = store.create(AnalysisJob('retry', 'key'))
+
+    assert created and job.analysis_id == 'retry'
+    assert store.get('lost').status == AnalysisJob.FAILED
+    events, finished = store.read_events('lost', 0)
+    assert finished
+    assert events[-1][1] == 'failed'
+
+
+def test_memory_store_reads_are_snapshots_of_saved_state():
+    store = MemoryAnalysisJobStore()
+    job, _ = store.create(AnalysisJob('job', 'key'))
+
+    # The pipeline thread changes its job before saving it
+    job.status = AnalysisJob.RUNNING
+    job.results['job_analysis'] = {'name': 'job_analysis'}
+    snapshot = store.get('job')
+    assert snapshot.status == AnalysisJob.QUEUED
+    assert snapshot.results == {}
+
+    store.save(job, [('step', {'step': 'job_analysis'})])
+    snapshot = store.get('job')
+    job.results['gap_analysis'] = {'name': 'gap_analysis'}
+
+    assert snapshot.status == AnalysisJob.RUNNING
+    assert list(snapshot.results) == ['job_analysis']
+    assert snapshot is not store.get('job')
+
+
+def test_memory_store_job_runs_to_completion(monkeypatch):
+    monkeypatch.setattr(analysis_jobs, 'AnalysisPipeline', FakePipeline)
+    manager = AnalysisJobManager(max_workers=1, store=MemoryAnalysisJobStore())
+
+    job = manager.submit('resume', 'job description')
+    manager.executor.shutdown(wait=True)
+
+    status = manager.get_status(job.analysis_id)
+    assert status['status'] == AnalysisJob.COMPLETED
+    assert status['steps_completed'] == list(STEP_RESULT_KEYS.values())
+    assert status['metadata'] == {'mode': 'standard'}
@@ -0,0 +1,68 @@
+from services.ats_rules import ATSRuleEngine
+
+BULLETS = '\n'.join(
+    f'- Built and operated Python service number {index} handling customer traffic at scale'
+    for index in range(25)
+)
+RESUME = f"""Jane Doe
+jane@example.com | +1 (555) 123-4567 | linkedin.com/in/janedoe
+
+Summary
+Backend engineer with eight years of experience building Python services.
+
+Experience
+Acme Corp, Senior Engineer, 2019-2024
+{BULLETS}
+
+Education
+BSc Computer Science, State University, 2015
+
+Skills
+Python, Go, Kubernetes, PostgreSQL, AWS, Terraform
+"""
+
+
+def test_well_formed_resume_has_no_issues():
+    result = ATSRuleEngine().scan(RESUME)
+
+    assert result.ats_score == 100
+    assert result.issues == {'formatting': [], 'content': [], 'keywords': []}
+    assert result.section_readability['contact'] == 'excellent'
+    assert result.section_readability['experience'] == 'good'
+    assert result.section_readability['certifications'] == 'missing'
+
+
+def test_missing_sections_and_contact_details_cost_points():
+    text = RESUME.replace('jane@example.com | ', '').replace('\nSkills\n', '\nTools used\n')
+
+    result = ATSRuleEngine().scan(text)
+
+    assert 'No email address found' in result.issues['content']
+    assert 'Missing a standard "Skills" section heading' in result.issues['content']
+    assert result.issues['keywords'] == ['No dedicated skills section for keyword scanning']
+    assert result.ats_score == 100 - 10 - 10 - 5
+    assert result.section_readability['contact'] == 'needs_improvement'
+
+
+def test_date_ranges_are_not_phone_numbers():
+    text = RESUME.replace(' | +1 (555) 123-4567', '')
+
+    assert 'No phone number found' in ATSRuleEngine().scan(text).issues['content']
+
+
+def test_layout_problems_are_formatting_issues():
+    table = '\n'.join(['+' + '-' * 20 + '+', '| Python | 8 years |', '+' + '-' * 20 + '+'])
+    text = RESUME.replace('- Built', '➢ Built', 1) + table + '\n' + 'word ' * 50 + '\n'
+
+    issues = ATSRuleEngine().scan(text).issues['formatting']
+
+    assert 'Tables or multi-column layout detected' in issues
+    assert 'Non-standard bullet characters: ➢' in issues
+    assert '1 line(s) longer than 200 characters' in issues
+
+
+def test_score_never_goes_below_zero():
+    result = ATSRuleEngine().scan('')
+
+    assert result.ats_score >= 0
+    assert all(grade == 'missing' for grade in result.section_readability.values())
@@ -0,0 +1,138 @@
+import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+import app as app_module
+from config import Config
+from services import circuit_breaker, claude_service, job_analysis_cache, response_cache
+from services.batch_analyzer import BatchAnalyzer
+from services.circuit_breaker import CircuitBreaker
+from services.claude_service import ClaudeService
+from services.job_analysis_cache import JobAnalysisCache
+from services.rate_limiter import RateLimiter
+from services.response_cache import MemoryResponseCache
+from utils.cache import LRUCache, TieredCache
+
+RESUME = (
+    "Jane Doe\njane@example.com\n\nSkills\nPython, Kubernetes\n\n"
+    "Experience\nBuilt Python services running on Kubernetes for five years"
+)
+# Posting name -> match score the fake gap analysis reports for it
+MATCH_SCORES = {'Alpha': 60, 'Beta': 90, 'Gamma': 75}
+
+
+def posting(name):
+    return f"Posting {name}: senior Python engineer running services on Kubernetes at scale"
+
+
+class FakeClient:
+    """Claude client that answers each step and counts the calls per step"""
+
+    def __init__(self):
+        self.messages = self
+        self.calls = {'job': 0, 'gap': 0, 'ats': 0}
+        self._lock = threading.Lock()
+
+    def create(self, **kwargs):
+        prompt = kwargs['messages'][0]['content']
+        if 'Analyze the following job description' in prompt:
+            step = 'job'
+            name = re.search(r'Posting (\w+)', prompt).group(1)
+            if name == 'Broken':
+                reply = 'not json'
+            else:
+                reply = json.dumps({
+                    'required_skills': [name], 'preferred_skills': [],
+                    'key_responsibilities': ['Build services'], 'ats_keywords': ['Python']
+                })
+        elif 'Compare the candidate' in prompt:
+            step = 'gap'
+            name = next(name for name in MATCH_SCORES if f'"{name}"' in prompt)
+            reply = json.dumps({'match_score': MATCH_SCORES[name], 'strengths': [], 'gaps': []})
+        else:
+            step = 'ats'
+            reply = json.dumps({
+                'ats_score': 80,
+                'issues': {'formatting': [], 'content': [], 'keywords': []},
+                'section_readability': {}, 'recommendations': []
+            })
+
+        with self._lock:
+            self.calls[step] += 1
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=reply)],
+            usage=SimpleNamespace(input_tokens=10, output_tokens=5)
+        )
+
+
+@pytest.fixture(autouse=True)
+def isolated(monkeypatch):
+    """Fresh caches and breaker, and the Claude-backed ATS scan"""
+    monkeypatch.setattr(
+        job_analysis_cache, '_job_analysis_cache', JobAnalysisCache(TieredCache(LRUCache(16)))
+    )
+    monkeypatch.setattr(response_cache, '_response_cache', MemoryResponseCache(10 ** 6))
+    monkeypatch.setattr(circuit_breaker, '_circuit_breaker', CircuitBreaker())
+    monkeypatch.setattr(Config, 'ATS_SCAN_MODE', 'llm')
+
+
+def compare(client, names):
+    service = ClaudeService(
+        client=client, response_cache=MemoryResponseCache(10 ** 6),
+        rate_limiter=RateLimiter(), circuit_breaker=CircuitBreaker()
+    )
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        return BatchAnalyzer(claude_service=service, executor=executor).compare_job_descriptions(
+            RESUME, [posting(name) for name in names], optimize=False
+        )
+
+
+def test_resume_is_scanned_once_and_postings_ranked_by_match_score():
+    client = FakeClient()
+
+    comparison = compare(client, ['Alpha', 'Beta', 'Gamma'])
+
+    assert client.calls == {'job': 3, 'gap': 3, 'ats': 1}
+    assert [entry['index'] for entry in comparison['ranking']] == [1, 2, 0]
+    assert [entry['match_score'] for entry in comparison['ranking']] == [90, 75, 60]
+    assert [entry['rank'] for entry in comparison['ranking']] == [1, 2, 3]
+    assert comparison['ats_scan']['ats_score'] == 80
+    # The shared scan is reported once, not per posting
+    assert all('step3_ats_scan' not in entry['results'] for entry in comparison['ranking'])
+    assert comparison['failed'] == []
+
+
+def test_one_failing_posting_does_not_fail_the_comparison():
+    client = FakeClient()
+
+    comparison = compare(client, ['Alpha', 'Broken', 'Beta'])
+
+    assert [entry['index'] for entry in comparison['ranking']] == [2, 0]
+    assert [entry['index'] for entry in comparison['failed']] == [1]
+    assert client.calls['ats'] == 1
+
+
+def test_compare_endpoint_ranks_postings(monkeypatch):
+    client = FakeClient()
+    monkeypatch.setattr(claude_service, '_shared_client', client)
+
+    response = app_module.app.test_client().post('/api/batch/compare', data={
+        'resume_text': RESUME,
+        'job_descriptions': [posting('Gamma'), posting('Beta')],
+        'optimize': 'false'
+    })
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert [entry['index'] for entry in body['ranking']] == [1, 0]
+    assert client.calls['ats'] == 1
+
+
+def test_compare_endpoint_requires_job_descriptions():
+    response = app_module.app.test_client().post('/api/batch/compare', data={'resume_text': RESUME})
+
+    assert response.status_code == 400
@@ -0,0 +1,81 @@
+import os
+import time
+
+from utils.cache import DiskCache, LRUCache, TieredCache
+
+
+def test_lru_evicts_the_least_recently_used_entry():
+    cache = LRUCache(max_entries=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    # Reading 'a' makes 'b' the oldest entry
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert len(cache) == 2
+
+
+def test_disk_entries_expire_after_the_ttl(tmp_path):
+    cache = DiskCache(str(tmp_path), ttl=0.1)
+    cache.set('key', {'score': 80})
+    assert cache.get('key') == {'score': 80}
+
+    time.sleep(0.15)
+
+    assert cache.get('key') is None
+    # The expired file is removed rather than re-read every time
+    assert os.listdir(tmp_path) == []
+
+
+def test_disk_entries_without_ttl_never_expire(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    cache.set('key', [1, 2])
+
+    assert DiskCache(str(tmp_path)).get('key') == [1, 2]
+
+
+def test_unreadable_disk_entry_is_a_miss(tmp_path):
+    cache = DiskCache(str(tmp_path))
+    (tmp_path / 'key.json').write_text('{not json', encoding='utf-8')
+
+    assert cache.get('key') is None
+
+
+def test_disk_hit_is_promoted_into_memory(tmp_path):
+    disk = DiskCache(str(tmp_path))
+    disk.set('key', 'value')
+    cache = TieredCache(LRUCache(4), disk)
+
+    assert cache.get('key') == 'value'
+    disk.clear()
+    # Served from memory now that the disk copy is gone
+    assert cache.get('key') == 'value'
+
+    stats = cache.stats()
+    assert stats['disk_hits'] == 1
+    assert stats['memory_hits'] == 1
+    assert stats['memory_entries'] == 1
+
+
+def test_tiered_cache_survives_memory_eviction_through_disk(tmp_path):
+    cache = TieredCache(LRUCache(1), DiskCache(str(tmp_path)))
+    cache.set('a', 1)
+    cache.set('b', 2)
+
+    assert cache.get('a') == 1
+    assert cache.stats()['disk_hits'] == 1
+
+
+def test_tiered_cache_stats_report_the_hit_rate():
+    cache = TieredCache(LRUCache(4))
+    cache.set('key', 'value')
+    cache.get('key')
+    cache.get('missing')
+
+    stats = cache.stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+    assert stats['hit_rate'] == 0.5
@@ -0,0 +1,102 @@
+import time
+
+import pytest
+
+import app as app_module
+from services import circuit_breaker, claude_service
+from services.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+class UnusedClient:
+    """Claude client that fails the test if a call gets past the breaker"""
+
+    class messages:
+        @staticmethod
+        def create(**kwargs):
+            raise AssertionError("Claude called while the circuit is open")
+
+
+def open_breaker(open_seconds=30):
+    breaker = CircuitBreaker(min_calls=1, open_seconds=open_seconds)
+    breaker.before_call()
+    breaker.record(failed=True)
+    return breaker
+
+
+def test_batch_analyze_returns_503_while_circuit_is_open(monkeypatch):
+    monkeypatch.setattr(circuit_breaker, '_circuit_breaker', open_breaker())
+    monkeypatch.setattr(claude_service, '_shared_client', UnusedClient())
+
+    response = app_module.app.test_client().post('/api/batch/analyze', data={
+        'job_description': 'Circuit breaker test posting for a senior Python engineer. ' * 5,
+        'resume_texts': ['Python developer with ten years of backend experience. ' * 5]
+    })
+
+    assert response.status_code == 503
+    assert response.get_json()['success'] is False
+    assert int(response.headers['Retry-After']) >= 1
+
+
+def test_circuit_opens_once_the_failure_rate_is_reached():
+    breaker = CircuitBreaker(failure_rate=0.5, min_calls=4)
+    for failed in (False, True, False):
+        breaker.before_call()
+        breaker.record(failed=failed)
+    # Too few calls to trust the rate yet
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.before_call()
+    breaker.record(failed=True)
+
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.before_call()
+    assert 0 < error.value.retry_after <= 30
+
+
+def test_slow_calls_count_as_failures():
+    breaker = CircuitBreaker(min_calls=1, slow_call_seconds=1)
+    breaker.before_call()
+    breaker.record(failed=False, latency=2)
+
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_successful_trial_call_closes_the_circuit():
+    breaker = open_breaker(open_seconds=0.1)
+    time.sleep(0.15)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    breaker.before_call()
+    # Only one trial call at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record(failed=False)
+
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.before_call()
+
+
+def test_failed_trial_call_opens_the_circuit_again():
+    breaker = open_breaker(open_seconds=0.1)
+    time.sleep(0.15)
+
+    breaker.before_call()
+    breaker.record(failed=True)
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.stats()['times_opened'] == 2
+
+
+def test_old_failures_leave_the_window():
+    breaker = CircuitBreaker(failure_rate=0.3, min_calls=2, window=0.1)
+    breaker.before_call()
+    breaker.record(failed=True)
+    time.sleep(0.15)
+
+    breaker.before_call()
+    breaker.record(failed=False)
+    breaker.before_call()
+    breaker.record(failed=False)
+
+    assert breaker.state == CircuitBreaker.CLOSED
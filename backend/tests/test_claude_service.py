@@ -0,0 +1,150 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from config import Config
+from services import claude_service
+from services.claude_service import ClaudeService, get_shared_client
+from services.rate_limiter import RateLimiter
+
+
+class RecordingBreaker:
+    """Circuit breaker that records the latency of every call"""
+
+    def __init__(self):
+        self.latencies = []
+
+    def before_call(self):
+        pass
+
+    def record(self, failed, latency=None):
+        self.latencies.append(latency)
+
+
+class FakeStream:
+    def __init__(self):
+        self.text_stream = iter(['Optimized ', 'resume ', 'text'])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class FakeClient:
+    """Claude client answering every call with a fixed reply"""
+
+    def __init__(self):
+        self.messages = self
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return SimpleNamespace(
+            content=[SimpleNamespace(text='{"ok": true}')],
+            usage=SimpleNamespace(input_tokens=10, output_tokens=5)
+        )
+
+    def stream(self, **kwargs):
+        return FakeStream()
+
+
+def make_service(breaker=None, limiter=None):
+    return ClaudeService(
+        client=FakeClient(),
+        rate_limiter=limiter or RateLimiter(),
+        circuit_breaker=breaker or RecordingBreaker()
+    )
+
+
+def test_only_short_output_calls_count_toward_slow_calls():
+    breaker = RecordingBreaker()
+    service = make_service(breaker)
+
+    service.send_prompt('Extract the job', step='job')
+    service.send_prompt('Rewrite the resume', step='optimize')
+
+    job_latency, optimize_latency = breaker.latencies
+    assert job_latency is not None
+    assert optimize_latency is None
+
+
+def test_stream_closed_by_consumer_returns_unused_reservation():
+    limiter = RateLimiter(tokens_per_minute=100000)
+    service = make_service(limiter=limiter)
+
+    chunks = service.stream_prompt('Rewrite the resume', step='optimize')
+    assert next(chunks) == 'Optimized '
+    # The client disconnected
+    chunks.close()
+
+    # Only the prompt and the one chunk are charged, not all 8192 max_tokens
+    assert limiter.capacity['tokens'] - limiter._state['tokens'] < 100
+
+
+def test_each_step_is_sent_with_its_routed_settings():
+    service = make_service()
+
+    service.send_prompt('Extract the job', step='job')
+    service.send_prompt('Rewrite the resume', step='optimize')
+
+    job_call, optimize_call = service.client.calls
+    for call, step in ((job_call, 'job'), (optimize_call, 'optimize')):
+        route = Config.MODEL_ROUTING[step]
+        assert (call['model'], call['max_tokens'], call['temperature']) == (
+            route['model'], route['max_tokens'], route['temperature']
+        )
+    assert service.get_routing() == {
+        'job': Config.MODEL_ROUTING['job'], 'optimize': Config.MODEL_ROUTING['optimize']
+    }
+
+
+def test_explicit_arguments_override_the_route():
+    service = make_service()
+
+    settings = service.route('job', max_tokens=100, temperature=0.0)
+
+    assert settings == {
+        'model': Config.MODEL_ROUTING['job']['model'], 'max_tokens': 100, 'temperature': 0.0
+    }
+    assert service.route()['model'] == Config.CLAUDE_MODEL
+
+
+def test_sessions_count_their_own_usage():
+    service = make_service()
+    first, second = service.session(), service.session()
+
+    first.send_prompt('Extract the job', step='job')
+
+    assert first.get_usage() == {'api_calls': 1, 'input_tokens': 10, 'output_tokens': 5}
+    assert second.get_usage()['api_calls'] == 0
+    assert second.get_routing() == {}
+    # Sessions share the client
+    assert second.client is first.client
+
+
+def test_threads_share_one_client(monkeypatch):
+    monkeypatch.setattr(Config, 'CLAUDE_API_KEY', 'test-key')
+    monkeypatch.setattr(claude_service, '_shared_client', None)
+    clients = []
+
+    threads = [threading.Thread(target=lambda: clients.append(get_shared_client())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(client) for client in clients}) == 1
+    # Retries belong to the RetryPolicy, not the SDK
+    assert clients[0].max_retries == 0
+    assert ClaudeService(rate_limiter=RateLimiter(), circuit_breaker=RecordingBreaker()).client is clients[0]
+
+
+def test_shared_client_needs_an_api_key(monkeypatch):
+    monkeypatch.setattr(Config, 'CLAUDE_API_KEY', None)
+    monkeypatch.setattr(claude_service, '_shared_client', None)
+
+    with pytest.raises(ValueError):
+        get_shared_client()
@@ -0,0 +1,61 @@
+import zipfile
+from io import BytesIO
+
+from services.docx_extractor import DocxExtractor
+from services.resume_parser import ResumeParser
+
+NAMESPACE = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+
+def make_docx(body):
+    """Build an in-memory DOCX whose document body is the given XML"""
+    document = (
+        f'<?xml version="1.0" encoding="UTF-8"?>'
+        f'<w:document xmlns:w="{NAMESPACE}"><w:body>{body}</w:body></w:document>'
+    )
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('word/document.xml', document)
+        archive.writestr('word/media/image1.png', b'\x89PNG' + b'\0' * 1024)
+    buffer.seek(0)
+    return buffer
+
+
+def paragraph(*runs, properties=''):
+    text = ''.join(f'<w:r>{run}</w:r>' for run in runs)
+    return f'<w:p>{properties}{text}</w:p>'
+
+
+def test_each_paragraph_becomes_a_line():
+    source = make_docx(
+        paragraph('<w:t>Jane </w:t>', '<w:t>Doe</w:t>')
+        + paragraph('<w:t>Experience</w:t>')
+        + paragraph('<w:t>Acme</w:t><w:tab/><w:t>2019</w:t><w:br/><w:t>Engineer</w:t>')
+    )
+
+    assert DocxExtractor.extract_text(source) == 'Jane Doe\nExperience\nAcme\t2019\nEngineer'
+
+
+def test_list_items_are_bulleted():
+    numbered = '<w:pPr><w:numPr><w:ilvl w:val="0"/></w:numPr></w:pPr>'
+    styled = '<w:pPr><w:pStyle w:val="ListBullet"/></w:pPr>'
+    source = make_docx(
+        paragraph('<w:t>Built services</w:t>', properties=numbered)
+        + paragraph('<w:t>Led a team</w:t>', properties=styled)
+        + paragraph('<w:t>Skills</w:t>')
+    )
+
+    assert DocxExtractor.extract_text(source) == '• Built services\n• Led a team\nSkills'
+
+
+def test_parsed_docx_sections_are_detected():
+    source = make_docx(
+        paragraph('<w:t>Jane Doe</w:t>')
+        + paragraph('<w:t>Skills</w:t>')
+        + paragraph('<w:t>Python</w:t>')
+    )
+
+    parsed = ResumeParser.parse_file(source.getvalue(), filename='resume.docx')
+
+    assert parsed['text'] == 'Jane Doe\nSkills\nPython'
+    assert 'skills' in parsed['sections']
@@ -0,0 +1,110 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from models.analysis_models import JobAnalysisResult
+from services import job_analysis_cache
+from services.analysis_pipeline import AnalysisPipeline
+from services.ats_scanner import ATSScanner
+from services.circuit_breaker import CircuitBreaker
+from services.claude_service import ClaudeService
+from services.fused_analyzer import FusedAnalyzer
+from services.job_analysis_cache import JobAnalysisCache
+from services.rate_limiter import RateLimiter
+from utils.cache import LRUCache, TieredCache
+
+RESUME = "Jane Doe\njane@example.com\n\nSkills\nPython, Kubernetes\n\nExperience\nBuilt Python services"
+JOB_DESCRIPTION = "Senior Python engineer running services on Kubernetes"
+
+FUSED_REPLY = {
+    'job_analysis': {
+        'required_skills': ['Python'], 'preferred_skills': [],
+        'key_responsibilities': ['Build services'], 'ats_keywords': ['Python']
+    },
+    'gap_analysis': {'match_score': 80, 'strengths': ['Python'], 'gaps': []},
+    'ats_scan': {
+        'ats_score': 10,
+        'issues': {'formatting': [], 'content': ['claude content issue'], 'keywords': []},
+        'section_readability': {},
+        'recommendations': ['claude recommendation']
+    }
+}
+STEP_REPLIES = {
+    'gap': {'match_score': 70, 'strengths': ['Python'], 'gaps': []},
+    'optimize': {'optimized_text': 'Optimized', 'changes_made': []}
+}
+
+
+class FakeClient:
+    """Claude client that answers each step and records the steps it was asked"""
+
+    def __init__(self):
+        self.messages = self
+        self.steps = []
+
+    def create(self, **kwargs):
+        prompt = kwargs['messages'][0]['content']
+        if 'Complete all three parts' in prompt:
+            step, reply = 'fused', FUSED_REPLY
+        elif kwargs['max_tokens'] == 8192:
+            step, reply = 'optimize', STEP_REPLIES['optimize']
+        elif 'match_score' in prompt:
+            step, reply = 'gap', STEP_REPLIES['gap']
+        else:
+            step, reply = 'ats', FUSED_REPLY['ats_scan']
+        self.steps.append(step)
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=json.dumps(reply))],
+            usage=SimpleNamespace(input_tokens=10, output_tokens=5)
+        )
+
+
+@pytest.fixture
+def job_cache(monkeypatch):
+    cache = JobAnalysisCache(TieredCache(LRUCache(16)))
+    monkeypatch.setattr(job_analysis_cache, '_job_analysis_cache', cache)
+    return cache
+
+
+def make_service(client):
+    return ClaudeService(client=client, rate_limiter=RateLimiter(), circuit_breaker=CircuitBreaker())
+
+
+def test_fused_scan_follows_fast_ats_mode(job_cache):
+    service = make_service(FakeClient())
+    scanner = ATSScanner(service, mode='fast')
+
+    _, _, ats_scan = FusedAnalyzer(service, ats_scanner=scanner).analyze(RESUME, JOB_DESCRIPTION)
+
+    assert ats_scan == scanner.rule_engine.scan(RESUME)
+
+
+def test_fused_scan_combines_local_rules_in_hybrid_mode(job_cache):
+    service = make_service(FakeClient())
+    scanner = ATSScanner(service, mode='hybrid')
+
+    _, _, ats_scan = FusedAnalyzer(service, ats_scanner=scanner).analyze(RESUME, JOB_DESCRIPTION)
+
+    local = scanner.rule_engine.scan(RESUME)
+    assert ats_scan.issues['formatting'] == local.issues['formatting']
+    assert 'claude content issue' in ats_scan.issues['content']
+    assert ats_scan.ats_score != 10
+
+
+def test_fused_run_reuses_standard_step_1_cache_entry(job_cache):
+    client = FakeClient()
+    service = make_service(client)
+    cached = JobAnalysisResult(
+        required_skills=['Python'], preferred_skills=[],
+        key_responsibilities=['Build services'], ats_keywords=['Python']
+    )
+    job_cache.set(JOB_DESCRIPTION, service.route('job')['model'], cached)
+
+    result = AnalysisPipeline(claude_service=service, mode='fused').run(
+        'analysis', RESUME, JOB_DESCRIPTION
+    )
+
+    assert 'fused' not in client.steps
+    assert result.metadata['mode'] == 'standard'
+    assert result.job_analysis == cached.to_dict()
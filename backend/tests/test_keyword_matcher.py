@@ -0,0 +1,38 @@
+import pytest
+
+from services.keyword_matcher import KeywordMatcher, get_keyword_matcher
+
+
+@pytest.mark.parametrize('keyword, text, expected', [
+    # Acronyms are not derived from arbitrary phrases
+    ('Go To Market', 'Led the GM strategy', False),
+    ('Customer Service', 'Managed the CS team', False),
+    # Known acronym pairs match both ways without the taxonomy
+    ('RHEL', 'Administered Red Hat Enterprise Linux servers', True),
+    ('Machine Learning', 'Built ML models', True),
+    ('Machine Learning', 'Added 5 ml of water', False),
+    # Mixed-case acronyms match as the acronym writes them
+    ('Infrastructure as Code', 'Wrote IaC for SaaS products', True),
+    ('Software as a Service', 'Wrote IaC for SaaS products', True),
+    ('Software as a Service', 'Kept saas and SAAS apart', False),
+    # Pairs the keyword spells out itself
+    ('Red Hat Enterprise Linux (RHEL)', 'Administered RHEL 8', True),
+])
+def test_acronym_forms(keyword, text, expected):
+    assert KeywordMatcher([keyword]).match(text) == {keyword: expected}
+
+
+def test_taxonomy_aliases_that_are_ordinary_words_match_only_as_written():
+    keywords = ['Machine Learning', 'Golang', 'REST APIs', 'Artificial Intelligence',
+                'Microsoft Excel']
+    matcher = get_keyword_matcher(keywords)
+
+    text = "Added 5 ml of water. Led go-live and took a rest day. Said ai. I excel at sales"
+    assert matcher.match(text) == {keyword: False for keyword in keywords}
+
+    text = "Shipped ML and AI features in Go behind REST endpoints, reported in Excel"
+    assert matcher.match(text) == {keyword: True for keyword in keywords}
+
+
+def test_taxonomy_aliases_still_match_in_any_case():
+    assert get_keyword_matcher(['Kubernetes']).match('Ran K8S clusters') == {'Kubernetes': True}
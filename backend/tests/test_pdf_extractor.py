@@ -0,0 +1,144 @@
+from io import BytesIO
+
+import pytest
+
+from config import Config
+from services import pdf_extractor
+from services.pdf_extractor import PDFExtractor
+
+
+def make_pdf(page_texts):
+    """Build a minimal PDF with one line of Helvetica text per page"""
+    page_count = len(page_texts)
+    font_id = 3 + 2 * page_count
+    objects = [
+        '<< /Type /Catalog /Pages 2 0 R >>',
+        '<< /Type /Pages /Kids [{}] /Count {} >>'.format(
+            ' '.join(f'{3 + 2 * index} 0 R' for index in range(page_count)), page_count
+        ),
+    ]
+    for index, text in enumerate(page_texts):
+        content = f'BT /F1 12 Tf 72 720 Td ({text}) Tj ET'
+        objects.append(
+            f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+            f'/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {4 + 2 * index} 0 R >>'
+        )
+        objects.append(f'<< /Length {len(content)} >>\nstream\n{content}\nendstream')
+    objects.append('<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>')
+
+    pdf = b'%PDF-1.4\n'
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += f'{number} 0 obj\n{body}\nendobj\n'.encode('latin-1')
+    xref = len(pdf)
+    pdf += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode('latin-1')
+    pdf += ''.join(f'{offset:010d} 00000 n \n' for offset in offsets).encode('latin-1')
+    pdf += (
+        f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'
+    ).encode('latin-1')
+    return pdf
+
+
+PDF = make_pdf(['Jane Doe', 'Experience', 'Skills'])
+
+
+class FakeConnection:
+    """Pipe end of a worker that never answers, or has died"""
+
+    def __init__(self, crashed=False):
+        self.crashed = crashed
+
+    def send(self, message):
+        pass
+
+    def poll(self, timeout):
+        # A dead worker's pipe reports EOF as soon as it is polled
+        return self.crashed
+
+    def recv(self):
+        raise EOFError
+
+    def close(self):
+        pass
+
+
+class FakeWorker:
+    def __init__(self, crashed=False):
+        self.conn = FakeConnection(crashed)
+        self.process = self
+        self.killed = False
+
+    def is_alive(self):
+        return not self.killed
+
+    def kill(self):
+        self.killed = True
+
+
+@pytest.fixture
+def workers(monkeypatch):
+    """Fresh worker pool for each test, stopped afterwards"""
+    idle = []
+    monkeypatch.setattr(pdf_extractor, '_idle_workers', idle)
+    monkeypatch.setattr(pdf_extractor, '_slots', None)
+    monkeypatch.setattr(Config, 'PDF_PROCESS_WORKERS', 2)
+    yield idle
+    for worker in idle:
+        worker.kill()
+
+
+def test_inline_extraction_reads_only_the_page_budget(monkeypatch):
+    monkeypatch.setattr(Config, 'PDF_PROCESS_WORKERS', 0)
+
+    def no_workers():
+        raise AssertionError("worker started with PDF_PROCESS_WORKERS=0")
+
+    monkeypatch.setattr(pdf_extractor, '_PDFWorker', no_workers)
+
+    assert PDFExtractor.extract_text(BytesIO(PDF), max_pages=2) == 'Jane Doe\nExperience'
+
+
+def test_running_out_of_time_raises_instead_of_truncating(monkeypatch):
+    monkeypatch.setattr(Config, 'PDF_PROCESS_WORKERS', 0)
+    times = iter([0, 0, 1000, 1000])
+    monkeypatch.setattr(pdf_extractor.time, 'time', lambda: next(times, 1000))
+
+    with pytest.raises(Exception, match='ran out of time after 1 of 3 pages'):
+        PDFExtractor.extract_text(BytesIO(PDF), timeout=10)
+
+
+def test_healthy_worker_returns_to_the_idle_pool(workers):
+    assert PDFExtractor.extract_text(BytesIO(PDF), max_pages=2) == 'Jane Doe\nExperience'
+    assert len(workers) == 1
+    worker = workers[0]
+    assert worker.process.is_alive()
+
+    # The next extraction reuses it instead of starting another process
+    assert PDFExtractor.extract_text(BytesIO(PDF)) == 'Jane Doe\nExperience\nSkills'
+    assert workers == [worker]
+
+
+def test_timeout_kills_only_the_offending_worker(workers, monkeypatch):
+    monkeypatch.setattr(PDFExtractor, 'RESULT_GRACE_SECONDS', 0)
+    bystander, stuck = FakeWorker(), FakeWorker()
+    workers.append(bystander)
+    monkeypatch.setattr(pdf_extractor, '_checkout_worker', lambda: stuck)
+
+    with pytest.raises(Exception, match='timed out'):
+        PDFExtractor.extract_text(BytesIO(PDF), timeout=0.1)
+
+    assert stuck.killed
+    assert not bystander.killed
+    assert workers == [bystander]
+
+
+def test_crashed_worker_raises_and_is_not_reused(workers, monkeypatch):
+    crashed = FakeWorker(crashed=True)
+    monkeypatch.setattr(pdf_extractor, '_checkout_worker', lambda: crashed)
+
+    with pytest.raises(Exception, match='PDF worker crashed'):
+        PDFExtractor.extract_text(BytesIO(PDF))
+
+    assert crashed.killed
+    assert workers == []
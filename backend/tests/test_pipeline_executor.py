@@ -0,0 +1,90 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from services.pipeline_executor import InlineExecutor, PipelineExecutor
+
+
+@pytest.fixture
+def pool():
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        yield executor
+
+
+def test_dependent_steps_receive_their_inputs(pool):
+    results = (
+        PipelineExecutor(pool)
+        .add_step('job', lambda: 'job')
+        .add_step('gap', lambda job: f'gap({job})', depends_on=['job'])
+        .add_step('optimize', lambda job, gap: f'optimize({job}, {gap})', depends_on=['job', 'gap'])
+        .run()
+    )
+
+    assert results['optimize'] == 'optimize(job, gap(job))'
+
+
+def test_independent_steps_run_concurrently(pool):
+    # Each step waits for the other, so this only finishes if both run at once
+    barrier = threading.Barrier(2, timeout=5)
+
+    results = (
+        PipelineExecutor(pool)
+        .add_step('gap', lambda: barrier.wait() is not None)
+        .add_step('ats', lambda: barrier.wait() is not None)
+        .run()
+    )
+
+    assert results == {'gap': True, 'ats': True}
+
+
+def test_initial_results_satisfy_dependencies_without_running_the_step():
+    calls = []
+    pipeline = (
+        PipelineExecutor(InlineExecutor())
+        .add_step('job', lambda: calls.append('job'))
+        .add_step('gap', lambda job: job.upper(), depends_on=['job'])
+    )
+
+    completed = []
+    results = pipeline.run(
+        initial_results={'job': 'cached'},
+        on_step_complete=lambda name, result: completed.append(name)
+    )
+
+    assert calls == []
+    assert results == {'job': 'cached', 'gap': 'CACHED'}
+    assert completed == ['gap']
+
+
+def test_failing_step_stops_the_pipeline():
+    calls = []
+
+    def fail():
+        raise RuntimeError('job analysis failed')
+
+    pipeline = (
+        PipelineExecutor(InlineExecutor())
+        .add_step('job', fail)
+        .add_step('gap', lambda job: calls.append('gap'), depends_on=['job'])
+    )
+
+    with pytest.raises(RuntimeError):
+        pipeline.run()
+    assert calls == []
+
+
+def test_invalid_graphs_are_rejected():
+    with pytest.raises(ValueError):
+        PipelineExecutor(InlineExecutor()).add_step('a', lambda: 1).add_step('a', lambda: 2)
+
+    with pytest.raises(ValueError):
+        PipelineExecutor(InlineExecutor()).add_step('gap', lambda job: 1, depends_on=['job']).run()
+
+    cyclic = (
+        PipelineExecutor(InlineExecutor())
+        .add_step('a', lambda b: 1, depends_on=['b'])
+        .add_step('b', lambda a: 2, depends_on=['a'])
+    )
+    with pytest.raises(ValueError):
+        cyclic.run()
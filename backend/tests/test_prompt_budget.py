@@ -0,0 +1,97 @@
+import pytest
+
+from config import Config
+from services.prompt_budget import PromptBudget
+
+RESUME = (
+    "Jane Doe\njane@example.com\n\n"
+    "Summary\nBackend engineer.\n\n"
+    "Experience\n" + "Built Python services at Acme.\n" * 40 + "\n"
+    "Skills\nPython, Kubernetes\n\n"
+    "Certifications\nCKA\n\n"
+    "Projects\n" + "Open source contributor.\n" * 20 + "\n"
+    "Awards\nHackathon winner\n"
+)
+
+
+@pytest.fixture
+def budgets(monkeypatch):
+    def set_budget(tokens):
+        for name in ('GAP_ANALYSIS', 'ATS_SCAN', 'OPTIMIZE', 'FUSED'):
+            monkeypatch.setattr(Config, f'PROMPT_BUDGET_{name}', tokens)
+        monkeypatch.setattr(Config, 'PROMPT_CHARS_PER_TOKEN', 4)
+
+    return set_budget
+
+
+def test_gap_analysis_drops_the_contact_preamble(budgets):
+    budgets(0)
+
+    scoped = PromptBudget.scope_resume(RESUME, 'gap_analysis')
+
+    assert 'jane@example.com' not in scoped
+    assert scoped.startswith('Summary')
+    assert 'Hackathon winner' in scoped
+
+
+def test_resume_within_budget_is_sent_whole(budgets):
+    budgets(100000)
+
+    assert PromptBudget.scope_resume(RESUME, 'ats_scan') == RESUME.strip()
+
+
+def test_low_priority_sections_are_dropped_first(budgets):
+    budgets(PromptBudget.estimate_tokens(RESUME) - 20)
+
+    scoped = PromptBudget.scope_resume(RESUME, 'ats_scan')
+
+    assert 'Awards' not in scoped
+    assert 'Projects' not in scoped
+    assert 'Certifications\nCKA' in scoped
+    assert 'jane@example.com' in scoped
+
+
+def test_longest_section_is_shortened_as_a_last_resort(budgets):
+    budgets(120)
+
+    scoped = PromptBudget.scope_resume(RESUME, 'ats_scan')
+
+    assert PromptBudget.estimate_tokens(scoped) <= 120
+    # Every graded section keeps at least its header line
+    for header in ('Summary', 'Experience', 'Skills', 'Certifications'):
+        assert header in scoped
+    assert PromptBudget.TRUNCATION_MARKER.strip() in scoped
+
+
+def test_reserved_tokens_come_out_of_the_budget(budgets):
+    budgets(PromptBudget.estimate_tokens(RESUME))
+
+    assert PromptBudget.scope_resume(RESUME, 'ats_scan') == RESUME.strip()
+    assert 'Awards' not in PromptBudget.scope_resume(RESUME, 'ats_scan', reserved_tokens=20)
+
+
+def test_optimizer_resume_is_never_truncated(budgets):
+    budgets(10)
+
+    assert PromptBudget.scope_resume(RESUME, 'optimize') == RESUME.strip()
+
+
+def test_resume_without_headers_is_cut_at_a_line_boundary(budgets):
+    budgets(50)
+    text = 'Built Python services at Acme.\n' * 40
+
+    scoped = PromptBudget.scope_resume(text, 'gap_analysis')
+
+    assert PromptBudget.estimate_tokens(scoped) <= 50
+    assert scoped.endswith('[...]')
+    assert scoped.split('\n')[-2] == 'Built Python services at Acme.'
+
+
+def test_build_prompt_reserves_room_for_the_template(budgets):
+    budgets(PromptBudget.estimate_tokens(RESUME))
+    template = 'Instructions ' * 20 + '\n{resume_text}\n{job}'
+
+    prompt = PromptBudget.build_prompt('ats_scan', template, RESUME, job='Python engineer')
+
+    assert PromptBudget.fits('ats_scan', prompt)
+    assert prompt.endswith('Python engineer')
@@ -0,0 +1,89 @@
+import pytest
+
+import app as app_module
+from config import Config
+from services import claude_service, rate_limiter
+from services.rate_limiter import RateLimiter
+from services.retry_policy import DeadlineExceededError
+
+
+class UnusedClient:
+    """Claude client that fails the test if a call gets past the limiter"""
+
+    class messages:
+        @staticmethod
+        def create(**kwargs):
+            raise AssertionError("Claude called without rate limit capacity")
+
+
+def exhausted_limiter():
+    limiter = RateLimiter(requests_per_minute=1, max_wait=120)
+    limiter.acquire(10)
+    return limiter
+
+
+def test_wait_cut_short_by_deadline_raises_deadline_error():
+    with pytest.raises(DeadlineExceededError):
+        exhausted_limiter().acquire(10, timeout=0.2)
+
+
+def test_wait_over_max_wait_is_a_rate_limit_error():
+    limiter = RateLimiter(requests_per_minute=1, max_wait=0.2)
+    limiter.acquire(10)
+
+    with pytest.raises(Exception) as error:
+        limiter.acquire(10, timeout=5)
+    assert not isinstance(error.value, DeadlineExceededError)
+
+
+def test_analyze_returns_504_when_deadline_expires_waiting_for_capacity(monkeypatch):
+    monkeypatch.setattr(rate_limiter, '_rate_limiter', exhausted_limiter())
+    monkeypatch.setattr(claude_service, '_shared_client', UnusedClient())
+    monkeypatch.setattr(Config, 'ANALYZE_REQUEST_DEADLINE', 0.5)
+
+    response = app_module.app.test_client().post('/api/analyze', data={
+        'resume_text': 'Python developer with ten years of backend experience. ' * 5,
+        'job_description': 'Rate limit test posting for a senior Python engineer. ' * 5
+    })
+
+    assert response.status_code == 504
+    assert response.get_json()['success'] is False
+
+
+def test_bulk_callers_leave_the_interactive_reserve():
+    limiter = RateLimiter(requests_per_minute=10, interactive_reserve=0.2)
+    for _ in range(8):
+        assert limiter._try_acquire(1, RateLimiter.BULK) == 0
+
+    assert limiter._try_acquire(1, RateLimiter.BULK) > 0
+    assert limiter._try_acquire(1, RateLimiter.INTERACTIVE) == 0
+
+
+def test_reconcile_refunds_unused_tokens_without_overfilling():
+    limiter = RateLimiter(tokens_per_minute=1000)
+    reserved = limiter.acquire(800)
+
+    limiter.reconcile(reserved, 100)
+    # 200 left after the reservation, 700 refunded (plus a sliver of refill)
+    assert 900 <= limiter._state['tokens'] < 910
+
+    limiter.reconcile(500, 0)
+    assert limiter._state['tokens'] == 1000
+
+
+def test_backoff_pauses_every_caller():
+    limiter = RateLimiter(requests_per_minute=100)
+    limiter.backoff(5)
+
+    assert 4 < limiter._try_acquire(1, RateLimiter.INTERACTIVE) <= 5
+
+
+@pytest.mark.skipif(rate_limiter.fcntl is None, reason="shared state needs fcntl")
+def test_workers_draw_from_one_state_file(tmp_path):
+    state_file = str(tmp_path / 'rate_limit.json')
+    first = RateLimiter(requests_per_minute=2, state_file=state_file)
+    second = RateLimiter(requests_per_minute=2, state_file=state_file)
+
+    assert first._try_acquire(1, RateLimiter.INTERACTIVE) == 0
+    assert second._try_acquire(1, RateLimiter.INTERACTIVE) == 0
+    assert first._try_acquire(1, RateLimiter.INTERACTIVE) > 0
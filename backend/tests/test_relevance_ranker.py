@@ -0,0 +1,137 @@
+import json
+from types import SimpleNamespace
+
+import app as app_module
+from services.relevance_ranker import BM25Index, RelevanceRanker
+from utils.tokenizer import index_terms
+
+JOB_DESCRIPTION = "Senior Python engineer to build Kubernetes services and Terraform infrastructure"
+
+
+def resume(text, filler=20):
+    """Pad resumes to similar lengths so only their terms decide the order"""
+    return text + ' ' + 'Collaborated with colleagues on assorted work. ' * filler
+
+
+def test_more_matching_terms_rank_higher():
+    index = BM25Index([
+        resume('Java developer'),
+        resume('Python engineer building Kubernetes services with Terraform'),
+        resume('Python engineer'),
+    ])
+
+    assert [doc_id for doc_id, _ in index.rank(JOB_DESCRIPTION)] == [1, 2, 0]
+
+
+def test_terms_in_every_document_weigh_less():
+    index = BM25Index([
+        resume('Python Python Python Go'),
+        resume('Python Kubernetes Go Java'),
+        resume('Python Java Go Rust'),
+    ])
+
+    assert index.idf('python') < index.idf('kubernet')
+    # One rare match outweighs repeating a term every resume has
+    assert index.rank('Python Kubernetes')[0][0] == 1
+
+
+def test_bigrams_reward_matching_phrases():
+    index = BM25Index([
+        resume('learning about machine maintenance'),
+        resume('machine learning'),
+    ])
+
+    assert index.rank('machine learning')[0][0] == 1
+
+
+def test_rank_top_k_keeps_only_the_best_documents():
+    index = BM25Index([resume('Java'), resume('Python Kubernetes'), resume('Python'), resume('Go')])
+
+    ranked = index.rank('Python Kubernetes', top_k=2)
+
+    assert [doc_id for doc_id, _ in ranked] == [1, 2]
+    assert index.rank('Python Kubernetes', top_k=10) == index.rank('Python Kubernetes')
+
+
+def test_vocabulary_index_scores_like_a_full_index():
+    documents = [resume('Python Kubernetes services'), resume('Terraform and Go')]
+    vocabulary = set(index_terms(JOB_DESCRIPTION))
+
+    expected = BM25Index(documents).score(JOB_DESCRIPTION)
+    assert BM25Index(documents, vocabulary).score(JOB_DESCRIPTION) == expected
+
+
+def test_rank_resumes_reports_positions_and_names():
+    ranking = RelevanceRanker.rank_resumes(JOB_DESCRIPTION, [
+        {'name': 'java.txt', 'text': resume('Java developer')},
+        {'name': 'python.txt', 'text': resume('Python Kubernetes Terraform engineer')},
+    ], top_k=1)
+
+    assert len(ranking) == 1
+    assert ranking[0]['rank'] == 1
+    assert ranking[0]['index'] == 1
+    assert ranking[0]['name'] == 'python.txt'
+    assert ranking[0]['score'] > 0
+
+
+def post(path, **data):
+    data.setdefault('job_description', JOB_DESCRIPTION)
+    return app_module.app.test_client().post(path, data=data)
+
+
+def test_rank_endpoint_ranks_resumes():
+    response = post('/api/rank', resume_texts=[
+        resume('Java developer'), resume('Python Kubernetes Terraform engineer')
+    ], top_k='1')
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['total'] == 2
+    assert [entry['name'] for entry in body['ranking']] == ['resume_text_2']
+
+
+def test_rank_endpoint_validates_its_input():
+    assert post('/api/rank').status_code == 400
+    assert post('/api/rank', resume_texts=[resume('Python')], top_k='0').status_code == 400
+    assert post('/api/rank', resume_texts=[resume('Python')], top_k='many').status_code == 400
+    assert post('/api/rank', resume_texts=[resume('Python')], job_description='short').status_code == 400
+
+
+class RecordingBatchAnalyzer:
+    """Stands in for BatchAnalyzer and records which resumes were analyzed"""
+
+    analyzed = []
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def analyze_job(self, job_description):
+        return SimpleNamespace(to_dict=lambda: {'required_skills': ['Python']})
+
+    def iter_resume_analyses(self, job_description, job_analysis, resumes):
+        for index, item in enumerate(resumes):
+            RecordingBatchAnalyzer.analyzed.append(item['name'])
+            yield {'index': index, 'name': item['name'], 'success': True}
+
+
+def test_batch_top_k_only_analyzes_the_best_resumes(monkeypatch):
+    monkeypatch.setattr(app_module, 'BatchAnalyzer', RecordingBatchAnalyzer)
+    monkeypatch.setattr(RecordingBatchAnalyzer, 'analyzed', [])
+
+    response = post('/api/batch/analyze', top_k='2', resume_texts=[
+        resume('Java developer'),
+        resume('Python Kubernetes Terraform engineer'),
+        resume('Accountant'),
+        resume('Python engineer'),
+    ])
+
+    assert response.status_code == 200
+    entries = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert sorted(RecordingBatchAnalyzer.analyzed) == ['resume_text_2', 'resume_text_4']
+
+    resumes = {entry['name']: entry for entry in entries if entry['type'] == 'resume'}
+    assert resumes['resume_text_2']['relevance_rank'] == 1
+    assert resumes['resume_text_2']['index'] == 1
+    assert resumes['resume_text_1']['skipped'] is True
+    assert entries[-1]['skipped'] == 2
+    assert entries[-1]['succeeded'] == 2
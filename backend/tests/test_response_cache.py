@@ -0,0 +1,98 @@
+import os
+
+import pytest
+
+from services.response_cache import (
+    FileSystemResponseCache, MemoryResponseCache, ResponseCache, SQLiteResponseCache,
+    create_response_cache
+)
+
+
+@pytest.fixture(params=['memory', 'sqlite', 'filesystem'])
+def make_cache(request, tmp_path):
+    """Build a cache of each backend with the given size limit"""
+
+    def make(max_bytes=1000):
+        if request.param == 'memory':
+            return MemoryResponseCache(max_bytes)
+        if request.param == 'sqlite':
+            return SQLiteResponseCache(str(tmp_path / 'responses.sqlite3'), max_bytes)
+        return FileSystemResponseCache(str(tmp_path / 'responses'), max_bytes)
+
+    return make
+
+
+def test_key_covers_every_request_parameter():
+    key = ResponseCache.make_key('prompt', 'system', 'model', 0.0, 100)
+
+    assert key == ResponseCache.make_key('prompt', 'system', 'model', 0.0, 100)
+    assert key != ResponseCache.make_key('prompt', 'system', 'model', 0.0, 200)
+    assert key != ResponseCache.make_key('prompt', 'system', 'other-model', 0.0, 100)
+    assert key != ResponseCache.make_key('prompt', None, 'model', 0.0, 100)
+
+
+def test_round_trip_and_stats(make_cache):
+    cache = make_cache()
+    key = ResponseCache.make_key('prompt', None, 'model', 0.0, 100)
+
+    assert cache.get(key) is None
+    cache.set(key, '{"ok": true}')
+    assert cache.get(key) == '{"ok": true}'
+
+    stats = cache.stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+    assert stats['hit_rate'] == 0.5
+    assert stats['backend'] == cache.backend_name
+
+
+def test_least_recently_used_entry_is_evicted(make_cache):
+    cache = make_cache(max_bytes=25)
+    cache.set('a', 'x' * 10)
+    cache.set('b', 'y' * 10)
+    if isinstance(cache, FileSystemResponseCache):
+        # File mtimes can tie within a test, so age the entries explicitly
+        os.utime(cache._path('a'), (1, 1))
+        os.utime(cache._path('b'), (2, 2))
+    # Reading 'a' makes 'b' the oldest entry
+    assert cache.get('a') == 'x' * 10
+
+    cache.set('c', 'z' * 10)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 'x' * 10
+    assert cache.get('c') == 'z' * 10
+    assert cache.stats()['evictions'] == 1
+
+
+def test_entry_larger_than_the_limit_is_still_kept(make_cache):
+    cache = make_cache(max_bytes=5)
+    cache.set('a', 'x' * 10)
+
+    assert cache.get('a') == 'x' * 10
+
+
+def test_persistent_backends_are_shared_across_instances(tmp_path):
+    path = str(tmp_path / 'responses.sqlite3')
+    SQLiteResponseCache(path, 1000).set('key', 'value')
+    assert SQLiteResponseCache(path, 1000).get('key') == 'value'
+
+    directory = str(tmp_path / 'responses')
+    FileSystemResponseCache(directory, 1000).set('key', 'value')
+    assert FileSystemResponseCache(directory, 1000).get('key') == 'value'
+
+
+def test_create_response_cache_backends():
+    assert create_response_cache('none') is None
+    assert isinstance(create_response_cache('memory'), MemoryResponseCache)
+    with pytest.raises(ValueError):
+        create_response_cache('redis')
+
+
+def test_overwriting_a_file_entry_does_not_grow_the_size(tmp_path):
+    cache = FileSystemResponseCache(str(tmp_path), 1000)
+    for _ in range(5):
+        cache.set('key', 'x' * 100)
+
+    assert cache._size == 100
+    assert cache.stats()['evictions'] == 0
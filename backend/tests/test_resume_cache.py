@@ -0,0 +1,65 @@
+import pytest
+
+from services import resume_parser
+from services.resume_cache import ResumeCache
+from services.resume_parser import ResumeParser
+from utils.cache import LRUCache, TieredCache
+
+RESUME = b"Jane Doe\n\nSkills\nPython\n"
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = ResumeCache(TieredCache(LRUCache(16)))
+    monkeypatch.setattr(resume_parser, 'get_resume_cache', lambda: cache)
+    return cache
+
+
+def test_repeat_upload_skips_extraction(cache, monkeypatch):
+    first = ResumeParser.parse_file(RESUME, filename='resume.txt')
+
+    def unexpected(source):
+        raise AssertionError("file extracted again")
+
+    monkeypatch.setattr(ResumeParser, '_parse_txt', staticmethod(unexpected))
+    second = ResumeParser.parse_file(RESUME, filename='resume.txt')
+
+    assert second == first
+    assert cache.stats()['hits'] == 1
+
+
+def test_cached_entry_cannot_be_mutated_by_callers(cache):
+    parsed = ResumeParser.parse_file(RESUME, filename='resume.txt')
+    parsed['sections'].clear()
+
+    assert ResumeParser.parse_file(RESUME, filename='resume.txt')['sections']
+
+
+def test_key_covers_file_type_and_parser_version():
+    key = ResumeCache.make_key(RESUME, '.txt', '2')
+
+    assert key == ResumeCache.make_key(RESUME, '.txt', '2')
+    assert key != ResumeCache.make_key(RESUME, '.pdf', '2')
+    assert key != ResumeCache.make_key(RESUME, '.txt', '3')
+    assert key != ResumeCache.make_key(RESUME + b' ', '.txt', '2')
+
+
+def test_timed_out_pdf_parse_is_not_cached(cache, monkeypatch):
+    calls = []
+
+    def extract_text(source):
+        calls.append(1)
+        if len(calls) == 1:
+            raise Exception("PDF parsing ran out of time after 1 of 3 pages")
+        return 'Jane Doe\nSkills\nPython'
+
+    monkeypatch.setattr(resume_parser.PDFExtractor, 'extract_text', staticmethod(extract_text))
+
+    with pytest.raises(Exception, match='ran out of time'):
+        ResumeParser.parse_file(b'%PDF-1.4', filename='resume.pdf')
+    assert len(cache.cache.memory) == 0
+
+    # The next upload of the same file is parsed again, not served partial text
+    parsed = ResumeParser.parse_file(b'%PDF-1.4', filename='resume.pdf')
+    assert parsed['text'] == 'Jane Doe\nSkills\nPython'
+    assert len(calls) == 2
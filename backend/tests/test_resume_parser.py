@@ -0,0 +1,65 @@
+from services.resume_parser import ResumeParser
+
+RESUME = """Jane Doe
+jane@example.com
+
+Professional Summary
+Backend engineer with experience in Python.
+
+- Work Experience:
+Acme Corp, 2019-2024
+Gained experience running Kubernetes clusters.
+
+## Technical Skills
+Python, Go, Kubernetes
+
+Education: BSc Computer Science
+"""
+
+
+def test_sections_are_found_in_document_order():
+    spans = ResumeParser.split_sections(RESUME)
+
+    assert [name for name, *_ in spans] == ['summary', 'experience', 'skills', 'education']
+    assert [header for _, header, *_ in spans] == [
+        'Professional Summary', 'Work Experience', 'Technical Skills', 'Education'
+    ]
+
+
+def test_spans_cover_the_text_after_the_preamble():
+    spans = ResumeParser.split_sections(RESUME)
+
+    assert RESUME[:spans[0][3]] == 'Jane Doe\njane@example.com\n\n'
+    # Each section runs up to where the next one starts
+    for (_, _, _, _, end), (_, _, _, start, _) in zip(spans, spans[1:]):
+        assert end == start
+    assert spans[-1][4] == len(RESUME)
+
+    name, header, header_start, start, end = spans[1]
+    assert RESUME[start:end].startswith('- Work Experience:\nAcme Corp')
+    assert RESUME[header_start:].startswith('Work Experience')
+
+
+def test_header_words_in_body_text_are_not_sections():
+    text = "Summary\nFive years of experience with skills in education technology.\n"
+
+    assert [name for name, *_ in ResumeParser.split_sections(text)] == ['summary']
+
+
+def test_header_words_do_not_span_lines():
+    text = "Work\nExperience\nAcme Corp\n"
+
+    spans = ResumeParser.split_sections(text)
+
+    assert [(name, header) for name, header, *_ in spans] == [('experience', 'Experience')]
+
+
+def test_detected_sections_keep_the_first_of_repeated_headers():
+    text = "Skills\nPython\n\nExperience\nAcme\n\nSkills\nGo\n"
+
+    sections = ResumeParser.parse_text(text)['sections']
+
+    assert sections['skills']['position'] == 0
+    # The repeated header still closes the experience section
+    assert text[sections['experience']['start']:sections['experience']['end']] == 'Experience\nAcme\n\n'
+    assert sections['experience']['header'] == 'Experience'
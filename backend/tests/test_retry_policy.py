@@ -0,0 +1,111 @@
+import time
+from email.utils import formatdate
+from types import SimpleNamespace
+
+import anthropic
+import httpx
+import pytest
+
+from services import claude_service
+from services.circuit_breaker import CircuitBreaker
+from services.claude_service import ClaudeService
+from services.rate_limiter import RateLimiter
+from services.retry_policy import Deadline, DeadlineExceededError, RetryPolicy
+
+
+def api_error(status_code, headers=None):
+    request = httpx.Request('POST', 'https://api.anthropic.com/v1/messages')
+    response = httpx.Response(status_code, headers=headers or {}, request=request)
+    error_class = anthropic.RateLimitError if status_code == 429 else anthropic.APIStatusError
+    return error_class(f'HTTP {status_code}', response=response, body=None)
+
+
+class FlakyClient:
+    """Claude client that fails with the given errors, then answers"""
+
+    def __init__(self, *errors):
+        self.messages = self
+        self.errors = list(errors)
+        self.calls = 0
+
+    def create(self, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return SimpleNamespace(
+            content=[SimpleNamespace(text='OK')],
+            usage=SimpleNamespace(input_tokens=1, output_tokens=1)
+        )
+
+
+@pytest.mark.parametrize('headers, expected', [
+    ({'retry-after': '7'}, 7),
+    ({'retry-after-ms': '1500'}, 1.5),
+    ({}, None),
+])
+def test_retry_after_header(headers, expected):
+    assert RetryPolicy.retry_after(api_error(429, headers)) == expected
+
+
+def test_retry_after_http_date():
+    delay = RetryPolicy.retry_after(api_error(503, {'retry-after': formatdate(time.time() + 20)}))
+    assert 15 < delay <= 20
+
+
+def test_retry_after_is_the_minimum_delay():
+    policy = RetryPolicy(base_delay=1, max_delay=5)
+    assert policy.next_delay(0, api_error(429, {'retry-after': '12'})) == 12
+
+
+def test_delays_are_jittered_within_bounds():
+    policy = RetryPolicy(base_delay=1, max_delay=5)
+    delays = {policy.next_delay(2) for _ in range(50)}
+    assert all(1 <= delay <= 5 for delay in delays)
+    assert len(delays) > 1
+
+
+@pytest.mark.parametrize('status_code, attempt, expected', [
+    (529, 1, True),
+    (429, 2, True),
+    (429, 3, False),  # Out of attempts
+    (400, 1, False),  # A bad request fails the same way every time
+])
+def test_should_retry(status_code, attempt, expected):
+    assert RetryPolicy(max_attempts=3).should_retry(api_error(status_code), attempt) == expected
+
+
+def test_deadline_check_raises_once_expired():
+    deadline = Deadline(0.05)
+    deadline.check()
+    time.sleep(0.1)
+
+    assert deadline.remaining() == 0
+    with pytest.raises(DeadlineExceededError):
+        deadline.check('calling Claude')
+
+
+def test_service_waits_for_retry_after_then_succeeds(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(claude_service.time, 'sleep', sleeps.append)
+    client = FlakyClient(api_error(529, {'retry-after': '3'}))
+    service = ClaudeService(
+        client=client, rate_limiter=RateLimiter(), circuit_breaker=CircuitBreaker(),
+        retry_policy=RetryPolicy(max_attempts=3, base_delay=0.01, max_delay=0.1)
+    )
+
+    assert service.send_prompt('Hello') == 'OK'
+    assert client.calls == 2
+    assert sleeps == [3]
+
+
+def test_service_gives_up_when_retry_after_outlasts_the_deadline(monkeypatch):
+    monkeypatch.setattr(claude_service.time, 'sleep', lambda seconds: None)
+    client = FlakyClient(api_error(429, {'retry-after': '30'}))
+    service = ClaudeService(
+        client=client, rate_limiter=RateLimiter(), circuit_breaker=CircuitBreaker(),
+        retry_policy=RetryPolicy(max_attempts=3), deadline=Deadline(5)
+    )
+
+    with pytest.raises(DeadlineExceededError):
+        service.send_prompt('Hello')
+    assert client.calls == 1
@@ -0,0 +1,132 @@
+import os
+import threading
+import time
+
+import pytest
+
+from services.single_flight import SingleFlight, fcntl
+
+
+def run_concurrently(count, target):
+    """Start count threads running target(index) and return their results"""
+    results = [None] * count
+
+    def run(index):
+        results[index] = target(index)
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def analyze():
+        calls.append(1)
+        release.wait(5)
+        return {'score': 80}
+
+    threads, results = run_concurrently(5, lambda index: flight.do('key', analyze))
+    # Let every follower arrive while the leader is still running
+    time.sleep(0.2)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result == {'score': 80} for result, _ in results)
+    assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+
+
+def test_waiting_callers_receive_the_leaders_error():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def fail():
+        started.set()
+        time.sleep(0.2)
+        raise ValueError('analysis failed')
+
+    errors = []
+
+    def call(index):
+        if index:
+            started.wait(5)
+        try:
+            flight.do('key', fail)
+        except ValueError as e:
+            errors.append(str(e))
+
+    threads, _ = run_concurrently(3, call)
+    for thread in threads:
+        thread.join()
+
+    assert errors == ['analysis failed'] * 3
+
+
+def test_finished_call_is_not_shared_with_later_callers():
+    flight = SingleFlight()
+
+    assert flight.do('key', lambda: 1) == (1, False)
+    assert flight.do('key', lambda: 2) == (2, False)
+
+
+@pytest.mark.skipif(fcntl is None, reason="cross-process coalescing needs fcntl")
+def test_worker_queued_on_the_lock_file_reads_the_leaders_result(tmp_path):
+    lock_dir = str(tmp_path)
+    # Separate instances stand in for separate worker processes: each
+    # opens the lock file itself, so they coordinate only through the flock
+    leader, follower = SingleFlight(lock_dir), SingleFlight(lock_dir)
+    started = threading.Event()
+    calls = []
+
+    def analyze():
+        calls.append(1)
+        started.set()
+        time.sleep(0.5)
+        return {'score': 80}
+
+    outcome = {}
+    thread = threading.Thread(target=lambda: outcome.update(leader=leader.do('key', analyze)))
+    thread.start()
+    started.wait(5)
+
+    result = follower.do('key', analyze)
+    thread.join()
+
+    assert calls == [1]
+    assert outcome['leader'] == ({'score': 80}, False)
+    assert result == ({'score': 80}, True)
+    # Nothing is left behind for later callers
+    assert os.listdir(lock_dir) == []
+    assert follower.do('key', lambda: {'score': 90}) == ({'score': 90}, False)
+
+
+@pytest.mark.skipif(fcntl is None, reason="cross-process coalescing needs fcntl")
+def test_worker_queued_behind_a_failed_leader_runs_the_call_itself(tmp_path):
+    lock_dir = str(tmp_path)
+    leader, follower = SingleFlight(lock_dir), SingleFlight(lock_dir)
+    started = threading.Event()
+
+    def fail():
+        started.set()
+        time.sleep(0.5)
+        raise ValueError('analysis failed')
+
+    def leader_call():
+        with pytest.raises(ValueError):
+            leader.do('key', fail)
+
+    thread = threading.Thread(target=leader_call)
+    thread.start()
+    started.wait(5)
+
+    result = follower.do('key', lambda: {'score': 70})
+    thread.join()
+
+    assert result == ({'score': 70}, False)
+    assert os.listdir(lock_dir) == []
@@ -0,0 +1,57 @@
+from utils.tokenizer import count_terms, index_terms, split_forms, stem, term_key, tokenize
+
+
+def test_technology_names_survive_tokenization():
+    tokens = [word for _, word in tokenize('C++, C#, Node.js and CI/CD')]
+
+    assert tokens == ['C++', 'C#', 'Node.js', 'and', 'CI', 'CD']
+
+
+def test_stemming_only_touches_plain_long_words():
+    assert stem('clusters') == 'cluster'
+    assert stem('technologies') == 'technology'
+    assert stem('deploying') == 'deploy'
+    # Short words, acronyms and double-s endings are left alone
+    assert stem('aws') == 'aws'
+    assert stem('access') == 'access'
+    assert stem('c++') == 'c++'
+
+
+def test_tokens_keep_the_word_as_written():
+    assert tokenize('SaaS Platforms') == [('saas', 'SaaS'), ('platform', 'Platforms')]
+
+
+def test_stop_words_are_dropped_and_break_bigrams():
+    terms = index_terms('Design of distributed systems')
+
+    assert 'of' not in terms
+    assert 'design distribut' not in terms
+    assert terms == ['design', 'distribut', 'system', 'distribut system']
+
+
+def test_count_terms_matches_index_terms():
+    text = 'Machine learning engineers build machine learning systems, and the systems scale.'
+    counts, length = count_terms(text)
+
+    expected = {}
+    for term in index_terms(text):
+        expected[term] = expected.get(term, 0) + 1
+    assert dict(counts) == expected
+    assert counts['machine learn'] == 2
+    # Stop words don't count toward the document length
+    assert length == 9
+
+
+def test_count_terms_keeps_only_vocabulary_terms():
+    counts, length = count_terms(
+        'Machine learning on Kubernetes; machine learning at scale',
+        vocabulary={'machine', 'machine learn', 'kubernet'}
+    )
+
+    assert dict(counts) == {'machine': 2, 'machine learn': 2, 'kubernet': 1}
+    assert length == 6
+
+
+def test_term_key_and_split_forms():
+    assert term_key('Kubernetes Clusters') == 'kubernet cluster'
+    assert split_forms('Red Hat Enterprise Linux (RHEL)') == ['Red Hat Enterprise Linux', 'RHEL']
@@ -0,0 +1,47 @@
+from io import BytesIO
+
+import app as app_module
+from config import Config
+from utils.uploads import SizeLimitedStream
+
+RESUME = b"Jane Doe\njane@example.com\n\nSkills\nPython, Kubernetes\n"
+
+
+def upload_context(data, filename='resume.txt'):
+    return app_module.app.test_request_context(
+        '/api/analyze', method='POST',
+        data={'resume_file': (BytesIO(data), filename)},
+        content_type='multipart/form-data'
+    )
+
+
+def test_stream_counts_but_does_not_keep_bytes_past_the_limit():
+    stream = SizeLimitedStream(max_size=4)
+    stream.write(b'abc')
+    stream.write(b'defgh')
+
+    assert stream.exceeded
+    assert stream.received == 8
+    assert stream.getvalue() == b'abc'
+
+
+def test_upload_is_parsed_from_memory():
+    with upload_context(RESUME):
+        file = app_module.request.files['resume_file']
+        assert isinstance(file.stream, SizeLimitedStream)
+
+        resume_text, error = app_module._parse_resume_upload(file)
+
+    assert error is None
+    assert resume_text == RESUME.decode('utf-8').strip()
+
+
+def test_oversized_upload_is_rejected(monkeypatch):
+    monkeypatch.setattr(Config, 'MAX_FILE_SIZE', 16)
+
+    with upload_context(RESUME):
+        file = app_module.request.files['resume_file']
+        resume_text, error = app_module._parse_resume_upload(file)
+
+    assert resume_text is None
+    assert error.startswith('File too large')
@@ -0,0 +1,207 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU cache"""
+
+    def __init__(self, max_entries=256):
+        """
+        Args:
+            max_entries (int): Number of entries kept before evicting the least recently used
+        """
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Get a cached value
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            Cached value, or None if not present
+        """
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key, value):
+        """
+        Store a value, evicting the least recently used entries if full
+
+        Args:
+            key (str): Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class DiskCache:
+    """JSON file cache with a time-to-live, one file per key"""
+
+    def __init__(self, directory, ttl=None):
+        """
+        Args:
+            directory (str): Directory holding the cache files
+            ttl (float): Seconds an entry stays valid (None = never expires)
+        """
+        self.directory = directory
+        self.ttl = ttl
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key):
+        """
+        Get a cached value
+
+        Args:
+            key (str): Cache key (must be filename-safe, e.g. a hex digest)
+
+        Returns:
+            Cached value, or None if missing, expired or unreadable
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if self.ttl is not None and time.time() - entry.get('created', 0) > self.ttl:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+        return entry.get('value')
+
+    def set(self, key, value):
+        """
+        Store a JSON-serializable value
+
+        Args:
+            key (str): Cache key (must be filename-safe, e.g. a hex digest)
+            value: JSON-serializable value
+        """
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'created': time.time(), 'value': value}, f)
+            # Atomic so concurrent readers never see a partial file
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Disk cache write failed: {str(e)}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def clear(self):
+        """Remove all entries"""
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
+
+class TieredCache:
+    """In-memory LRU tier in front of an optional disk tier, with hit/miss counters"""
+
+    def __init__(self, memory, disk=None):
+        """
+        Args:
+            memory (LRUCache): Fast in-process tier
+            disk (DiskCache): Optional persistent tier shared across workers
+        """
+        self.memory = memory
+        self.disk = disk
+        self._lock = threading.Lock()
+        self._stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+
+    def get(self, key):
+        """
+        Get a cached value, promoting disk hits into memory
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        value = self.memory.get(key)
+        if value is not None:
+            self._count('memory_hits')
+            return value
+
+        if self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.set(key, value)
+                self._count('disk_hits')
+                return value
+
+        self._count('misses')
+        return None
+
+    def set(self, key, value):
+        """
+        Store a value in every tier
+
+        Args:
+            key (str): Cache key
+            value: JSON-serializable value
+        """
+        self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value)
+
+    def clear(self):
+        """Remove all entries from every tier"""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self):
+        """
+        Get hit/miss counters
+
+        Returns:
+            dict: Counters plus total hits, hit rate and in-memory size
+        """
+        with self._lock:
+            stats = dict(self._stats)
+
+        hits = stats['memory_hits'] + stats['disk_hits']
+        lookups = hits + stats['misses']
+        stats['hits'] = hits
+        stats['hit_rate'] = round(hits / lookups, 4) if lookups else 0.0
+        stats['memory_entries'] = len(self.memory)
+        return stats
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
@@ -1,4 +1,6 @@
 import re
+from collections import Counter
+from utils.tokenizer import index_terms
 
 
 class Formatters:
@@ -64,31 +66,19 @@ class Formatters:
     def extract_keywords(text, top_n=20):
         """
         Extract potential keywords from text
-        (Simple implementation - can be enhanced with NLP)
+
+        Uses the relevance tokenizer, so stop words are dropped and frequent
+        two-word phrases ("machine learning") count as keywords too.
 
         Args:
             text (str): Input text
             top_n (int): Number of keywords to extract
 
         Returns:
-            list: List of keywords
+            list: List of keywords, most frequent first
         """
-        # Remove common stop words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
-            'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-            'would', 'could', 'should', 'may', 'might', 'can', 'this', 'that',
-            'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they'
-        }
-
-        # Split into words and filter
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
-        keywords = [w for w in words if w not in stop_words]
-
-        # Count frequency
-        from collections import Counter
-        word_freq = Counter(keywords)
-
-        # Return top N most common
-        return [word for word, count in word_freq.most_common(top_n)]
+        terms = [
+            term for term in index_terms(text, stem_words=False)
+            if len(term) >= 3 and not term.isdigit()
+        ]
+        return [term for term, count in Counter(terms).most_common(top_n)]
@@ -0,0 +1,215 @@
+import functools
+import re
+from collections import Counter
+
+
+# Words keep inner symbols used by technology names (C++, C#, Node.js);
+# slashes split words, so "CI/CD" and "CI CD" tokenize the same
+TOKEN_PATTERN = re.compile(r"[A-Za-z0-9+#]+(?:\.[A-Za-z0-9+#]+)*")
+
+# Parenthesized alternate forms: "Red Hat Enterprise Linux (RHEL)"
+PARENTHETICAL_PATTERN = re.compile(r'\(([^)]*)\)')
+
+# Words too common to say anything about relevance
+STOP_WORDS = frozenset({
+    'a', 'about', 'above', 'after', 'all', 'also', 'an', 'and', 'any', 'are', 'as',
+    'at', 'be', 'been', 'being', 'both', 'but', 'by', 'can', 'could', 'did', 'do',
+    'does', 'each', 'etc', 'for', 'from', 'had', 'has', 'have', 'he', 'her', 'his',
+    'i', 'if', 'in', 'into', 'is', 'it', 'its', 'may', 'me', 'might', 'more', 'most',
+    'must', 'my', 'no', 'not', 'of', 'on', 'or', 'other', 'our', 'out', 'over',
+    'per', 'she', 'should', 'so', 'such', 'than', 'that', 'the', 'their', 'them',
+    'then', 'there', 'these', 'they', 'this', 'those', 'through', 'to', 'under',
+    'up', 'us', 'very', 'was', 'we', 'were', 'what', 'when', 'where', 'which',
+    'while', 'who', 'will', 'with', 'within', 'would', 'you', 'your',
+})
+
+# Suffixes removed by the stemmer, longest first
+STEM_SUFFIXES = (('ies', 'y'), ('ing', ''), ('ed', ''), ('es', ''), ('s', ''))
+
+
+@functools.lru_cache(maxsize=65536)
+def stem(word):
+    """
+    Reduce a folded word to a crude stem so inflections match
+
+    Only plain alphabetic words longer than four letters are stemmed, which
+    leaves acronyms and technology names such as "AWS" or "C++" intact.
+
+    Args:
+        word (str): Case-folded word
+
+    Returns:
+        str: Stemmed word
+    """
+    if len(word) <= 4 or not word.isalpha() or word.endswith('ss'):
+        return word
+
+    for suffix, replacement in STEM_SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[:-len(suffix)] + replacement
+
+    return word
+
+
+def tokenize(text, stem_words=True):
+    """
+    Split text into matchable tokens
+
+    Args:
+        text (str): Text to tokenize
+        stem_words (bool): Set to False to keep words unstemmed
+
+    Returns:
+        list: (token, word) for each word, where token is the folded (and
+            stemmed) word and word is the word as written (e.g. "SaaS")
+    """
+    words = TOKEN_PATTERN.findall(text or '')
+    if not stem_words:
+        return [(word.casefold(), word) for word in words]
+    return [(stem(word.casefold()), word) for word in words]
+
+
+def index_terms(text, ngrams=2, stem_words=True):
+    """
+    Turn text into the terms used for relevance scoring
+
+    Stop words are dropped, and bigrams never span a dropped stop word, so
+    "design of systems" yields no "design system" bigram.
+
+    Args:
+        text (str): Text to index
+        ngrams (int): 1 for single words, 2 to add adjacent word pairs
+        stem_words (bool): Set to False to keep words unstemmed
+
+    Returns:
+        list: Terms in document order, e.g. ["machine", "learn", "machine learn"]
+    """
+    terms = []
+    previous = None
+
+    for word in TOKEN_PATTERN.findall((text or '').casefold()):
+        if word in STOP_WORDS:
+            previous = None
+            continue
+        if stem_words:
+            word = stem(word)
+        terms.append(word)
+        if ngrams >= 2 and previous is not None:
+            terms.append(f"{previous} {word}")
+        previous = word
+
+    return terms
+
+
+def count_terms(text, vocabulary=None):
+    """
+    Count a document's index terms (see index_terms) in bulk
+
+    Distinct words are stemmed once each, then adjacent word pairs are
+    counted in a single pass. With a vocabulary, only its terms are kept,
+    and pairs are intersected with the vocabulary's bigrams.
+
+    Args:
+        text (str): Document text
+        vocabulary (set): If given, only these terms are counted
+
+    Returns:
+        tuple: (Counter of term -> frequency, number of non-stop words)
+    """
+    words = TOKEN_PATTERN.findall((text or '').casefold())
+    word_counts = Counter(words)
+    stop_words = STOP_WORDS.intersection(word_counts)
+    length = len(words) - sum(map(word_counts.__getitem__, stop_words))
+
+    # word -> stem, for the words whose stem can be counted alone or in a pair
+    kept = word_counts.keys() - stop_words
+    stems = dict(zip(kept, map(stem, kept)))
+    if vocabulary is not None:
+        vocabulary = frozenset(vocabulary)
+        words_needed = vocabulary_words(vocabulary)
+        stems = {word: term for word, term in stems.items() if term in words_needed}
+
+    counts = Counter()
+    for word, term in stems.items():
+        if vocabulary is None or term in vocabulary:
+            counts[term] += word_counts[word]
+
+    if vocabulary is None:
+        pairs = Counter(zip(map(stems.get, words), map(stems.get, words[1:])))
+        for (first, second), frequency in pairs.items():
+            if first is not None and second is not None:
+                counts[f"{first} {second}"] += frequency
+        return counts, length
+
+    bigrams = vocabulary_bigrams(vocabulary)
+    if bigrams:
+        stemmed = list(map(stems.get, words))
+        pairs = Counter(zip(stemmed, stemmed[1:]))
+        for pair in bigrams.intersection(pairs):
+            counts[' '.join(pair)] += pairs[pair]
+
+    return counts, length
+
+
+@functools.lru_cache(maxsize=32)
+def vocabulary_words(vocabulary):
+    """
+    Get every word stem a vocabulary's terms are made of
+
+    A bigram term can only be counted if both of its words are kept, even
+    when they are not vocabulary terms on their own.
+
+    Args:
+        vocabulary (frozenset): Index terms, e.g. {"machine learn"}
+
+    Returns:
+        frozenset: Word stems, e.g. {"machine", "learn"}
+    """
+    return frozenset(word for term in vocabulary for word in term.split(' '))
+
+
+@functools.lru_cache(maxsize=32)
+def vocabulary_bigrams(vocabulary):
+    """
+    Get the bigram terms of a vocabulary as word pairs
+
+    Cached, since ranking one query against thousands of documents reuses
+    the same vocabulary for every document.
+
+    Args:
+        vocabulary (frozenset): Index terms, e.g. {"machine", "machine learn"}
+
+    Returns:
+        frozenset: (first, second) stem pairs, e.g. {("machine", "learn")}
+    """
+    return frozenset(
+        tuple(term.split(' ')) for term in vocabulary if term.count(' ') == 1
+    )
+
+
+def term_key(text):
+    """
+    Normalize a short term for lookups
+
+    Args:
+        text (str): Skill or keyword
+
+    Returns:
+        str: Space-joined token stems, e.g. "Kubernetes Clusters" -> "kubernet cluster"
+    """
+    return ' '.join(token for token, _ in tokenize(text))
+
+
+def split_forms(term):
+    """
+    Split a term into its main form and parenthesized alternates
+
+    Args:
+        term (str): e.g. "Red Hat Enterprise Linux (RHEL)"
+
+    Returns:
+        list: e.g. ["Red Hat Enterprise Linux", "RHEL"], main form first
+    """
+    base = PARENTHETICAL_PATTERN.sub(' ', term).strip()
+    forms = [base] + [form.strip() for form in PARENTHETICAL_PATTERN.findall(term)]
+    return [form for form in forms if form]
@@ -0,0 +1,38 @@
+from io import BytesIO
+from flask import Request
+from config import Config
+
+
+class SizeLimitedStream(BytesIO):
+    """
+    In-memory buffer for one uploaded file
+
+    Data past max_size is counted but not stored, so an oversized upload
+    is detected while the request body is streamed in and never buffered
+    in full.
+    """
+
+    def __init__(self, max_size):
+        """
+        Args:
+            max_size (int): Maximum number of bytes to keep
+        """
+        super().__init__()
+        self.max_size = max_size
+        self.received = 0
+        self.exceeded = False
+
+    def write(self, data):
+        self.received += len(data)
+        if self.received > self.max_size:
+            self.exceeded = True
+            return len(data)
+        return super().write(data)
+
+
+class InMemoryUploadRequest(Request):
+    """Request that keeps uploaded files in memory instead of temp files"""
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None,
+                         content_length=None):
+        return SizeLimitedStream(Config.MAX_FILE_SIZE)
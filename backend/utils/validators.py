@@ -62,6 +62,39 @@ class Validators:
         except Exception as e:
             return False, f"Could not check file size: {str(e)}"
 
+    @staticmethod
+    def validate_upload_size(file, max_size=None):
+        """
+        Validate the size of an uploaded file without touching the filesystem
+
+        Args:
+            file: FileStorage object from Flask request
+            max_size: Maximum allowed size in bytes (optional)
+
+        Returns:
+            tuple: (is_valid, error_message)
+        """
+        if max_size is None:
+            max_size = Config.MAX_FILE_SIZE
+
+        stream = file.stream
+
+        # SizeLimitedStream already knows if the upload ran over while streaming
+        if getattr(stream, 'exceeded', False):
+            file_size = stream.received
+        else:
+            try:
+                position = stream.tell()
+                file_size = stream.seek(0, os.SEEK_END)
+                stream.seek(position)
+            except Exception as e:
+                return False, f"Could not check file size: {str(e)}"
+
+        if file_size > max_size:
+            max_mb = max_size / (1024 * 1024)
+            return False, f"File too large. Maximum size: {max_mb:.1f}MB"
+        return True, None
+
     @staticmethod
     def validate_text_input(text, min_length=10, max_length=50000, field_name="Input"):
         """
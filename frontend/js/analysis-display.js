@@ -22,6 +22,75 @@ function displayAnalysisResults(results) {
     displayStep4OptimizedResume(results.step4_optimized_resume);
 }
 
+function resetAnalysisResults() {
+    /**
+     * Clear previous results before a new analysis starts
+     */
+
+    currentAnalysisResults = null;
+
+    document.getElementById('match-score').textContent = '--';
+    document.getElementById('ats-score').textContent = '--';
+
+    ['job-analysis-content', 'gap-analysis-content', 'ats-scan-content', 'optimized-resume-content']
+        .forEach(id => {
+            document.getElementById(id).textContent = 'Generating...';
+        });
+}
+
+function displayStepResult(stepKey, data) {
+    /**
+     * Display a single step's result as soon as it arrives
+     *
+     * @param {string} stepKey - Result key, e.g. "step1_job_analysis"
+     * @param {object} data - The step's result
+     */
+
+    currentAnalysisResults = { ...(currentAnalysisResults || {}), [stepKey]: data };
+
+    const displayFunctions = {
+        step1_job_analysis: displayStep1JobAnalysis,
+        step2_gap_analysis: displayStep2GapAnalysis,
+        step3_ats_scan: displayStep3ATSScan,
+        step4_optimized_resume: displayStep4OptimizedResume
+    };
+
+    if (displayFunctions[stepKey]) {
+        displayFunctions[stepKey](data);
+    }
+
+    if (stepKey === 'step2_gap_analysis') {
+        document.getElementById('match-score').textContent = data.match_score || 0;
+    } else if (stepKey === 'step3_ats_scan') {
+        document.getElementById('ats-score').textContent = data.ats_score || 0;
+    }
+}
+
+function appendStepChunk(stepKey, text) {
+    /**
+     * Append generated text to a step that is still streaming
+     *
+     * @param {string} stepKey - Result key, e.g. "step4_optimized_resume"
+     * @param {string} text - Newly generated text
+     */
+
+    if (stepKey !== 'step4_optimized_resume') {
+        return;
+    }
+
+    const container = document.getElementById('optimized-resume-content');
+    let preview = container.querySelector('.resume-preview');
+
+    if (!preview) {
+        container.innerHTML = '';
+        preview = document.createElement('div');
+        preview.className = 'resume-preview';
+        container.appendChild(preview);
+    }
+
+    preview.textContent += text;
+}
+
 function displayExecutiveSummary(results) {
     // Display match score
     const matchScore = results.step2_gap_analysis?.match_score || 0;
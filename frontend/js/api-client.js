@@ -2,6 +2,31 @@
 
 const API_BASE_URL = 'http://localhost:5000/api';
 
+function buildAnalysisFormData(resumeFile, resumeText, jobDescription) {
+    /**
+     * Build the multipart form shared by the analysis endpoints
+     *
+     * @param {File|null} resumeFile - Resume file (if upload mode)
+     * @param {string|null} resumeText - Resume text (if paste mode)
+     * @param {string} jobDescription - Job description text
+     * @returns {FormData} - Form data for the request
+     */
+
+    const formData = new FormData();
+
+    // Add job description
+    formData.append('job_description', jobDescription);
+
+    // Add resume (either file or text)
+    if (resumeFile) {
+        formData.append('resume_file', resumeFile);
+    } else if (resumeText) {
+        formData.append('resume_text', resumeText);
+    }
+
+    return formData;
+}
+
 async function analyzeResume(resumeFile, resumeText, jobDescription) {
     /**
      * Call the /api/analyze endpoint
@@ -13,17 +38,7 @@ async function analyzeResume(resumeFile, resumeText, jobDescription) {
      */
 
     try {
-        const formData = new FormData();
-
-        // Add job description
-        formData.append('job_description', jobDescription);
-
-        // Add resume (either file or text)
-        if (resumeFile) {
-            formData.append('resume_file', resumeFile);
-        } else if (resumeText) {
-            formData.append('resume_text', resumeText);
-        }
+        const formData = buildAnalysisFormData(resumeFile, resumeText, jobDescription);
 
         // Make API request
         const response = await fetch(`${API_BASE_URL}/analyze`, {
@@ -50,6 +65,123 @@ async function analyzeResume(resumeFile, resumeText, jobDescription) {
     }
 }
 
+async function analyzeResumeStreaming(resumeFile, resumeText, jobDescription, onStepResult, onStepChunk) {
+    /**
+     * Queue an analysis with /api/analyze/async and follow its
+     * Server-Sent Events stream, reporting each step as it finishes
+     *
+     * @param {File|null} resumeFile - Resume file (if upload mode)
+     * @param {string|null} resumeText - Resume text (if paste mode)
+     * @param {string} jobDescription - Job description text
+     * @param {function} onStepResult - Called as onStepResult(stepKey, result)
+     * @param {function} onStepChunk - Called as onStepChunk(stepKey, text) while
+     *     the optimized resume is being generated (optional)
+     * @returns {Promise<object>} - Complete analysis results
+     */
+
+    try {
+        const formData = buildAnalysisFormData(resumeFile, resumeText, jobDescription);
+
+        // Queue the analysis
+        const response = await fetch(`${API_BASE_URL}/analyze/async`, {
+            method: 'POST',
+            body: formData
+        });
+
+        // Backends without the async API get the synchronous endpoint instead
+        if (response.status === 404 || response.status === 405) {
+            const error = new Error('Async analysis API unavailable');
+            error.asyncUnavailable = true;
+            throw error;
+        }
+
+        const data = await response.json();
+
+        if (!response.ok || !data.success) {
+            throw new Error(data.error || 'Analysis failed');
+        }
+
+        // Follow progress until the analysis completes or fails
+        return await new Promise((resolve, reject) => {
+            const reported = new Set();
+            const source = new EventSource(`${API_BASE_URL}/analysis/${data.analysis_id}/events`);
+
+            source.addEventListener('step', event => {
+                const payload = JSON.parse(event.data);
+                reported.add(payload.step);
+                onStepResult(payload.step, payload.result);
+            });
+
+            source.addEventListener('chunk', event => {
+                const payload = JSON.parse(event.data);
+                if (onStepChunk) {
+                    onStepChunk(payload.step, payload.text);
+                }
+            });
+
+            source.addEventListener('complete', event => {
+                source.close();
+                resolve(JSON.parse(event.data).results);
+            });
+
+            source.addEventListener('failed', event => {
+                source.close();
+                reject(new Error(JSON.parse(event.data).error || 'Analysis failed'));
+            });
+
+            // EventSource reconnects by itself; once it stops trying, poll
+            // the status endpoint for the rest of the analysis
+            source.addEventListener('error', () => {
+                if (source.readyState === EventSource.CLOSED) {
+                    pollAnalysis(data.analysis_id, onStepResult, reported).then(resolve, reject);
+                }
+            });
+        });
+
+    } catch (error) {
+        console.error('API Error:', error);
+        throw error;
+    }
+}
+
+async function pollAnalysis(analysisId, onStepResult, reported, interval = 2000) {
+    /**
+     * Poll /api/analysis/<id> until a queued analysis finishes
+     *
+     * @param {string} analysisId - Analysis identifier
+     * @param {function} onStepResult - Called as onStepResult(stepKey, result)
+     *     for each step not reported yet
+     * @param {Set} reported - Step keys already reported
+     * @param {number} interval - Milliseconds between polls
+     * @returns {Promise<object>} - Complete analysis results
+     */
+
+    while (true) {
+        const response = await fetch(`${API_BASE_URL}/analysis/${analysisId}`);
+        const data = await response.json();
+
+        if (!response.ok) {
+            throw new Error(data.error || 'Analysis failed');
+        }
+
+        for (const [stepKey, result] of Object.entries(data.results)) {
+            if (!reported.has(stepKey)) {
+                reported.add(stepKey);
+                onStepResult(stepKey, result);
+            }
+        }
+
+        if (data.status === 'completed') {
+            return data.results;
+        }
+        if (data.status === 'failed') {
+            throw new Error(data.error || 'Analysis failed');
+        }
+
+        await new Promise(resolve => setTimeout(resolve, interval));
+    }
+}
+
 async function generateDocx(optimizedResumeText, candidateName = 'Resume') {
     /**
      * Call the /api/generate-docx endpoint
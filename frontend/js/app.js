@@ -83,8 +83,25 @@ async function handleAnalyze() {
     disableAnalyzeButton(true);
 
     try {
-        // Call API
-        const results = await analyzeResume(resumeFile, resumeText, jobDescription);
+        resetAnalysisResults();
+
+        // Call API, rendering each step as soon as it finishes
+        let results;
+        try {
+            results = await analyzeResumeStreaming(
+                resumeFile, resumeText, jobDescription,
+                (stepKey, data) => {
+                    displayStepResult(stepKey, data);
+                    showElement('results-section');
+                },
+                appendStepChunk
+            );
+        } catch (error) {
+            if (!error.asyncUnavailable) {
+                throw error;
+            }
+            results = await analyzeResume(resumeFile, resumeText, jobDescription);
+        }
 
         // Hide loading
         hideElement('loading');